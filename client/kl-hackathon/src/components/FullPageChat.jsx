@@ -1,6 +1,6 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { useOutletContext } from 'react-router-dom';
-import { sendChatMessage } from '../functions/chat.js';
+import { streamChatMessage } from '../functions/chat.js';
 import { Send, User, Bot, Plus } from 'lucide-react';
 import './FullPageChat.css';
 
@@ -15,6 +15,7 @@ const FullPageChat = () => {
     } = context || {};
 
     const [isLoading, setIsLoading] = useState(false);
+    const [isStreaming, setIsStreaming] = useState(false);
     const messagesEndRef = useRef(null);
     const textareaRef = useRef(null);
 
@@ -71,17 +72,39 @@ const FullPageChat = () => {
                 return;
             }
 
-            const response = await sendChatMessage(token, userMessage.content);
-            
-            // Format AI response
-            let aiContent = response.response;
-            
-            setMessages(prev => [...prev, { role: 'ai', content: aiContent }]);
+            // Show the reply as it is generated; text written before a tool call is replaced
+            // by the answer that follows it, and 'done' replaces it with the final text
+            let streamed = false;
+            let replaceNext = false;
+            const showReply = (content, append) => {
+                if (!streamed) {
+                    streamed = true;
+                    setIsStreaming(true);
+                    setMessages(prev => [...prev, { role: 'ai', content }]);
+                    return;
+                }
+                setMessages(prev => {
+                    const last = prev[prev.length - 1];
+                    return [...prev.slice(0, -1), { ...last, content: append ? last.content + content : content }];
+                });
+            };
+
+            await streamChatMessage(token, userMessage.content, (event, data) => {
+                if (event === 'token') {
+                    showReply(data.text, !replaceNext);
+                    replaceNext = false;
+                } else if (event === 'tool_start') {
+                    replaceNext = true;
+                } else if (event === 'done' || event === 'error') {
+                    showReply(data.response, false);
+                }
+            });
 
         } catch (error) {
             setMessages(prev => [...prev, { role: 'ai', content: `Error: ${error.message}` }]);
         } finally {
             setIsLoading(false);
+            setIsStreaming(false);
         }
     };
 
@@ -110,7 +133,7 @@ const FullPageChat = () => {
                             </div>
                         </div>
                     ))}
-                    {isLoading && (
+                    {isLoading && !isStreaming && (
                         <div className="message-wrapper ai">
                             <div className="message-content-container">
                                 <div className="avatar"><Bot size={24} /></div>
@@ -1,4 +1,5 @@
 import { API_BASE_URL as BASE_URL } from '../config';
+import { waitForJob } from './jobs';
 
 const API_URL = `${BASE_URL}/clubs`;
 
@@ -44,6 +45,26 @@ export const getClub = async (clubId, token = null) => {
     }
 };
 
+// One page of a club's roster; pass the previous page's nextCursor to continue
+export const getClubMembers = async (clubId, cursor = null) => {
+    try {
+        const params = new URLSearchParams();
+        if (cursor) params.set('cursor', cursor);
+
+        const response = await fetch(`${API_URL}/${clubId}/members?${params}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+        });
+        if (!response.ok) throw new Error('Failed to fetch club members');
+        return { items: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+    } catch (error) {
+        console.error(error);
+        throw error;
+    }
+};
+
 export const getManagedClubs = async (token) => {
     try {
         const response = await fetch(`${API_URL}/managed`, {
@@ -236,7 +257,7 @@ export const getClubRequestRepos = async (token, requestId) => {
     }
 };
 
-export const evaluateClubRequest = async (token, requestId, criteria) => {
+export const evaluateClubRequest = async (token, requestId, criteria, forceRefresh = false) => {
     try {
         const response = await fetch(`${API_URL}/requests/${requestId}/evaluate`, {
             method: 'POST',
@@ -244,13 +265,18 @@ export const evaluateClubRequest = async (token, requestId, criteria) => {
                 'Content-Type': 'application/json',
                 'Authorization': `Bearer ${token}`
             },
-            body: JSON.stringify({ criteria })
+            body: JSON.stringify({ criteria, force_refresh: forceRefresh, async: true })
         });
         if (!response.ok) {
             const err = await response.json();
             throw new Error(err.error || 'Failed to evaluate profile');
         }
-        return await response.json();
+        const data = await response.json();
+        // 202: the evaluation was queued as a background job
+        if (response.status === 202) {
+            return await waitForJob(token, data.job.id);
+        }
+        return data;
     } catch (error) {
         console.error(error);
         throw error;
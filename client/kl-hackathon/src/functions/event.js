@@ -23,6 +23,26 @@ export const getEvents = async (token = null) => {
     }
 };
 
+// One page of a club's events in start date order; pass the previous page's nextCursor to continue
+export const getClubEvents = async (clubId, cursor = null) => {
+    try {
+        const params = new URLSearchParams({ club_id: clubId });
+        if (cursor) params.set('cursor', cursor);
+
+        const response = await fetch(`${API_URL}?${params}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+        });
+        if (!response.ok) throw new Error('Failed to fetch club events');
+        return { items: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+    } catch (error) {
+        console.error(error);
+        throw error;
+    }
+};
+
 export const getEvent = async (eventId, token = null) => {
     try {
         const headers = {
@@ -0,0 +1,29 @@
+import { API_BASE_URL } from '../config';
+
+const API_URL = `${API_BASE_URL}/jobs`;
+
+export const getJob = async (token, jobId) => {
+    const response = await fetch(`${API_URL}/${jobId}`, {
+        headers: { 'Authorization': `Bearer ${token}` }
+    });
+    const data = await response.json();
+    if (!response.ok) {
+        throw new Error(data.error || 'Failed to fetch job');
+    }
+    return data;
+};
+
+/**
+ * Poll a background job until it finishes.
+ * @returns {Promise<Object>} The job's result
+ */
+export const waitForJob = async (token, jobId, { interval = 1500, timeout = 5 * 60 * 1000 } = {}) => {
+    const deadline = Date.now() + timeout;
+    while (Date.now() < deadline) {
+        const job = await getJob(token, jobId);
+        if (job.status === 'succeeded') return job.result;
+        if (job.status === 'failed') throw new Error(job.error || 'Job failed');
+        await new Promise(resolve => setTimeout(resolve, interval));
+    }
+    throw new Error('Timed out waiting for job');
+};
@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import { getClub, requestJoinClub, getMyRequests } from '../functions/club';
+import { getClub, getClubMembers, requestJoinClub, getMyRequests } from '../functions/club';
+import { getClubEvents } from '../functions/event';
 import { getUserProfile } from '../functions/user';
 import { Users, CheckCircle, Clock, PlusCircle, ArrowLeft, Edit, Calendar, MapPin, ExternalLink } from 'lucide-react';
 import './Dashboard.css';
@@ -17,6 +18,7 @@ const ClubDetails = () => {
     const [selectedRole, setSelectedRole] = useState('');
     const [message, setMessage] = useState('');
     const [showJoinForm, setShowJoinForm] = useState(false);
+    const [loadingMore, setLoadingMore] = useState('');
 
     useEffect(() => {
         const fetchClub = async () => {
@@ -73,6 +75,30 @@ const ClubDetails = () => {
         }
     };
 
+    // Appends the next page of members or events to the club fetched above
+    const loadMore = async (kind) => {
+        const isMembers = kind === 'members';
+        const listKey = isMembers ? 'members_details' : 'events';
+        const cursorKey = isMembers ? 'members_next_cursor' : 'events_next_cursor';
+
+        setLoadingMore(kind);
+        try {
+            const page = isMembers
+                ? await getClubMembers(club.id, club[cursorKey])
+                : await getClubEvents(club.id, club[cursorKey]);
+            setClub(prev => ({
+                ...prev,
+                [listKey]: [...prev[listKey], ...page.items],
+                [cursorKey]: page.nextCursor
+            }));
+        } catch (err) {
+            setError(err.message || `Failed to load more ${kind}`);
+            setTimeout(() => setError(''), 3000);
+        } finally {
+            setLoadingMore('');
+        }
+    };
+
     const getClubStatus = () => {
         if (!user || !club) return 'guest';
         
@@ -80,7 +106,7 @@ const ClubDetails = () => {
         if (club.owner_id === user.id) return 'owner';
         
         // Check if member
-        const isMember = club.members?.some(m => m.user_id === user.id);
+        const isMember = club.is_member ?? club.members?.some(m => m.user_id === user.id);
         if (isMember) return 'member';
         
         // Check if requested
@@ -384,6 +410,17 @@ const ClubDetails = () => {
                                         </div>
                                     ))}
                                 </div>
+                                {club.events_next_cursor && (
+                                    <div style={{ display: 'flex', justifyContent: 'center', marginTop: '1.5rem' }}>
+                                        <button
+                                            onClick={() => loadMore('events')}
+                                            className="btn-secondary"
+                                            disabled={loadingMore === 'events'}
+                                        >
+                                            {loadingMore === 'events' ? 'Loading...' : 'Load more events'}
+                                        </button>
+                                    </div>
+                                )}
                             </div>
                         )}
 
@@ -391,7 +428,7 @@ const ClubDetails = () => {
                         {club.members_details && club.members_details.length > 0 && (
                             <div style={{ marginTop: '3rem', borderTop: '1px solid #e2e8f0', paddingTop: '2rem' }}>
                                 <h2 style={{ fontSize: '1.5rem', marginBottom: '1.5rem', color: 'var(--primary)' }}>
-                                    Club Members <span style={{ fontSize: '1rem', color: 'var(--text-muted)', fontWeight: 'normal' }}>({club.members_details.length})</span>
+                                    Club Members <span style={{ fontSize: '1rem', color: 'var(--text-muted)', fontWeight: 'normal' }}>({club.member_count ?? club.members_details.length})</span>
                                 </h2>
                                 <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fill, minmax(250px, 1fr))', gap: '1rem' }}>
                                     {club.members_details.map((member, index) => (
@@ -444,6 +481,17 @@ const ClubDetails = () => {
                                         </div>
                                     ))}
                                 </div>
+                                {club.members_next_cursor && (
+                                    <div style={{ display: 'flex', justifyContent: 'center', marginTop: '1.5rem' }}>
+                                        <button
+                                            onClick={() => loadMore('members')}
+                                            className="btn-secondary"
+                                            disabled={loadingMore === 'members'}
+                                        >
+                                            {loadingMore === 'members' ? 'Loading...' : 'Load more members'}
+                                        </button>
+                                    </div>
+                                )}
                             </div>
                         )}
                     </div>
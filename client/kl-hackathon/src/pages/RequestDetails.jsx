@@ -107,12 +107,12 @@ const RequestDetails = () => {
         }
     };
 
-    const handleEvaluate = async () => {
+    const handleEvaluate = async (forceRefresh = false) => {
         if (!evaluationCriteria.trim()) return;
         setEvaluating(true);
         try {
             const token = localStorage.getItem('token');
-            const result = await evaluateClubRequest(token, id, evaluationCriteria);
+            const result = await evaluateClubRequest(token, id, evaluationCriteria, forceRefresh);
             setEvaluationResult(result);
         } catch (err) {
             console.error("Evaluation failed", err);
@@ -416,7 +416,7 @@ const RequestDetails = () => {
                                         style={{ flex: 1, padding: '0.75rem', borderRadius: '6px', border: '1px solid #cbd5e1', fontSize: '1rem' }}
                                     />
                                     <button 
-                                        onClick={handleEvaluate}
+                                        onClick={() => handleEvaluate()}
                                         disabled={evaluating || !evaluationCriteria.trim()}
                                         style={{
                                             backgroundColor: '#8b5cf6',
@@ -451,6 +451,19 @@ const RequestDetails = () => {
                                         </div>
                                     </div>
                                     
+                                    {evaluationResult.cached && (
+                                        <div style={{ display: 'flex', alignItems: 'center', justifyContent: 'space-between', marginBottom: '1rem', fontSize: '0.85rem', color: '#64748b' }}>
+                                            <span>Saved evaluation from {new Date(evaluationResult.evaluated_at).toLocaleString()}</span>
+                                            <button
+                                                onClick={() => handleEvaluate(true)}
+                                                disabled={evaluating}
+                                                style={{ background: 'none', border: 'none', color: 'var(--primary)', cursor: evaluating ? 'not-allowed' : 'pointer', fontWeight: '600' }}
+                                            >
+                                                Re-evaluate
+                                            </button>
+                                        </div>
+                                    )}
+
                                     <div style={{ marginBottom: '1rem' }}>
                                         <strong style={{ color: 'var(--text-main)' }}>Summary:</strong>
                                         <p style={{ marginTop: '0.5rem', color: '#475569', lineHeight: '1.5' }}>{evaluationResult.summary}</p>
@@ -1,6 +1,9 @@
 from flask import Flask
 from app.config import config
 from app.extensions import db, cors, jwt, migrate
+from app.utils.query_stats import init_query_stats
+from app.utils.llm_metrics import init_llm_metrics
+from app.utils.llm_admission import init_llm_admission
 
 def create_app(config_name='default'):
     app = Flask(__name__)
@@ -10,9 +13,12 @@ def create_app(config_name='default'):
     
     # Initialize extensions
     db.init_app(app)
-    cors.init_app(app, resources={r"/api/*": {"origins": ["http://localhost:5173", "http://127.0.0.1:5173"]}}, supports_credentials=True)
+    cors.init_app(app, resources={r"/api/*": {"origins": ["http://localhost:5173", "http://127.0.0.1:5173"]}}, supports_credentials=True, expose_headers=["X-Next-Cursor", "X-DB-Query-Count", "X-DB-Query-Time-Ms", "X-DB-Repeated-Queries"])
     jwt.init_app(app)
     migrate.init_app(app, db, compare_type=True)
+    init_query_stats(app)
+    init_llm_metrics(app)
+    init_llm_admission(app)
    
     # Import models to ensure they are registered with SQLAlchemy
     from app.models.user import User
@@ -20,6 +26,12 @@ def create_app(config_name='default'):
     from app.models.event import Event
     from app.models.announcement import Announcement
     from app.models.oauth import OAuth
+    from app.models.club_membership import ClubMembership
+    from app.models.chat_checkpoint import ChatThread, ChatCheckpoint, ChatCheckpointWrite
+    from app.models.readme_cache import ReadmeCache
+    from app.models.candidate_evaluation import CandidateEvaluation
+    from app.models.evaluation_batch import EvaluationBatch, EvaluationBatchItem
+    from app.models.job import Job
     
     # Created Routes
     from app.routes.main import main_bp
@@ -31,6 +43,7 @@ def create_app(config_name='default'):
     from app.routes.upload import upload_bp
     from app.routes.oauth import oauth_bp
     from app.routes.chat import chat_bp
+    from app.routes.job import job_bp
     
     app.register_blueprint(main_bp)
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
@@ -41,6 +54,14 @@ def create_app(config_name='default'):
     app.register_blueprint(upload_bp, url_prefix='/api/upload')
     app.register_blueprint(oauth_bp, url_prefix='/api/oauth')
     app.register_blueprint(chat_bp, url_prefix='/api/chat')
+    app.register_blueprint(job_bp, url_prefix='/api/jobs')
+
+    # Background jobs: in-process pool started by the first request, and `flask worker`
+    from app.worker import init_worker
+    init_worker(app)
+
+    from app.services.ai_service import checkpointer
+    checkpointer.init_app(app)
 
     # Create tables for development
     with app.app_context():
@@ -48,5 +69,8 @@ def create_app(config_name='default'):
         from app.models.club import Club
         from app.models.club_request import ClubRequest
         db.create_all()
+
+        from app.services.suggest_service import SuggestService
+        SuggestService.rebuild()
     
     return app
@@ -14,6 +14,76 @@ class Config:
         "pool_recycle": 300,
     }
 
+    # Per-request SQL stats (X-DB-* headers are only added in debug mode)
+    QUERY_STATS_ENABLED = True
+    QUERY_REPEAT_THRESHOLD = 5
+
+    # Seconds before /search/suggest reloads its in-memory index to pick up other workers' writes (0 = never)
+    SUGGEST_INDEX_TTL = int(os.environ.get('SUGGEST_INDEX_TTL', 300))
+
+    # Chat history checkpoints (see app/utils/checkpointer.py)
+    CHAT_MAX_CHECKPOINTS_PER_THREAD = int(os.environ.get('CHAT_MAX_CHECKPOINTS_PER_THREAD', 10))
+    CHAT_THREAD_TTL = int(os.environ.get('CHAT_THREAD_TTL', 7 * 24 * 3600))  # seconds, 0 = never expire
+    CHAT_MAX_THREADS = int(os.environ.get('CHAT_MAX_THREADS', 10000))  # 0 = unlimited
+
+    # Prompt window for chat: recent turns verbatim, older ones folded into a running summary
+    CHAT_HISTORY_TOKEN_BUDGET = int(os.environ.get('CHAT_HISTORY_TOKEN_BUDGET', 6000))
+    CHAT_HISTORY_KEEP_TURNS = int(os.environ.get('CHAT_HISTORY_KEEP_TURNS', 6))
+    CHAT_SUMMARY_BATCH_TURNS = int(os.environ.get('CHAT_SUMMARY_BATCH_TURNS', 4))
+    # Answer simple lookups ("list clubs", "upcoming events") without the model
+    CHAT_FAST_PATH_ENABLED = os.environ.get('CHAT_FAST_PATH_ENABLED', 'true').lower() == 'true'
+
+    # Model calls (see app/utils/llm_metrics.py): retries of transient errors, and the prices
+    # used to estimate cost per call site (USD per million tokens, gemini-2.5-flash list price)
+    LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 3))
+    LLM_RETRY_BACKOFF = float(os.environ.get('LLM_RETRY_BACKOFF', 1.0))  # seconds, doubled per retry
+    LLM_INPUT_PRICE_PER_MTOK = float(os.environ.get('LLM_INPUT_PRICE_PER_MTOK', 0.30))
+    LLM_OUTPUT_PRICE_PER_MTOK = float(os.environ.get('LLM_OUTPUT_PRICE_PER_MTOK', 2.50))
+    # Comma-separated emails allowed to read GET /metrics. is_admin is not enough: every club
+    # leader has it. Empty = nobody.
+    METRICS_ADMIN_EMAILS = [
+        e.strip().lower() for e in os.environ.get('METRICS_ADMIN_EMAILS', '').split(',') if e.strip()
+    ]
+    # Admission of requests that call the model, per process (see app/utils/llm_admission.py):
+    # at most LLM_MAX_CONCURRENT_REQUESTS run, LLM_ADMISSION_QUEUE_SIZE more wait up to
+    # LLM_ADMISSION_QUEUE_TIMEOUT seconds, the rest get 429 with Retry-After. Queued and batch
+    # evaluations share these slots and the per-user cap but wait without a limit
+    LLM_MAX_CONCURRENT_REQUESTS = int(os.environ.get('LLM_MAX_CONCURRENT_REQUESTS', 8))
+    LLM_ADMISSION_QUEUE_SIZE = int(os.environ.get('LLM_ADMISSION_QUEUE_SIZE', 16))
+    LLM_ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('LLM_ADMISSION_QUEUE_TIMEOUT', 5))
+    LLM_MAX_REQUESTS_PER_USER = int(os.environ.get('LLM_MAX_REQUESTS_PER_USER', 2))  # running or waiting
+    # 'gemini', or 'fake' for the offline stand-in model (app/utils/fake_llm.py) used in load tests
+    LLM_PROVIDER = os.environ.get('LLM_PROVIDER', 'gemini')
+    FAKE_LLM_PROFILE = os.environ.get('FAKE_LLM_PROFILE', 'fast')  # instant, fast, gemini-flash, slow
+    FAKE_LLM_SCRIPT = os.environ.get('FAKE_LLM_SCRIPT')  # JSON file of scripted replies
+    FAKE_LLM_TTFT = float(os.environ['FAKE_LLM_TTFT']) if os.environ.get('FAKE_LLM_TTFT') else None  # seconds, overrides the profile
+    FAKE_LLM_TOKENS_PER_SECOND = float(os.environ['FAKE_LLM_TOKENS_PER_SECOND']) if os.environ.get('FAKE_LLM_TOKENS_PER_SECOND') else None
+    FAKE_LLM_JITTER = float(os.environ.get('FAKE_LLM_JITTER', 0.2))  # +/- fraction of each delay
+    FAKE_LLM_ERROR_RATE = float(os.environ.get('FAKE_LLM_ERROR_RATE', 0))  # share of calls failing with a rate limit error
+
+    # Profile evaluation: READMEs (and their summaries) are fetched concurrently, then the
+    # evaluation goes ahead with whatever arrived before the deadline
+    README_TARGET_COUNT = int(os.environ.get('README_TARGET_COUNT', 5))
+    README_FETCH_WORKERS = int(os.environ.get('README_FETCH_WORKERS', 5))
+    README_FETCH_DEADLINE = float(os.environ.get('README_FETCH_DEADLINE', 20))  # seconds
+    # Cached READMEs younger than this are used without asking GitHub; older ones are revalidated by ETag
+    README_CACHE_FRESH_SECONDS = int(os.environ.get('README_CACHE_FRESH_SECONDS', 600))
+    README_CACHE_MAX_SIZE = int(os.environ.get('README_CACHE_MAX_SIZE', 20_000_000))  # characters, 0 = unlimited
+
+    # Evaluations running at once per batch (POST /api/clubs/<id>/evaluations)
+    EVALUATION_BATCH_CONCURRENCY = int(os.environ.get('EVALUATION_BATCH_CONCURRENCY', 4))
+
+    # Background jobs (see app/worker.py). Web processes run JOB_WORKERS_IN_PROCESS job threads
+    # (0 = none, run `flask worker` instead); `flask worker` runs JOB_WORKER_CONCURRENCY.
+    JOB_WORKERS_IN_PROCESS = int(os.environ.get('JOB_WORKERS_IN_PROCESS', 2))
+    JOB_WORKER_CONCURRENCY = int(os.environ.get('JOB_WORKER_CONCURRENCY', 4))
+    JOB_POLL_INTERVAL = float(os.environ.get('JOB_POLL_INTERVAL', 1.0))  # seconds
+    JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))
+    JOB_RETRY_BACKOFF = int(os.environ.get('JOB_RETRY_BACKOFF', 5))  # seconds, doubled on each retry
+    JOB_LOCK_TIMEOUT = int(os.environ.get('JOB_LOCK_TIMEOUT', 300))  # seconds without heartbeat before a job is re-queued
+    # Where queued uploads wait for a worker (must be shared with `flask worker` processes)
+    UPLOAD_TMP_DIR = os.environ.get('UPLOAD_TMP_DIR')
+
     # Cloudinary Config
     CLOUDINARY_CLOUD_NAME = os.environ.get('CLOUDINARY_CLOUD_NAME')
     CLOUDINARY_API_KEY = os.environ.get('CLOUDINARY_API_KEY')
@@ -43,6 +113,8 @@ class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or 'sqlite:///:memory:'
+    # Tests run jobs explicitly with JobWorker.run_once()
+    JOB_WORKERS_IN_PROCESS = 0
 
 config = {
     'development': DevelopmentConfig,
@@ -1,6 +1,7 @@
 from flask import request, jsonify
 from flask_jwt_extended import get_jwt_identity
 from app.services.announcement_service import AnnouncementService
+from app.serializers import AnnouncementSerializer
 
 def create_announcement():
     current_user_id = get_jwt_identity()
@@ -19,11 +20,11 @@ def create_announcement():
 
 def get_event_announcements(event_id):
     announcements = AnnouncementService.get_announcements_by_event(event_id)
-    return jsonify([a.to_dict() for a in announcements]), 200
+    return jsonify(AnnouncementSerializer.dump_many(announcements)), 200
 
 def get_all_announcements():
     announcements = AnnouncementService.get_all_announcements()
-    return jsonify([a.to_dict() for a in announcements]), 200
+    return jsonify(AnnouncementSerializer.dump_many(announcements)), 200
 
 def update_announcement(announcement_id):
     current_user_id = get_jwt_identity()
@@ -1,7 +1,9 @@
-from flask import jsonify, request
+import json
+from flask import Response, jsonify, request, stream_with_context
 from app.services.ai_service import AIService
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models.user import User
+from app.utils.llm_admission import llm_admission, AdmissionRejected, rejected_response
 
 def chat():
     current_user_id = get_jwt_identity()
@@ -14,8 +16,51 @@ def chat():
         return jsonify({'error': 'Message is required'}), 400
 
     user_input = data['message']
-    
-    # Process chat with AI Service
-    result = AIService.process_chat(user_input, current_user_id)
+
+    if not AIService.needs_model(user_input):
+        return jsonify(AIService.process_chat(user_input, current_user_id)), 200
+
+    # Model work holds an admission slot, so a burst of chats cannot take every worker
+    try:
+        slot = llm_admission.acquire(current_user_id)
+    except AdmissionRejected as e:
+        return rejected_response(e)
+    with slot:
+        result = AIService.process_chat(user_input, current_user_id)
     
     return jsonify(result), 200
+
+def chat_stream():
+    """Same input as chat(), answered as Server-Sent Events while the agent runs."""
+    current_user_id = get_jwt_identity()
+    user = User.query.get(current_user_id)
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    data = request.get_json()
+    if not data or 'message' not in data:
+        return jsonify({'error': 'Message is required'}), 400
+
+    user_input = data['message']
+
+    # Admission is decided before the stream starts, so a busy server can still answer 429
+    slot = None
+    if AIService.needs_model(user_input):
+        try:
+            slot = llm_admission.acquire(current_user_id)
+        except AdmissionRejected as e:
+            return rejected_response(e)
+
+    def generate():
+        for event, payload in AIService.stream_chat(user_input, current_user_id):
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    if slot:
+        # Released when the stream ends or the client disconnects
+        response.call_on_close(slot.release)
+    return response
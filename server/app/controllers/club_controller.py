@@ -1,23 +1,55 @@
 from flask import request, jsonify
 from flask_jwt_extended import get_jwt_identity
 from app.services.club_service import ClubService
-from app.services.ai_service import AIService
+from app.services.evaluation_service import EvaluationService
+from app.services.evaluation_batch_service import EvaluationBatchService
+from app.services.job_service import JobService
+from app.serializers import ClubSerializer, ClubRequestSerializer
+from app.models.club_request import REQUEST_STATUSES
+from app.utils.auth_utils import optional_identity
+from app.utils.llm_admission import llm_admission, AdmissionRejected, rejected_response
+from app.utils.pagination import encode_cursor, decode_cursor, decode_date_cursor, decode_rank_cursor, parse_limit, parse_datetime, MAX_PAGE_SIZE
+
+MAX_BULK_DECISIONS = 500
 
 def get_all_clubs():
     clubs = ClubService.get_all_clubs()
-    return jsonify([c.to_dict() for c in clubs]), 200
+    return jsonify(ClubSerializer.dump_many(clubs)), 200
 
 def get_managed_clubs():
     current_user_id = get_jwt_identity()
     clubs = ClubService.get_clubs_by_owner(current_user_id)
-    return jsonify([c.to_dict() for c in clubs]), 200
+    return jsonify(ClubSerializer.dump_many(clubs)), 200
 
 def get_club(club_id):
-    club_details = ClubService.get_club_with_details(club_id)
+    # Public page: a missing or invalid token just means an anonymous viewer
+    club_details = ClubService.get_club_with_details(club_id, viewer_id=optional_identity())
     if not club_details:
         return jsonify({'error': 'Club not found'}), 404
     return jsonify(club_details), 200
 
+def get_club_members(club_id):
+    if not ClubService.get_club_by_id(club_id):
+        return jsonify({'error': 'Club not found'}), 404
+
+    limit = parse_limit(request.args.get('limit'))
+    if not limit:
+        return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+
+    after_id = None
+    if request.args.get('cursor'):
+        values = decode_cursor(request.args['cursor'])
+        if not values or len(values) != 1 or not isinstance(values[0], int):
+            return jsonify({'error': 'Invalid cursor'}), 400
+        after_id = values[0]
+
+    members, next_id = ClubService.get_member_roster(club_id, after_id, limit, request.args.get('role'))
+
+    response = jsonify(members)
+    if next_id:
+        response.headers['X-Next-Cursor'] = encode_cursor(next_id)
+    return response, 200
+
 def create_club():
     current_user_id = get_jwt_identity()
     data = request.get_json()
@@ -75,15 +107,59 @@ def request_join(club_id):
     return jsonify(req.to_dict()), 201
 
 def get_requests(club_id):
+    """
+    Join requests for a club, oldest first. Supports ?status=, ?from=, ?to= (on created_at)
+    and keyset pagination via ?limit= and ?cursor= (next cursor in X-Next-Cursor).
+    """
     current_user_id = get_jwt_identity()
+    args = request.args
+    filters = {}
+
+    if args.get('status'):
+        if args['status'] not in REQUEST_STATUSES:
+            return jsonify({'error': f"status must be one of: {', '.join(REQUEST_STATUSES)}"}), 400
+        filters['status'] = args['status']
+
+    for arg, key in (('from', 'date_from'), ('to', 'date_to')):
+        if args.get(arg):
+            value = parse_datetime(args[arg])
+            if not value:
+                return jsonify({'error': f"Invalid '{arg}' date. Use ISO 8601 format."}), 400
+            filters[key] = value
+
+    limit = None
+    if 'limit' in args or 'cursor' in args:
+        limit = parse_limit(args.get('limit'))
+        if not limit:
+            return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+
+    after = None
+    if args.get('cursor'):
+        after = decode_date_cursor(args['cursor'])
+        if not after:
+            return jsonify({'error': 'Invalid cursor'}), 400
     
     # Check if user is owner of the club
-    requests, error = ClubService.get_club_requests(club_id, current_user_id)
+    page, error = ClubService.get_club_requests(club_id, current_user_id, filters, after, limit)
     
     if error:
         return jsonify({'error': error}), 403
-        
-    return jsonify([r.to_dict() for r in requests]), 200
+
+    requests, next_key = page
+    response = jsonify(ClubRequestSerializer.dump_many(requests))
+    if next_key:
+        response.headers['X-Next-Cursor'] = encode_cursor(*next_key)
+    return response, 200
+
+def get_request_counts(club_id):
+    current_user_id = get_jwt_identity()
+    counts, error = ClubService.get_request_status_counts(club_id, current_user_id)
+
+    if error:
+        status_code = 403 if "Unauthorized" in error else 404
+        return jsonify({'error': error}), status_code
+
+    return jsonify(counts), 200
 
 def get_request_details(request_id):
     current_user_id = get_jwt_identity()
@@ -93,12 +169,8 @@ def get_request_details(request_id):
         status_code = 403 if "Unauthorized" in error else 404
         return jsonify({'error': error}), status_code
     
-    # Construct detailed response
-    user = req.user
-    response = req.to_dict()
-    response['user_details'] = user.to_dict() # This includes oauth_accounts
-    
-    return jsonify(response), 200
+    # Detailed response includes the applicant's profile and oauth_accounts
+    return jsonify(ClubRequestSerializer.dump_detail(req)), 200
 
 def handle_request(request_id):
     current_user_id = get_jwt_identity()
@@ -116,14 +188,45 @@ def handle_request(request_id):
     req, error = ClubService.handle_request(request_id, status, admin_response, current_user_id)
     
     if error:
-        return jsonify({'error': error}), 400
+        return jsonify({'error': error}), 409 if "already" in error else 400
         
     return jsonify(req.to_dict()), 200
 
+def bulk_handle_requests(club_id):
+    current_user_id = get_jwt_identity()
+    data = request.get_json()
+
+    if not data:
+        return jsonify({'error': 'No input data provided'}), 400
+
+    decisions = data.get('decisions')
+    if not isinstance(decisions, list) or not decisions:
+        return jsonify({'error': 'decisions must be a non-empty list'}), 400
+    if len(decisions) > MAX_BULK_DECISIONS:
+        return jsonify({'error': f'At most {MAX_BULK_DECISIONS} decisions per call'}), 400
+    if not all(isinstance(d, dict) for d in decisions):
+        return jsonify({'error': 'Each decision must be an object with id and status'}), 400
+
+    results, error = ClubService.bulk_handle_requests(club_id, decisions, current_user_id)
+
+    if error:
+        if "Unauthorized" in error:
+            status_code = 403
+        elif error == "Club not found":
+            status_code = 404
+        else:
+            status_code = 400
+        return jsonify({'error': error}), status_code
+
+    return jsonify({
+        'results': results,
+        'updated': sum(1 for r in results if r['success'])
+    }), 200
+
 def get_my_requests():
     current_user_id = get_jwt_identity()
     requests = ClubService.get_user_requests(current_user_id)
-    return jsonify([r.to_dict() for r in requests]), 200
+    return jsonify(ClubRequestSerializer.dump_many(requests)), 200
 
 def get_request_github_repos(request_id):
     current_user_id = get_jwt_identity()
@@ -139,6 +242,7 @@ def evaluate_request_candidate(request_id):
     current_user_id = get_jwt_identity()
     data = request.get_json()
     criteria = data.get('criteria')
+    force_refresh = bool(data.get('force_refresh'))
     
     if not criteria:
         return jsonify({'error': 'Criteria is required'}), 400
@@ -151,10 +255,97 @@ def evaluate_request_candidate(request_id):
         status_code = 403 if "Unauthorized" in error else 404
         return jsonify({'error': error}), status_code
     
-    # Evaluate the user who made the request
-    result, ai_error = AIService.evaluate_profile(req.user_id, criteria)
+    # Repeat evaluations come from the stored result
+    cached = None if force_refresh else EvaluationService.get_cached(req.user_id, criteria)
+    if cached:
+        return jsonify(cached.to_dict()), 200
+
+    # "async": true queues the evaluation (poll /api/jobs/<id>)
+    if data.get('async'):
+        job = JobService.enqueue('evaluate_candidate', {
+            'user_id': req.user_id,
+            'criteria': criteria,
+            'force_refresh': force_refresh,
+            'requested_by': current_user_id
+        }, user_id=current_user_id)
+        return jsonify({'job': job.to_dict()}), 202
+
+    # Evaluate the user who made the request, holding one of the model slots meanwhile
+    try:
+        slot = llm_admission.acquire(current_user_id)
+    except AdmissionRejected as e:
+        return rejected_response(e)
+    with slot:
+        result, ai_error = EvaluationService.evaluate(req.user_id, criteria, force_refresh=force_refresh)
     
     if ai_error:
         return jsonify({'error': ai_error}), 500
         
     return jsonify(result), 200
+
+def _batch_error(error):
+    if "Unauthorized" in error:
+        return jsonify({'error': error}), 403
+    if "not found" in error:
+        return jsonify({'error': error}), 404
+    if "already" in error:
+        return jsonify({'error': error}), 409
+    return jsonify({'error': error}), 400
+
+def create_evaluation_batch(club_id):
+    """Starts evaluating every pending applicant of the club; poll the returned batch for progress."""
+    current_user_id = get_jwt_identity()
+    data = request.get_json() or {}
+
+    batch, error = EvaluationBatchService.create_batch(
+        club_id, data.get('criteria'), current_user_id, force_refresh=bool(data.get('force_refresh'))
+    )
+    if error:
+        return _batch_error(error)
+
+    return jsonify(batch.to_dict()), 202
+
+def get_evaluation_batch(batch_id):
+    current_user_id = get_jwt_identity()
+    batch, error = EvaluationBatchService.get_batch(batch_id, current_user_id)
+    if error:
+        return _batch_error(error)
+
+    return jsonify(batch.to_dict()), 200
+
+def get_evaluation_batch_results(batch_id):
+    """
+    Evaluated applicants of a batch, best score first, available while the batch runs.
+    Keyset pagination via ?limit= and ?cursor= (next cursor in X-Next-Cursor).
+    """
+    current_user_id = get_jwt_identity()
+    args = request.args
+    _, error = EvaluationBatchService.get_batch(batch_id, current_user_id)
+    if error:
+        return _batch_error(error)
+
+    limit = None
+    if 'limit' in args or 'cursor' in args:
+        limit = parse_limit(args.get('limit'))
+        if not limit:
+            return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+
+    after = None
+    if args.get('cursor'):
+        after = decode_rank_cursor(args['cursor'])
+        if not after:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+    items, next_key = EvaluationBatchService.get_results(batch_id, after, limit)
+    response = jsonify([item.to_dict() for item in items])
+    if next_key:
+        response.headers['X-Next-Cursor'] = encode_cursor(*next_key)
+    return response, 200
+
+def cancel_evaluation_batch(batch_id):
+    current_user_id = get_jwt_identity()
+    batch, error = EvaluationBatchService.cancel_batch(batch_id, current_user_id)
+    if error:
+        return _batch_error(error)
+
+    return jsonify(batch.to_dict()), 200
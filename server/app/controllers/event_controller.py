@@ -1,6 +1,8 @@
 from flask import jsonify, request
 from flask_jwt_extended import get_jwt_identity
 from app.services.event_service import EventService
+from app.serializers import EventSerializer
+from app.utils.pagination import encode_cursor, decode_date_cursor, parse_limit, parse_datetime, MAX_PAGE_SIZE
 
 class EventController:
     @staticmethod
@@ -27,10 +29,51 @@ class EventController:
     @staticmethod
     def get_all_events():
         """
-        Retrieve all events.
+        Retrieve events ordered by start date.
+        Supports ?status=, ?club_id=, ?from=, ?to=, ?fee=free|paid and keyset pagination
+        via ?limit= and ?cursor=. The cursor for the next page is returned in X-Next-Cursor.
         """
-        events = EventService.get_all_events()
-        return jsonify([event.to_dict() for event in events]), 200
+        args = request.args
+        filters = {}
+
+        if args.get('status'):
+            filters['status'] = args['status']
+
+        if args.get('club_id'):
+            try:
+                filters['club_id'] = int(args['club_id'])
+            except ValueError:
+                return jsonify({"error": "club_id must be an integer"}), 400
+
+        for arg, key in (('from', 'date_from'), ('to', 'date_to')):
+            if args.get(arg):
+                value = parse_datetime(args[arg])
+                if not value:
+                    return jsonify({"error": f"Invalid '{arg}' date. Use ISO 8601 format."}), 400
+                filters[key] = value
+
+        if args.get('fee'):
+            if args['fee'] not in ('free', 'paid'):
+                return jsonify({"error": "fee must be 'free' or 'paid'"}), 400
+            filters['fee'] = args['fee']
+
+        limit = None
+        if 'limit' in args or 'cursor' in args:
+            limit = parse_limit(args.get('limit'))
+            if not limit:
+                return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+
+        after = None
+        if args.get('cursor'):
+            after = decode_date_cursor(args['cursor'])
+            if not after:
+                return jsonify({"error": "Invalid cursor"}), 400
+
+        events, next_key = EventService.get_events_page(filters, after, limit)
+        response = jsonify(EventSerializer.dump_many(events))
+        if next_key:
+            response.headers['X-Next-Cursor'] = encode_cursor(*next_key)
+        return response, 200
 
     @staticmethod
     def get_event(event_id):
@@ -41,7 +84,7 @@ class EventController:
         if not event:
             return jsonify({"error": "Event not found"}), 404
         
-        return jsonify(event.to_dict()), 200
+        return jsonify(EventSerializer.dump(event)), 200
 
     @staticmethod
     def update_event(event_id):
@@ -0,0 +1,28 @@
+from flask import jsonify
+from flask_jwt_extended import get_jwt_identity
+from app.services.job_service import JobService
+
+def _job_error(error):
+    status_code = 403 if "Unauthorized" in error else 404
+    return jsonify({'error': error}), status_code
+
+def get_job(job_id):
+    current_user_id = get_jwt_identity()
+    job, error = JobService.get_job(job_id, current_user_id)
+    if error:
+        return _job_error(error)
+
+    return jsonify(job.to_dict()), 200
+
+def get_job_result(job_id):
+    """The job's result once it succeeded; 202 while it is queued or running."""
+    current_user_id = get_jwt_identity()
+    job, error = JobService.get_job(job_id, current_user_id)
+    if error:
+        return _job_error(error)
+
+    if job.status == 'succeeded':
+        return jsonify(job.result), 200
+    if job.status == 'failed':
+        return jsonify({'error': job.error, 'status': job.status}), 422
+    return jsonify({'status': job.status, 'attempts': job.attempts}), 202
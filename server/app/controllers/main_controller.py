@@ -1,7 +1,15 @@
-from flask import jsonify, request
+from flask import current_app, jsonify, request
+from flask_jwt_extended import get_jwt_identity
 from app.services.main_service import MainService
 from app.services.club_service import ClubService
 from app.services.event_service import EventService
+from app.services.suggest_service import SuggestService
+from app.services.intent_service import IntentService
+from app.models.user import User
+from app.serializers import ClubSerializer, EventSerializer
+from app.utils.pagination import encode_cursor, decode_rank_cursor, parse_limit, MAX_PAGE_SIZE
+from app.utils.llm_metrics import llm_metrics
+from app.utils.llm_admission import llm_admission
 
 def home_controller():
     data = MainService.get_home_message()
@@ -13,15 +21,66 @@ def test_db_controller():
         return jsonify({"error": error}), 500
     return jsonify(data)
 
+SEARCH_TYPES = ('clubs', 'events')
+DEFAULT_SUGGESTIONS = 5
+MAX_SUGGESTIONS = 20
+
 def search_controller():
+    """
+    Full-text search over clubs and events, best match first.
+    ?limit= caps each list (default 20). To page through one list, pass ?type=clubs|events
+    with ?cursor= set to that list's clubs_next_cursor / events_next_cursor.
+    """
     query = request.args.get('q', '')
     if not query:
-        return jsonify({'clubs': [], 'events': []}), 200
-        
-    clubs = ClubService.search_clubs(query)
-    events = EventService.search_events(query)
-    
+        return jsonify({'clubs': [], 'events': [], 'clubs_next_cursor': None, 'events_next_cursor': None}), 200
+
+    search_type = request.args.get('type')
+    if search_type and search_type not in SEARCH_TYPES:
+        return jsonify({"error": "type must be 'clubs' or 'events'"}), 400
+
+    limit = parse_limit(request.args.get('limit'))
+    if limit is None:
+        return jsonify({"error": f"limit must be an integer between 1 and {MAX_PAGE_SIZE}"}), 400
+
+    after = None
+    if request.args.get('cursor'):
+        if not search_type:
+            return jsonify({"error": "cursor requires type"}), 400
+        after = decode_rank_cursor(request.args['cursor'])
+        if not after:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    result = {}
+    for name, search, serializer in (
+        ('clubs', ClubService.search_clubs, ClubSerializer),
+        ('events', EventService.search_events, EventSerializer),
+    ):
+        items, next_key = [], None
+        if not search_type or search_type == name:
+            items, next_key = search(query, after=after, limit=limit)
+        result[name] = serializer.dump_many(items)
+        result[f'{name}_next_cursor'] = encode_cursor(*next_key) if next_key else None
+
+    return jsonify(result), 200
+
+def suggest_controller():
+    """Typeahead suggestions from the in-memory name index; does not query the database."""
+    prefix = request.args.get('prefix', '')
+    limit = parse_limit(request.args.get('limit'), default=DEFAULT_SUGGESTIONS, maximum=MAX_SUGGESTIONS)
+    if limit is None:
+        return jsonify({"error": f"limit must be an integer between 1 and {MAX_SUGGESTIONS}"}), 400
+
+    return jsonify(SuggestService.suggest(prefix, limit)), 200
+
+def metrics_controller():
+    """Operators only (METRICS_ADMIN_EMAILS). Model call and chat fast path metrics of the process serving the request."""
+    user = User.query.get(get_jwt_identity())
+    if not user or user.email.lower() not in current_app.config.get('METRICS_ADMIN_EMAILS', []):
+        return jsonify({'error': 'Unauthorized'}), 403
+
     return jsonify({
-        'clubs': [c.to_dict() for c in clubs],
-        'events': [e.to_dict() for e in events]
+        'llm': llm_metrics.snapshot(),
+        'llm_admission': llm_admission.stats(),
+        'chat_fast_path': IntentService.stats()
     }), 200
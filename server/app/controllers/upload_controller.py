@@ -1,5 +1,5 @@
 from flask import request, jsonify
-from flask_jwt_extended import jwt_required
+from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services.media_service import MediaService
 
 def upload_media():
@@ -12,15 +12,17 @@ def upload_media():
         return jsonify({'error': 'No selected file'}), 400
         
     # Optional: Validate file type here
+
+    # ?async=1 queues the upload and returns the job to poll at /api/jobs/<id>
+    if request.args.get('async', '').lower() in ('1', 'true'):
+        job, error = MediaService.enqueue_upload(file, get_jwt_identity())
+        if error:
+            return jsonify({'error': error}), 500
+        return jsonify({'job': job.to_dict()}), 202
     
     result, error = MediaService.upload_file(file)
     
     if error:
         return jsonify({'error': error}), 500
         
-    return jsonify({
-        'url': result.get('secure_url'),
-        'public_id': result.get('public_id'),
-        'format': result.get('format'),
-        'resource_type': result.get('resource_type')
-    }), 201
+    return jsonify(MediaService.upload_summary(result)), 201
@@ -1,6 +1,11 @@
+from datetime import datetime, timezone
 from flask import request, jsonify
 from flask_jwt_extended import get_jwt_identity
 from app.services.user_service import UserService
+from app.services.club_service import ClubService
+from app.services.event_service import EventService
+from app.serializers import UserSerializer, ClubSerializer, EventSerializer
+from app.utils.pagination import encode_cursor, decode_date_cursor, parse_limit, MAX_PAGE_SIZE
 
 def get_current_user_profile():
     current_user_id = get_jwt_identity()
@@ -9,7 +14,7 @@ def get_current_user_profile():
     if not user:
         return jsonify({'error': 'User not found'}), 404
         
-    return jsonify(user.to_dict()), 200
+    return jsonify(UserSerializer.dump(user)), 200
 
 def update_current_user_profile():
     current_user_id = get_jwt_identity()
@@ -46,3 +51,33 @@ def delete_current_user_account():
         return jsonify({'error': 'User not found'}), 404
         
     return jsonify({'message': 'Account deleted successfully'}), 200
+
+def get_my_clubs():
+    current_user_id = get_jwt_identity()
+    clubs = ClubService.get_member_clubs(current_user_id)
+    return jsonify(ClubSerializer.dump_many(clubs)), 200
+
+def get_my_events():
+    """Upcoming events of the current user's clubs, ordered by start date (?limit= and ?cursor=)."""
+    current_user_id = get_jwt_identity()
+
+    limit = parse_limit(request.args.get('limit'))
+    if not limit:
+        return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+
+    after = None
+    if request.args.get('cursor'):
+        after = decode_date_cursor(request.args['cursor'])
+        if not after:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+    filters = {
+        'member_id': current_user_id,
+        'date_from': datetime.now(timezone.utc).replace(tzinfo=None)
+    }
+    events, next_key = EventService.get_events_page(filters, after, limit)
+
+    response = jsonify(EventSerializer.dump_many(events))
+    if next_key:
+        response.headers['X-Next-Cursor'] = encode_cursor(*next_key)
+    return response, 200
@@ -0,0 +1,32 @@
+from app.extensions import db
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSON
+
+class CandidateEvaluation(db.Model):
+    """
+    A stored AI evaluation of a user against one criteria string. profile_hash fingerprints
+    the profile data the evaluation was based on, so it stops matching once that data changes.
+    """
+    __tablename__ = 'candidate_evaluations'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    profile_hash = db.Column(db.String(64), nullable=False)
+    criteria_hash = db.Column(db.String(64), nullable=False)
+    criteria = db.Column(db.Text, nullable=False)  # normalized criteria
+    result = db.Column(JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'profile_hash', 'criteria_hash', name='uq_candidate_evaluation'),
+    )
+
+    def to_dict(self):
+        return {
+            **self.result,
+            'cached': True,
+            'evaluated_at': self.created_at.isoformat()
+        }
+
+    def __repr__(self):
+        return f'<CandidateEvaluation user={self.user_id} criteria={self.criteria!r}>'
@@ -0,0 +1,59 @@
+from app.extensions import db
+from datetime import datetime
+
+class ChatThread(db.Model):
+    """One row per chat conversation; updated_at drives TTL expiry and LRU eviction."""
+    __tablename__ = 'chat_threads'
+
+    thread_id = db.Column(db.String(255), primary_key=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f'<ChatThread {self.thread_id}>'
+
+class ChatCheckpoint(db.Model):
+    """A serialized LangGraph checkpoint, including its channel values."""
+    __tablename__ = 'chat_checkpoints'
+
+    id = db.Column(db.Integer, primary_key=True)
+    thread_id = db.Column(db.String(255), nullable=False)
+    checkpoint_ns = db.Column(db.String(255), nullable=False, default='')
+    checkpoint_id = db.Column(db.String(64), nullable=False)
+    parent_checkpoint_id = db.Column(db.String(64), nullable=True)
+    checkpoint_type = db.Column(db.String(32), nullable=False)
+    checkpoint = db.Column(db.LargeBinary, nullable=False)
+    metadata_type = db.Column(db.String(32), nullable=False)
+    meta_data = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Latest checkpoint of a thread is the highest id within (thread_id, checkpoint_ns)
+    __table_args__ = (
+        db.UniqueConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', name='uq_chat_checkpoint'),
+        db.Index('ix_chat_checkpoints_thread_id_ns_id', 'thread_id', 'checkpoint_ns', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<ChatCheckpoint {self.thread_id}/{self.checkpoint_id}>'
+
+class ChatCheckpointWrite(db.Model):
+    """A pending write recorded by a graph task against a checkpoint."""
+    __tablename__ = 'chat_checkpoint_writes'
+
+    id = db.Column(db.Integer, primary_key=True)
+    thread_id = db.Column(db.String(255), nullable=False)
+    checkpoint_ns = db.Column(db.String(255), nullable=False, default='')
+    checkpoint_id = db.Column(db.String(64), nullable=False)
+    task_id = db.Column(db.String(64), nullable=False)
+    task_path = db.Column(db.String(255), nullable=False, default='')
+    idx = db.Column(db.Integer, nullable=False)
+    channel = db.Column(db.String(255), nullable=False)
+    value_type = db.Column(db.String(32), nullable=False)
+    value = db.Column(db.LargeBinary, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', 'task_id', 'idx', name='uq_chat_checkpoint_write'),
+    )
+
+    def __repr__(self):
+        return f'<ChatCheckpointWrite {self.thread_id}/{self.checkpoint_id}/{self.task_id}>'
@@ -1,6 +1,6 @@
 from app.extensions import db
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSON, ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY
 
 class Club(db.Model):
     __tablename__ = 'clubs'
@@ -9,7 +9,6 @@ class Club(db.Model):
     name = db.Column(db.String(100), unique=True, nullable=False, index=True)
     description = db.Column(db.Text, nullable=True)
     owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    members = db.Column(JSON, nullable=True, default=[])  # List of {user_id, role}
     roles = db.Column(ARRAY(db.String), nullable=True, default=[])  # List of available roles
     logo_url = db.Column(db.String(255), nullable=True)
     category = db.Column(db.String(50), nullable=True)
@@ -19,20 +18,22 @@ class Club(db.Model):
     # Relationships
     owner = db.relationship('User', backref=db.backref('owned_clubs', lazy=True))
 
-    def to_dict(self):
+    def to_dict(self, include_members=True):
         """Converts club object to dictionary."""
-        return {
+        result = {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'owner_id': self.owner_id,
-            'members': self.members,
             'roles': self.roles,
             'logo_url': self.logo_url,
             'category': self.category,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
+        if include_members:
+            result['members'] = [m.to_dict() for m in self.memberships]
+        return result
 
     def __repr__(self):
         return f'<Club {self.name}>'
@@ -0,0 +1,28 @@
+from app.extensions import db
+from datetime import datetime
+
+class ClubMembership(db.Model):
+    __tablename__ = 'club_memberships'
+
+    id = db.Column(db.Integer, primary_key=True)
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    role = db.Column(db.String(50), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Relationships
+    club = db.relationship('Club', backref=db.backref('memberships', lazy=True, cascade="all, delete-orphan"))
+    user = db.relationship('User', backref=db.backref('memberships', lazy=True, cascade="all, delete-orphan"))
+
+    __table_args__ = (
+        db.UniqueConstraint('club_id', 'user_id', name='uq_club_membership'),
+    )
+
+    def to_dict(self):
+        return {
+            'user_id': self.user_id,
+            'role': self.role
+        }
+
+    def __repr__(self):
+        return f'<ClubMembership {self.club_id}:{self.user_id}>'
@@ -1,6 +1,8 @@
 from app.extensions import db
 from datetime import datetime
 
+REQUEST_STATUSES = ('pending', 'accepted', 'rejected')
+
 class ClubRequest(db.Model):
     __tablename__ = 'club_requests'
 
@@ -18,6 +20,17 @@ class ClubRequest(db.Model):
     user = db.relationship('User', backref=db.backref('club_requests', lazy=True))
     club = db.relationship('Club', backref=db.backref('requests', lazy=True))
 
+    __table_args__ = (
+        # Review queue: filter by club and status, ordered by date
+        db.Index('ix_club_requests_club_id_status_created_at', 'club_id', 'status', 'created_at'),
+        # At most one pending request per user per club
+        db.Index(
+            'uq_club_requests_pending', 'club_id', 'user_id', unique=True,
+            postgresql_where=db.text("status = 'pending'"),
+            sqlite_where=db.text("status = 'pending'")
+        ),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -0,0 +1,84 @@
+from app.extensions import db
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSON
+
+BATCH_STATUSES = ('queued', 'running', 'completed', 'cancelled', 'failed')
+ITEM_STATUSES = ('pending', 'evaluated', 'cached', 'failed', 'cancelled')
+
+class EvaluationBatch(db.Model):
+    """Evaluation of every pending applicant of a club against one criteria string."""
+    __tablename__ = 'evaluation_batches'
+
+    id = db.Column(db.Integer, primary_key=True)
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id'), nullable=False, index=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    criteria = db.Column(db.Text, nullable=False)
+    force_refresh = db.Column(db.Boolean, default=False)
+    status = db.Column(db.String(20), default='queued')  # queued, running, completed, cancelled, failed
+    total = db.Column(db.Integer, default=0)
+    evaluated = db.Column(db.Integer, default=0)
+    cached = db.Column(db.Integer, default=0)
+    failed = db.Column(db.Integer, default=0)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    items = db.relationship('EvaluationBatchItem', backref='batch', lazy=True, cascade='all, delete-orphan')
+
+    def to_dict(self):
+        done = (self.evaluated or 0) + (self.cached or 0) + (self.failed or 0)
+        return {
+            'id': self.id,
+            'club_id': self.club_id,
+            'criteria': self.criteria,
+            'status': self.status,
+            'total': self.total,
+            'evaluated': self.evaluated,
+            'cached': self.cached,
+            'failed': self.failed,
+            'progress': round(done / self.total, 3) if self.total else 1.0,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f'<EvaluationBatch {self.id} club={self.club_id} {self.status}>'
+
+class EvaluationBatchItem(db.Model):
+    """One applicant of an evaluation batch and, once evaluated, their score."""
+    __tablename__ = 'evaluation_batch_items'
+
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.Integer, db.ForeignKey('evaluation_batches.id'), nullable=False)
+    request_id = db.Column(db.Integer, db.ForeignKey('club_requests.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    status = db.Column(db.String(20), default='pending')  # pending, evaluated, cached, failed, cancelled
+    score = db.Column(db.Float, nullable=True)
+    result = db.Column(JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = db.relationship('User')
+
+    __table_args__ = (
+        # Ranked results: best score first within a batch
+        db.Index('ix_evaluation_batch_items_batch_id_score', 'batch_id', 'score'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'request_id': self.request_id,
+            'user_id': self.user_id,
+            'user_name': self.user.name if self.user else None,
+            'status': self.status,
+            'score': self.score,
+            'result': self.result,
+            'error': self.error
+        }
+
+    def __repr__(self):
+        return f'<EvaluationBatchItem {self.batch_id}/{self.request_id} {self.status}>'
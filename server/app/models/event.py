@@ -23,6 +23,13 @@ class Event(db.Model):
     # Relationships
     club = db.relationship('Club', backref=db.backref('events', lazy=True))
 
+    # Keyset pagination orders by (start_date, id); filtered listings lead with the filter column
+    __table_args__ = (
+        db.Index('ix_events_start_date_id', 'start_date', 'id'),
+        db.Index('ix_events_status_start_date_id', 'status', 'start_date', 'id'),
+        db.Index('ix_events_club_id_start_date_id', 'club_id', 'start_date', 'id'),
+    )
+
     def to_dict(self):
         """Converts event object to dictionary."""
         return {
@@ -0,0 +1,28 @@
+from app.extensions import db
+from datetime import datetime
+
+class ReadmeCache(db.Model):
+    """
+    A repository README as last fetched from GitHub, with its summary once one was made.
+    Rows are keyed by the README's blob sha, so a changed README gets a new row (and a new
+    summary); etag lets the next fetch be a conditional request.
+    """
+    __tablename__ = 'readme_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    owner = db.Column(db.String(255), nullable=False)
+    repo = db.Column(db.String(255), nullable=False)
+    sha = db.Column(db.String(64), nullable=False)
+    etag = db.Column(db.String(255), nullable=True)
+    content = db.Column(db.Text, nullable=False)
+    summary = db.Column(db.Text, nullable=True)
+    size = db.Column(db.Integer, nullable=False, default=0)  # characters of content + summary, for eviction
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow)  # last fetch or successful revalidation
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('owner', 'repo', 'sha', name='uq_readme_cache'),
+    )
+
+    def __repr__(self):
+        return f'<ReadmeCache {self.owner}/{self.repo}@{self.sha[:7]}>'
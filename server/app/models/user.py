@@ -12,6 +12,7 @@ class User(db.Model):
     is_admin = db.Column(db.Boolean, default=False)  # For club owners
     bio = db.Column(db.Text, nullable=True)
     social_media = db.Column(JSON, nullable=True, default={})  # GitHub, Instagram, LinkedIn, etc.
+    avatar_url = db.Column(db.String(255), nullable=True)  # Copied from connected OAuth accounts
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -24,6 +25,7 @@ class User(db.Model):
             'is_admin': self.is_admin,
             'bio': self.bio,
             'social_media': self.social_media,
+            'avatar_url': self.avatar_url,
             'oauth_accounts': [oauth.to_dict() for oauth in self.oauth_accounts],
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
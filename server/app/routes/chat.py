@@ -1,5 +1,5 @@
 from flask import Blueprint
-from app.controllers.chat_controller import chat
+from app.controllers.chat_controller import chat, chat_stream
 from flask_jwt_extended import jwt_required
 
 chat_bp = Blueprint('chat', __name__)
@@ -8,3 +8,8 @@ chat_bp = Blueprint('chat', __name__)
 @jwt_required()
 def chat_route():
     return chat()
+
+@chat_bp.route('/stream', methods=['POST'])
+@jwt_required()
+def chat_stream_route():
+    return chat_stream()
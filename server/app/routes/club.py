@@ -4,16 +4,23 @@ from app.controllers.club_controller import (
     get_all_clubs as get_all_clubs_controller,
     get_managed_clubs as get_managed_clubs_controller,
     get_club as get_club_controller,
+    get_club_members as get_club_members_controller,
     create_club as create_club_controller,
     update_club as update_club_controller,
     delete_club as delete_club_controller,
     request_join as request_join_controller,
     get_requests as get_requests_controller,
+    get_request_counts as get_request_counts_controller,
     handle_request as handle_request_controller,
+    bulk_handle_requests as bulk_handle_requests_controller,
     get_my_requests as get_my_requests_controller,
     get_request_details as get_request_details_controller,
     get_request_github_repos as get_request_github_repos_controller,
-    evaluate_request_candidate
+    evaluate_request_candidate,
+    create_evaluation_batch as create_evaluation_batch_controller,
+    get_evaluation_batch as get_evaluation_batch_controller,
+    get_evaluation_batch_results as get_evaluation_batch_results_controller,
+    cancel_evaluation_batch as cancel_evaluation_batch_controller
 )
 
 club_bp = Blueprint('club', __name__)
@@ -31,6 +38,10 @@ def get_managed_clubs():
 def get_club(club_id):
     return get_club_controller(club_id)
 
+@club_bp.route('/<int:club_id>/members', methods=['GET'])
+def get_club_members(club_id):
+    return get_club_members_controller(club_id)
+
 @club_bp.route('/', methods=['POST'])
 @jwt_required()
 def create_club():
@@ -56,6 +67,11 @@ def request_join(club_id):
 def get_requests(club_id):
     return get_requests_controller(club_id)
 
+@club_bp.route('/<int:club_id>/requests/counts', methods=['GET'])
+@jwt_required()
+def get_request_counts(club_id):
+    return get_request_counts_controller(club_id)
+
 @club_bp.route('/requests/<int:request_id>', methods=['GET'])
 @jwt_required()
 def get_request_details(request_id):
@@ -71,11 +87,36 @@ def get_request_github_repos(request_id):
 def evaluate_request(request_id):
     return evaluate_request_candidate(request_id)
 
+@club_bp.route('/<int:club_id>/evaluations', methods=['POST'])
+@jwt_required()
+def create_evaluation_batch(club_id):
+    return create_evaluation_batch_controller(club_id)
+
+@club_bp.route('/evaluations/<int:batch_id>', methods=['GET'])
+@jwt_required()
+def get_evaluation_batch(batch_id):
+    return get_evaluation_batch_controller(batch_id)
+
+@club_bp.route('/evaluations/<int:batch_id>/results', methods=['GET'])
+@jwt_required()
+def get_evaluation_batch_results(batch_id):
+    return get_evaluation_batch_results_controller(batch_id)
+
+@club_bp.route('/evaluations/<int:batch_id>/cancel', methods=['POST'])
+@jwt_required()
+def cancel_evaluation_batch(batch_id):
+    return cancel_evaluation_batch_controller(batch_id)
+
 @club_bp.route('/requests/<int:request_id>', methods=['PUT'])
 @jwt_required()
 def handle_request(request_id):
     return handle_request_controller(request_id)
 
+@club_bp.route('/<int:club_id>/requests/bulk', methods=['POST'])
+@jwt_required()
+def bulk_handle_requests(club_id):
+    return bulk_handle_requests_controller(club_id)
+
 @club_bp.route('/my-requests', methods=['GET'])
 @jwt_required()
 def get_my_requests():
@@ -0,0 +1,15 @@
+from flask import Blueprint
+from flask_jwt_extended import jwt_required
+from app.controllers.job_controller import get_job, get_job_result
+
+job_bp = Blueprint('job', __name__)
+
+@job_bp.route('/<int:job_id>', methods=['GET'])
+@jwt_required()
+def get_job_route(job_id):
+    return get_job(job_id)
+
+@job_bp.route('/<int:job_id>/result', methods=['GET'])
+@jwt_required()
+def get_job_result_route(job_id):
+    return get_job_result(job_id)
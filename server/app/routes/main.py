@@ -1,5 +1,6 @@
 from flask import Blueprint
-from app.controllers.main_controller import home_controller, test_db_controller, search_controller
+from flask_jwt_extended import jwt_required
+from app.controllers.main_controller import home_controller, test_db_controller, search_controller, suggest_controller, metrics_controller
 
 main_bp = Blueprint('main', __name__)
 
@@ -14,3 +15,12 @@ def test_db():
 @main_bp.route('/search', methods=['GET'])
 def search():
     return search_controller()
+
+@main_bp.route('/search/suggest', methods=['GET'])
+def suggest():
+    return suggest_controller()
+
+@main_bp.route('/metrics', methods=['GET'])
+@jwt_required()
+def metrics():
+    return metrics_controller()
@@ -4,7 +4,9 @@ from app.controllers.user_controller import (
     get_current_user_profile,
     update_current_user_profile,
     delete_current_user_account,
-    become_creator
+    become_creator,
+    get_my_clubs,
+    get_my_events
 )
 
 user_bp = Blueprint('user', __name__)
@@ -19,6 +21,16 @@ def get_profile():
 def update_profile():
     return update_current_user_profile()
 
+@user_bp.route('/me/clubs', methods=['GET'])
+@jwt_required()
+def my_clubs():
+    return get_my_clubs()
+
+@user_bp.route('/me/events', methods=['GET'])
+@jwt_required()
+def my_events():
+    return get_my_events()
+
 @user_bp.route('/me/become-creator', methods=['POST'])
 @jwt_required()
 def promote_user():
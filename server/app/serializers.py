@@ -0,0 +1,151 @@
+from sqlalchemy.orm import joinedload, selectinload
+from app.models.announcement import Announcement
+from app.models.club import Club
+from app.models.club_membership import ClubMembership  # registers the Club.memberships backref
+from app.models.club_request import ClubRequest
+from app.models.event import Event
+from app.models.user import User
+
+# Each serializer declares the relationships its shape touches so services can
+# load them in bulk (joined for many-to-one, selectin for collections) instead of
+# lazy loading them row by row while serializing.
+#
+# The compact shapes are what the chat agent's tools return: only the fields the model
+# needs to answer or to pick an id, with long free text cut to COMPACT_TEXT_LENGTH, so
+# a tool result stays a few hundred tokens instead of a table dump.
+
+COMPACT_TEXT_LENGTH = 200
+
+def _truncate(text, length=COMPACT_TEXT_LENGTH):
+    if text and len(text) > length:
+        return text[:length].rstrip() + '...'
+    return text
+
+class ClubSerializer:
+    @staticmethod
+    def load_options():
+        return [selectinload(Club.memberships)]
+
+    @staticmethod
+    def compact_load_options():
+        return []
+
+    @staticmethod
+    def dump(club):
+        return club.to_dict()
+
+    @staticmethod
+    def dump_compact(club):
+        return {
+            'id': club.id,
+            'name': club.name,
+            'category': club.category,
+            'roles': club.roles or [],
+            'description': _truncate(club.description)
+        }
+
+    @classmethod
+    def dump_many(cls, clubs):
+        return [cls.dump(c) for c in clubs]
+
+class EventSerializer:
+    @staticmethod
+    def load_options():
+        # Announcement.event is resolved from the identity map once the event is loaded
+        return [
+            joinedload(Event.club),
+            selectinload(Event.announcements),
+        ]
+
+    @staticmethod
+    def compact_load_options():
+        return [joinedload(Event.club)]
+
+    @staticmethod
+    def dump(event):
+        return event.to_dict()
+
+    @staticmethod
+    def dump_compact(event):
+        return {
+            'id': event.id,
+            'title': event.title,
+            'club_id': event.club_id,
+            'club_name': event.club.name if event.club else None,
+            'start_date': event.start_date.isoformat(),
+            'end_date': event.end_date.isoformat(),
+            'location': event.location,
+            'fee': event.fee,
+            'status': event.status
+        }
+
+    @classmethod
+    def dump_many(cls, events):
+        return [cls.dump(e) for e in events]
+
+class AnnouncementSerializer:
+    @staticmethod
+    def load_options():
+        return [joinedload(Announcement.event)]
+
+    @staticmethod
+    def dump(announcement):
+        return announcement.to_dict()
+
+    @staticmethod
+    def dump_compact(announcement):
+        return {
+            'id': announcement.id,
+            'event_id': announcement.event_id,
+            'event_title': announcement.event.title if announcement.event else None,
+            'title': announcement.title,
+            'content': _truncate(announcement.content),
+            'created_at': announcement.created_at.isoformat()
+        }
+
+    @classmethod
+    def dump_many(cls, announcements):
+        return [cls.dump(a) for a in announcements]
+
+class UserSerializer:
+    @staticmethod
+    def load_options():
+        return [selectinload(User.oauth_accounts)]
+
+    @staticmethod
+    def dump(user):
+        return user.to_dict()
+
+    @classmethod
+    def dump_many(cls, users):
+        return [cls.dump(u) for u in users]
+
+class ClubRequestSerializer:
+    @staticmethod
+    def load_options():
+        return [
+            joinedload(ClubRequest.user),
+            joinedload(ClubRequest.club),
+        ]
+
+    @staticmethod
+    def detail_load_options():
+        """Detail responses also embed the applicant's profile and OAuth accounts."""
+        return [
+            joinedload(ClubRequest.user).selectinload(User.oauth_accounts),
+            joinedload(ClubRequest.club),
+        ]
+
+    @staticmethod
+    def dump(req):
+        return req.to_dict()
+
+    @staticmethod
+    def dump_detail(req):
+        result = req.to_dict()
+        result['user_details'] = UserSerializer.dump(req.user)
+        return result
+
+    @classmethod
+    def dump_many(cls, reqs):
+        return [cls.dump(r) for r in reqs]
@@ -2,179 +2,529 @@ import os
 import logging
 import requests
 import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
 from typing import Annotated, Literal, TypedDict, Union, List
+from contextvars import copy_context
 from functools import partial
+from flask import current_app, has_app_context
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, AIMessageChunk, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.constants import TAG_NOSTREAM
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
-from langgraph.checkpoint.memory import MemorySaver
 
 from app.services.club_service import ClubService
 from app.services.event_service import EventService
 from app.services.announcement_service import AnnouncementService
+from app.extensions import db
+from app.services.readme_cache_service import ReadmeCacheService
+from app.services.intent_service import IntentService
 from app.models.oauth import OAuth
 from app.models.user import User
+from app.utils.checkpointer import DatabaseCheckpointSaver
+from app.utils.chat_history import HistoryWindow, estimate_tokens, message_text
+from app.utils.llm_metrics import invoke_llm
+from app.utils.fake_llm import create_fake_model
+from app.config import Config
+from app.utils.pagination import (
+    encode_cursor, decode_cursor, decode_date_cursor, decode_rank_cursor, parse_limit
+)
+from app.serializers import ClubSerializer, EventSerializer, AnnouncementSerializer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global memory saver for in-memory persistence
-memory = MemorySaver()
+# Chat history is checkpointed to the database, bounded per thread and in total
+checkpointer = DatabaseCheckpointSaver()
+
+SYSTEM_PROMPT = """You are a helpful AI assistant for a Hackathon Club Management platform.
+
+PROTOCOL FOR JOINING A CLUB:
+1. If a user wants to join a club, FIRST call `get_clubs` to retrieve available clubs (use `search` when the user names a club or topic).
+2. Present the names of the clubs to the user.
+3. Ask the user to select a club.
+4. Once selected, look at the `roles` list for that club from the `get_clubs` data.
+5. Present the available roles to the user and ask them to choose one.
+6. ONLY then call `join_club` with the mapped `club_id` and the selected `role`.
+"""
+
+SUMMARY_PROMPT = """You maintain a running summary of a conversation between a user and the assistant of a Hackathon Club Management platform.
+Update the summary with the new messages below. Keep facts the assistant may need later: the user's goals, clubs, events and roles mentioned (with ids), decisions made and open questions.
+Reply with the updated summary only, in at most 150 words.
+
+Current summary:
+{summary}
+
+New messages:
+{messages}
+"""
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+    # Running summary of turns that were folded out of `messages`
+    summary: str
+
+# The model client and the compiled graph are built once per process and shared by
+# every request; per-user context travels in the run config instead of closures.
+_cache_lock = threading.Lock()
+_cache = {}
+
+# Read tools return one small page of compact records; the model asks for more with next_cursor
+TOOL_PAGE_SIZE = 10
+TOOL_MAX_PAGE_SIZE = 20
+
+def _current_user_id(config: RunnableConfig):
+    return config["configurable"]["user_id"]
+
+@tool
+def create_club(name: str, description: str, category: str, config: RunnableConfig, logo_url: str = "https://via.placeholder.com/150"):
+    """
+    Create a new club.
+
+    Args:
+        name: Name of the club
+        description: Description of the club
+        category: Category of the club
+        logo_url: URL of the club logo (optional)
+    """
+    data = {
+        "name": name,
+        "description": description,
+        "category": category,
+        "logo_url": logo_url
+    }
+    result, error = ClubService.create_club(data, _current_user_id(config))
+    if error:
+        return f"Error: {error}"
+    return f"Successfully created club: {result.name}"
+
+@tool
+def create_event(title: str, description: str, club_id: int, start_date: str, end_date: str, fee: float, config: RunnableConfig, poster_url: str = "https://via.placeholder.com/300x200"):
+    """
+    Create a new event for a club.
+
+    Args:
+        title: Title of the event
+        description: Description of the event
+        club_id: ID of the club
+        start_date: ISO 8601 format date (e.g. 2024-05-20T10:00:00Z)
+        end_date: ISO 8601 format date
+        fee: Entry fee for the event
+        poster_url: URL of the poster image (optional)
+    """
+    data = {
+        "title": title,
+        "description": description,
+        "club_id": club_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "fee": fee,
+        "poster_url": poster_url
+    }
+    result, error = EventService.create_event(data, _current_user_id(config))
+    if error:
+        return f"Error: {error}"
+    return f"Successfully created event: {result.title}"
+
+def _tool_limit(limit):
+    return parse_limit(limit, TOOL_PAGE_SIZE, TOOL_MAX_PAGE_SIZE) or TOOL_PAGE_SIZE
+
+@tool
+def get_clubs(search: str = "", category: str = "", limit: int = TOOL_PAGE_SIZE, cursor: str = ""):
+    """
+    Find clubs. Returns compact records (id, name, category, roles, short description)
+    and a next_cursor when more clubs match.
+
+    Args:
+        search: Words to look for in club names, categories and descriptions (optional)
+        category: Only clubs in this category (optional)
+        limit: Number of clubs to return, at most 20
+        cursor: next_cursor of a previous call, to get the following page
+    """
+    limit = _tool_limit(limit)
+    options = ClubSerializer.compact_load_options()
+    if search:
+        after = decode_rank_cursor(cursor) if cursor else None
+        if cursor and after is None:
+            return "Error: Invalid cursor"
+        clubs, next_key = ClubService.search_clubs(search, after=after, limit=limit, category=category, options=options)
+    else:
+        after = decode_cursor(cursor) if cursor else None
+        if cursor and (not after or not isinstance(after[0], int)):
+            return "Error: Invalid cursor"
+        clubs, next_key = ClubService.get_clubs_page(category, after=after[0] if after else None, limit=limit, options=options)
+        next_key = (next_key,) if next_key else None
+    return {
+        'clubs': [ClubSerializer.dump_compact(c) for c in clubs],
+        'next_cursor': encode_cursor(*next_key) if next_key else None
+    }
+
+@tool
+def get_events(search: str = "", club_id: int = 0, include_past: bool = False, limit: int = TOOL_PAGE_SIZE, cursor: str = ""):
+    """
+    Find events, upcoming ones first by start date. Returns compact records (id, title,
+    club, dates, location, fee, status) and a next_cursor when more events match.
+
+    Args:
+        search: Words to look for in event titles, locations and descriptions (optional)
+        club_id: Only events of this club (optional)
+        include_past: Also return events that already started
+        limit: Number of events to return, at most 20
+        cursor: next_cursor of a previous call, to get the following page
+    """
+    limit = _tool_limit(limit)
+    options = EventSerializer.compact_load_options()
+    filters = {}
+    if club_id:
+        filters['club_id'] = club_id
+    if not include_past:
+        filters['date_from'] = datetime.utcnow()
+
+    if search:
+        after = decode_rank_cursor(cursor) if cursor else None
+        if cursor and after is None:
+            return "Error: Invalid cursor"
+        events, next_key = EventService.search_events(search, after=after, limit=limit, filters=filters, options=options)
+    else:
+        after = decode_date_cursor(cursor) if cursor else None
+        if cursor and after is None:
+            return "Error: Invalid cursor"
+        events, next_key = EventService.get_events_page(filters, after=after, limit=limit, options=options)
+    return {
+        'events': [EventSerializer.dump_compact(e) for e in events],
+        'next_cursor': encode_cursor(*next_key) if next_key else None
+    }
+
+@tool
+def join_club(club_id: int, message: str, role: str, config: RunnableConfig):
+    """
+    Request to join a club.
+
+    IMPORTANT:
+    - BEFORE calling this tool, you MUST use `get_clubs` to list available clubs and their roles to the user.
+    - Ask the user to select a club name and a role.
+    - Map the user's selected club name to `club_id` from the `get_clubs` data.
+    - Ensure `role` is one of the valid roles for that club.
+
+    Args:
+        club_id: ID of the club to join
+        message: Message to the club owner explaining why you want to join
+        role: Role you are applying for (must be one of the club's available roles)
+    """
+    result, error = ClubService.request_to_join(club_id, _current_user_id(config), message, role)
+    if error:
+        return f"Error: {error}"
+    return f"Successfully requested to join club. Request status: {result.status}"
+
+@tool
+def get_announcements(event_id: int = 0, limit: int = TOOL_PAGE_SIZE, cursor: str = ""):
+    """
+    Get the latest announcements, newest first, with their content shortened. Returns a
+    next_cursor when there are older ones.
+
+    Args:
+        event_id: Only announcements of this event (optional)
+        limit: Number of announcements to return, at most 20
+        cursor: next_cursor of a previous call, to get older announcements
+    """
+    before = decode_date_cursor(cursor) if cursor else None
+    if cursor and before is None:
+        return "Error: Invalid cursor"
+    announcements, next_key = AnnouncementService.get_announcements_page(
+        event_id or None, before=before, limit=_tool_limit(limit)
+    )
+    return {
+        'announcements': [AnnouncementSerializer.dump_compact(a) for a in announcements],
+        'next_cursor': encode_cursor(*next_key) if next_key else None
+    }
+
+TOOLS = [create_club, create_event, get_clubs, get_events, join_club, get_announcements]
 
 class AIService:
     @staticmethod
-    def get_model():
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.warning("GEMINI_API_KEY not found.")
-            return None
-        
+    def create_model(api_key):
         # Ensure the key is available for langchain-google-genai
         os.environ["GOOGLE_API_KEY"] = api_key
-        
+
         return ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
             temperature=0,
-            convert_system_message_to_human=True
+            convert_system_message_to_human=True,
+            # 1 disables the SDK's own retries; invoke_llm retries and counts them
+            max_retries=1
         )
 
     @staticmethod
-    def create_tools(user_id: int):
-        """Create tools with user_id context bound to them."""
-        
-        @tool
-        def create_club(name: str, description: str, category: str, logo_url: str = "https://via.placeholder.com/150"):
-            """
-            Create a new club.
-            
-            Args:
-                name: Name of the club
-                description: Description of the club
-                category: Category of the club
-                logo_url: URL of the club logo (optional)
-            """
-            data = {
-                "name": name,
-                "description": description,
-                "category": category,
-                "logo_url": logo_url
-            }
-            result, error = ClubService.create_club(data, user_id)
-            if error:
-                return f"Error: {error}"
-            return f"Successfully created club: {result.name}"
-
-        @tool
-        def create_event(title: str, description: str, club_id: int, start_date: str, end_date: str, fee: float, poster_url: str = "https://via.placeholder.com/300x200"):
-            """
-            Create a new event for a club.
-            
-            Args:
-                title: Title of the event
-                description: Description of the event
-                club_id: ID of the club
-                start_date: ISO 8601 format date (e.g. 2024-05-20T10:00:00Z)
-                end_date: ISO 8601 format date
-                fee: Entry fee for the event
-                poster_url: URL of the poster image (optional)
-            """
-            data = {
-                "title": title,
-                "description": description,
-                "club_id": club_id,
-                "start_date": start_date,
-                "end_date": end_date,
-                "fee": fee,
-                "poster_url": poster_url
+    def get_model():
+        """
+        Returns the shared chat model client, rebuilt only when its settings change:
+        Gemini with GEMINI_API_KEY, or the offline fake model when LLM_PROVIDER is 'fake'.
+        """
+        settings = current_app.config if has_app_context() else vars(Config)
+        if settings.get('LLM_PROVIDER', 'gemini') == 'fake':
+            fake_settings = {
+                'profile': settings.get('FAKE_LLM_PROFILE', 'fast'),
+                'script': settings.get('FAKE_LLM_SCRIPT'),
+                'ttft': settings.get('FAKE_LLM_TTFT'),
+                'tokens_per_second': settings.get('FAKE_LLM_TOKENS_PER_SECOND'),
+                'jitter': settings.get('FAKE_LLM_JITTER', 0.2),
+                'error_rate': settings.get('FAKE_LLM_ERROR_RATE', 0)
             }
-            result, error = EventService.create_event(data, user_id)
-            if error:
-                return f"Error: {error}"
-            return f"Successfully created event: {result.title}"
-
-        @tool
-        def get_clubs():
-            """Get a list of all clubs."""
-            clubs = ClubService.get_all_clubs()
-            return [c.to_dict() for c in clubs]
-
-        @tool
-        def get_events():
-            """Get a list of all events."""
-            events = EventService.get_all_events()
-            return [e.to_dict() for e in events]
-
-        @tool
-        def join_club(club_id: int, message: str, role: str):
-            """
-            Request to join a club.
-            
-            IMPORTANT:
-            - BEFORE calling this tool, you MUST use `get_clubs` to list available clubs and their roles to the user.
-            - Ask the user to select a club name and a role.
-            - Map the user's selected club name to `club_id` from the `get_clubs` data.
-            - Ensure `role` is one of the valid roles for that club.
-            
-            Args:
-                club_id: ID of the club to join
-                message: Message to the club owner explaining why you want to join
-                role: Role you are applying for (must be one of the club's available roles)
-            """
-            result, error = ClubService.request_to_join(club_id, user_id, message, role)
-            if error:
-                return f"Error: {error}"
-            return f"Successfully requested to join club. Request status: {result.status}"
-
-        @tool
-        def get_announcements():
-            """Get a list of all announcements."""
-            announcements = AnnouncementService.get_all_announcements()
-            return [a.to_dict() for a in announcements]
-
-        return [create_club, create_event, get_clubs, get_events, join_club, get_announcements]
+            key = ('fake',) + tuple(sorted(fake_settings.items()))
+            build = partial(create_fake_model, **fake_settings)
+        else:
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                logger.warning("GEMINI_API_KEY not found.")
+                return None
+            key = ('gemini', api_key)
+            build = partial(AIService.create_model, api_key)
+
+        with _cache_lock:
+            if _cache.get('key') != key:
+                _cache.clear()
+                _cache['key'] = key
+                _cache['model'] = build()
+            return _cache['model']
 
     @staticmethod
-    def summarize_text(text: str, max_words: int = 300) -> str:
-        """Summarize long text using the AI model."""
+    def build_graph(model, checkpointer):
+        """Builds and compiles the chat agent graph around `model`."""
+        model_with_tools = model.bind_tools(TOOLS)
+
+        def chatbot(state: State):
+            logger.info(f"Processing messages count: {len(state['messages'])}")
+            config = current_app.config
+            window = HistoryWindow(
+                token_budget=config.get('CHAT_HISTORY_TOKEN_BUDGET', 6000) - estimate_tokens([], SYSTEM_PROMPT),
+                keep_turns=config.get('CHAT_HISTORY_KEEP_TURNS', 6),
+                summary_batch_turns=config.get('CHAT_SUMMARY_BATCH_TURNS', 4)
+            )
+            prompt, summary, removals = window.prepare(
+                state["messages"], state.get("summary") or "", AIService.summarize_history
+            )
+
+            system_text = SYSTEM_PROMPT
+            if summary:
+                system_text += f"\nSUMMARY OF THE EARLIER CONVERSATION:\n{summary}\n"
+            response = invoke_llm(model_with_tools, [SystemMessage(content=system_text)] + prompt, 'chat')
+            return {"messages": removals + [response], "summary": summary}
+
+        graph_builder = StateGraph(State)
+        graph_builder.add_node("chatbot", chatbot)
+        graph_builder.add_node("tools", ToolNode(TOOLS))
+        graph_builder.add_conditional_edges(
+            "chatbot",
+            tools_condition,
+        )
+        graph_builder.add_edge("tools", "chatbot")
+        graph_builder.add_edge(START, "chatbot")
+
+        return graph_builder.compile(checkpointer=checkpointer)
+
+    @staticmethod
+    def get_graph():
+        """Returns the compiled chat graph, or None if the model is not configured."""
+        model = AIService.get_model()
+        if not model:
+            return None
+
+        with _cache_lock:
+            if _cache.get('model') is model and 'graph' in _cache:
+                return _cache['graph']
+            graph = AIService.build_graph(model, checkpointer)
+            if _cache.get('model') is model:
+                _cache['graph'] = graph
+            return graph
+
+    @staticmethod
+    def summarize_history(summary: str, messages: list) -> str:
+        """Folds compacted chat messages into the running conversation summary."""
+        transcript = "\n".join(
+            f"{'User' if isinstance(m, HumanMessage) else 'Assistant'}: {message_text(m)}" for m in messages
+        )
+        try:
+            model = AIService.get_model()
+            if model:
+                # Tagged so summary tokens are not streamed to the user as part of the reply
+                response = invoke_llm(
+                    model,
+                    SUMMARY_PROMPT.format(summary=summary or "(none)", messages=transcript),
+                    'chat_history_summary',
+                    config={"tags": [TAG_NOSTREAM]}
+                )
+                return message_text(response).strip()
+        except Exception as e:
+            logger.warning(f"History summarization failed: {e}")
+        # Without the model, keep a truncated transcript so the context is not lost entirely
+        return f"{summary}\n{transcript}".strip()[-2000:]
+
+    @staticmethod
+    def generate_summary(text: str, max_words: int = 300):
+        """Summarize long README text with the AI model. Returns None if the model is unavailable or fails."""
         try:
             model = AIService.get_model()
             if not model:
-                return text[:2000] + "..."
-                
+                return None
+
             prompt = f"Summarize the following README content in about {max_words} words, focusing on tech stack, features, and complexity:\n\n{text[:20000]}" # Limit input to avoid excessive tokens
-            response = model.invoke(prompt)
+            response = invoke_llm(model, prompt, 'readme_summary')
             return response.content.strip()
         except Exception as e:
             logger.warning(f"Summarization failed: {e}")
-            return text[:2000] + "..."
+            return None
 
     @staticmethod
-    def get_repo_readme_content(owner: str, repo_name: str, access_token: str):
-        """Fetch and decode README content for a repository."""
+    def summarize_text(text: str, max_words: int = 300) -> str:
+        """Summarize long text using the AI model, falling back to the start of the text."""
+        return AIService.generate_summary(text, max_words) or text[:2000] + "..."
+
+    @staticmethod
+    def _readme_cache(step, *args, **kwargs):
+        """
+        Runs one README cache call. The cache only saves work, so a failure (a database error,
+        or an entry a concurrent store or eviction already deleted) is logged, rolled back and
+        treated as a miss.
+        :return: The call's result, or None if it failed
+        """
         try:
-            url = f"https://api.github.com/repos/{owner}/{repo_name}/readme"
-            headers = {'Authorization': f'token {access_token}'}
-            # Added timeout to prevent hanging
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                content = base64.b64decode(data['content']).decode('utf-8')
-                
-                # If content is very long, summarize it
-                if len(content) > 5000:
-                    return AIService.summarize_text(content)
-                
-                return content
+            return step(*args, **kwargs)
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"README cache {step.__name__} failed: {e}")
             return None
+
+    @staticmethod
+    def get_repo_readme_content(owner: str, repo_name: str, access_token: str):
+        """
+        Fetch and decode README content for a repository, summarized if it is long.
+        READMEs and summaries are cached by blob sha: a recent entry is used as is, an older
+        one is revalidated with its ETag, and the summary is only generated once per version.
+        Returns None if there is no README or it cannot be fetched.
+        """
+        cached = AIService._readme_cache(ReadmeCacheService.get_latest, owner, repo_name)
+        entry = None
+        if cached:
+            # Plain copies: a failed cache write below expires (or may have deleted) the entry
+            cached_content, cached_summary, cached_etag = cached.content, cached.summary, cached.etag
+
+        try:
+            if cached and ReadmeCacheService.is_fresh(cached):
+                content, summary = cached_content, cached_summary
+                entry = AIService._readme_cache(ReadmeCacheService.touch, cached)
+            else:
+                url = f"https://api.github.com/repos/{owner}/{repo_name}/readme"
+                headers = {'Authorization': f'token {access_token}'}
+                if cached and cached_etag:
+                    headers['If-None-Match'] = cached_etag
+                # Added timeout to prevent hanging
+                response = requests.get(url, headers=headers, timeout=10)
+
+                if response.status_code == 304 and cached:
+                    content, summary = cached_content, cached_summary
+                    entry = AIService._readme_cache(ReadmeCacheService.touch, cached, revalidated=True)
+                elif response.status_code == 200:
+                    data = response.json()
+                    content = base64.b64decode(data['content']).decode('utf-8')
+                    entry = AIService._readme_cache(
+                        ReadmeCacheService.store, owner, repo_name, data['sha'], response.headers.get('ETag'), content
+                    )
+                    summary = None
+                    if entry:
+                        # An entry already stored for this version keeps its summary
+                        try:
+                            summary = entry.summary
+                        except Exception as e:
+                            db.session.rollback()
+                            logger.warning(f"README cache entry for {owner}/{repo_name} vanished: {e}")
+                            entry = None
+                else:
+                    return None
         except Exception as e:
             logger.error(f"Failed to fetch README for {owner}/{repo_name}: {e}")
-            return None
+            if not cached:
+                return None
+            # GitHub unreachable: the last known README is better than none
+            content, summary = cached_content, cached_summary
+
+        try:
+            # If content is very long, summarize it
+            if len(content) <= 5000:
+                return content
+            if summary:
+                return summary
+            summary = AIService.generate_summary(content)
+            if not summary:
+                # Not cached, so the summary is retried next time
+                return content[:2000] + "..."
+            if entry:
+                AIService._readme_cache(ReadmeCacheService.save_summary, entry, summary)
+            return summary
+        except Exception as e:
+            logger.error(f"Failed to summarize README for {owner}/{repo_name}: {e}")
+            return content[:2000] + "..."
+
+    @staticmethod
+    def collect_readmes(owner: str, repos: list, access_token: str, target: int = 5, workers: int = 5, deadline: float = 20):
+        """
+        Fetch (and summarize) the READMEs of the first `target` repos that have one, walking
+        `repos` in order. Up to `workers` fetches run at once; a repo without a README is
+        replaced by the next one in line. Returns whatever arrived within `deadline` seconds.
+        :return: Dictionary {index in repos: README text or summary}
+        """
+        readmes = {}
+        if target <= 0 or not repos:
+            return readmes
+
+        # Workers read and write the README cache, so each task runs in an app context
+        app = current_app._get_current_object()
+        def fetch(repo_name):
+            with app.app_context():
+                return AIService.get_repo_readme_content(owner, repo_name, access_token)
+
+        started = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='readme')
+        pending = {}
+        next_index = 0
+        try:
+            # Never more fetches in flight than READMEs still needed, so the kept ones are the top repos
+            while True:
+                while next_index < len(repos) and len(readmes) + len(pending) < target:
+                    repo_name = repos[next_index].get('name')
+                    # A context copy per task keeps LLM calls attributed to the current request
+                    future = pool.submit(copy_context().run, fetch, repo_name)
+                    pending[future] = next_index
+                    next_index += 1
+                if not pending:
+                    break
+
+                remaining = deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    logger.warning(f"README deadline reached for {owner}: {len(readmes)} of {target} collected")
+                    break
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        readme = future.result()
+                    except Exception as e:
+                        # One broken repo must not fail the evaluation; the next one takes its place
+                        logger.error(f"README task failed for {owner}/{repos[index].get('name')}: {e}", exc_info=True)
+                        continue
+                    if readme:
+                        readmes[index] = readme
+        finally:
+            # Late fetches finish in the background; their results are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
+        return readmes
 
     @staticmethod
     def evaluate_profile(user_id: int, criteria: str):
@@ -186,6 +536,7 @@ class AIService:
             return None, "User not found"
 
         oauths = OAuth.query.filter_by(user_id=user_id).all()
+        config = current_app.config
         
         profile_data = {
             "name": user.name,
@@ -202,38 +553,24 @@ class AIService:
                 # Sort by stargazers_count descending
                 sorted_repos = sorted(repos, key=lambda x: x.get('stargazers_count', 0), reverse=True)
                 
+                readmes = {}
+                if oauth.access_token:
+                    readmes = AIService.collect_readmes(
+                        meta.get('login'), sorted_repos, oauth.access_token,
+                        target=config.get('README_TARGET_COUNT', 5),
+                        workers=config.get('README_FETCH_WORKERS', 5),
+                        deadline=config.get('README_FETCH_DEADLINE', 20)
+                    )
+                readme_count = len(readmes)
+
+                # Top 10 repos, extended to the last one whose README was used
+                shown = max([10] + [i + 1 for i in readmes])
                 enhanced_repos = []
-                readme_count = 0
-                target_readmes = 5
-                
-                # Iterate through repos until we find enough with READMEs or run out
-                processed_repos = set()
-                
-                for repo in sorted_repos:
-                    if readme_count >= target_readmes and len(enhanced_repos) >= 10:
-                        break
-                        
+                for i, repo in enumerate(sorted_repos[:shown]):
                     repo_data = repo.copy()
-                    if oauth.access_token and readme_count < target_readmes:
-                        # Extract owner from html_url or assume user login
-                        owner = meta.get('login')
-                        repo_name = repo.get('name')
-                        readme = AIService.get_repo_readme_content(owner, repo_name, oauth.access_token)
-                        if readme:
-                            repo_data['readme_summary'] = readme
-                            readme_count += 1
-                    
+                    if i in readmes:
+                        repo_data['readme_summary'] = readmes[i]
                     enhanced_repos.append(repo_data)
-                    processed_repos.add(repo.get('name'))
-                
-                # Ensure we have at least top 10 repos in the list even if some were skipped or reordered (though logic above preserves order)
-                # If we have fewer than 10, add more from sorted_repos if not already added
-                for repo in sorted_repos:
-                    if len(enhanced_repos) >= 10:
-                        break
-                    if repo.get('name') not in processed_repos:
-                        enhanced_repos.append(repo)
-                        processed_repos.add(repo.get('name'))
 
                 profile_data['github'] = {
                     "login": meta.get('login'),
@@ -287,7 +624,7 @@ class AIService:
         """
         
         try:
-            response = model.invoke(prompt)
+            response = invoke_llm(model, prompt, 'evaluate_profile')
             content = response.content.strip()
             
             # Simple cleanup for markdown code blocks if present
@@ -305,75 +642,66 @@ class AIService:
             logger.error(f"AI Evaluation failed: {e}")
             return None, f"AI Evaluation failed: {str(e)}"
 
+    @staticmethod
+    def run_config(user_id):
+        # The thread keys the conversation history; user_id is read by the tools
+        return {"configurable": {"thread_id": str(user_id), "user_id": user_id}}
+
+    @staticmethod
+    def needs_model(user_input: str) -> bool:
+        """False for messages the fast path answers without calling the model."""
+        if not current_app.config.get('CHAT_FAST_PATH_ENABLED', True):
+            return True
+        return IntentService.match(user_input) is None
+
+    @staticmethod
+    def fast_path_reply(user_input: str, user_id: str):
+        """
+        Templated reply to a simple lookup (see IntentService), or None if the message needs
+        the model. The exchange is added to the conversation history so follow-ups keep context.
+        """
+        if not current_app.config.get('CHAT_FAST_PATH_ENABLED', True):
+            return None
+        answered = IntentService.answer(user_input)
+        if not answered:
+            return None
+
+        _, reply = answered
+        graph = AIService.get_graph()
+        if graph:
+            try:
+                graph.update_state(
+                    AIService.run_config(user_id),
+                    {"messages": [HumanMessage(content=user_input), AIMessage(content=reply)]},
+                    as_node="chatbot"
+                )
+            except Exception as e:
+                logger.warning(f"Could not save fast path reply to the chat history: {e}")
+        return reply
+
     @staticmethod
     def process_chat(user_input: str, user_id: str):
         try:
-            model = AIService.get_model()
-            if not model:
+            reply = AIService.fast_path_reply(user_input, user_id)
+            if reply is not None:
+                return {"response": reply, "action": "chat"}
+
+            graph = AIService.get_graph()
+            if not graph:
                 return {
                     "response": "AI is not configured. Please set GEMINI_API_KEY.",
                     "action": "error"
                 }
 
-            # Convert user_id to int/str consistency
-            user_id_str = str(user_id)
-            
-            # Create tools with user context
-            tools = AIService.create_tools(user_id)
-            
-            # Bind tools to model
-            model_with_tools = model.bind_tools(tools)
-
-            # Define graph state
-            class State(TypedDict):
-                messages: Annotated[list, add_messages]
+            config = AIService.run_config(user_id)
 
-            # Define graph nodes
-            def chatbot(state: State):
-                logger.info(f"Processing messages count: {len(state['messages'])}")
-                
-                # System instructions to enforce behavior
-                system_text = """You are a helpful AI assistant for a Hackathon Club Management platform.
-                
-                PROTOCOL FOR JOINING A CLUB:
-                1. If a user wants to join a club, FIRST call `get_clubs` to retrieve available clubs.
-                2. Present the names of the clubs to the user.
-                3. Ask the user to select a club.
-                4. Once selected, look at the `roles` list for that club from the `get_clubs` data.
-                5. Present the available roles to the user and ask them to choose one.
-                6. ONLY then call `join_club` with the mapped `club_id` and the selected `role`.
-                """
-                
-                messages = [SystemMessage(content=system_text)] + state["messages"]
-                return {"messages": [model_with_tools.invoke(messages)]}
-
-            # Build graph
-            graph_builder = StateGraph(State)
-            graph_builder.add_node("chatbot", chatbot)
-            
-            tool_node = ToolNode(tools)
-            graph_builder.add_node("tools", tool_node)
-            
-            graph_builder.add_conditional_edges(
-                "chatbot",
-                tools_condition,
-            )
-            graph_builder.add_edge("tools", "chatbot")
-            graph_builder.add_edge(START, "chatbot")
-            
-            # Compile graph with memory
-            graph = graph_builder.compile(checkpointer=memory)
-            
-            # Config for this conversation thread
-            config = {"configurable": {"thread_id": user_id_str}}
-            
             # Run graph
-            # We only pass the new message; history is loaded from memory
+            # We only pass the new message; history is loaded from the checkpointer
             events = graph.invoke(
                 {"messages": [HumanMessage(content=user_input)]},
                 config=config
             )
-            
+
             # Get the final response
             last_message = events["messages"][-1]
             
@@ -402,3 +730,55 @@ class AIService:
         except Exception as e:
             logger.error(f"AI Error: {str(e)}", exc_info=True)
             return {"response": f"AI Error: {str(e)}", "action": "error"}
+
+    @staticmethod
+    def stream_chat(user_input: str, user_id: str):
+        """
+        Runs the chat graph and yields (event, data) pairs as it progresses:
+        'token' {text} for each model text chunk, 'tool_start' {tool} / 'tool_end' {tool, status}
+        around tool calls, then 'done' {response, action} or 'error' {response, action}.
+        """
+        try:
+            reply = AIService.fast_path_reply(user_input, user_id)
+        except Exception as e:
+            logger.error(f"AI Error: {str(e)}", exc_info=True)
+            yield "error", {"response": f"AI Error: {str(e)}", "action": "error"}
+            return
+        if reply is not None:
+            yield "token", {"text": reply}
+            yield "done", {"response": reply, "action": "chat"}
+            return
+
+        graph = AIService.get_graph()
+        if not graph:
+            yield "error", {"response": "AI is not configured. Please set GEMINI_API_KEY.", "action": "error"}
+            return
+
+        final_message = None
+        try:
+            for mode, chunk in graph.stream(
+                {"messages": [HumanMessage(content=user_input)]},
+                config=AIService.run_config(user_id),
+                stream_mode=["messages", "updates"]
+            ):
+                if mode == "messages":
+                    message, metadata = chunk
+                    if metadata.get("langgraph_node") == "chatbot" and isinstance(message, AIMessageChunk):
+                        text = message_text(message)
+                        if text:
+                            yield "token", {"text": text}
+                    continue
+
+                for update in chunk.values():
+                    for message in (update or {}).get("messages", []):
+                        if isinstance(message, ToolMessage):
+                            yield "tool_end", {"tool": message.name, "status": message.status}
+                        elif isinstance(message, AIMessage):
+                            for call in message.tool_calls:
+                                yield "tool_start", {"tool": call["name"]}
+                            final_message = message
+
+            yield "done", {"response": message_text(final_message) if final_message else "", "action": "chat"}
+        except Exception as e:
+            logger.error(f"AI Error: {str(e)}", exc_info=True)
+            yield "error", {"response": f"AI Error: {str(e)}", "action": "error"}
@@ -2,6 +2,8 @@ from app.models.announcement import Announcement
 from app.models.event import Event
 from app.models.club import Club
 from app.extensions import db
+from app.serializers import AnnouncementSerializer
+from sqlalchemy import tuple_
 
 class AnnouncementService:
     @staticmethod
@@ -45,11 +47,38 @@ class AnnouncementService:
 
     @staticmethod
     def get_announcements_by_event(event_id):
-        return Announcement.query.filter_by(event_id=event_id).order_by(Announcement.created_at.desc()).all()
+        return Announcement.query.options(*AnnouncementSerializer.load_options()).filter_by(event_id=event_id).order_by(Announcement.created_at.desc()).all()
 
     @staticmethod
     def get_all_announcements():
-        return Announcement.query.order_by(Announcement.created_at.desc()).all()
+        return Announcement.query.options(*AnnouncementSerializer.load_options()).order_by(Announcement.created_at.desc()).all()
+
+    @staticmethod
+    def get_announcements_page(event_id=None, before=None, limit=None):
+        """
+        Retrieve announcements newest first using keyset pagination.
+        :param event_id: Optional event to restrict to
+        :param before: (created_at, id) of the last announcement on the previous page
+        :param limit: Maximum number of announcements to return, or None for all remaining
+        :return: List of Announcement objects, (created_at, id) cursor for the next page or None
+        """
+        query = Announcement.query.options(*AnnouncementSerializer.load_options())
+        if event_id is not None:
+            query = query.filter(Announcement.event_id == event_id)
+        if before:
+            query = query.filter(tuple_(Announcement.created_at, Announcement.id) < tuple_(before[0], before[1]))
+
+        query = query.order_by(Announcement.created_at.desc(), Announcement.id.desc())
+        if limit is None:
+            return query.all(), None
+
+        announcements = query.limit(limit + 1).all()
+        if len(announcements) <= limit:
+            return announcements, None
+
+        announcements = announcements[:limit]
+        last = announcements[-1]
+        return announcements, (last.created_at, last.id)
 
     @staticmethod
     def update_announcement(announcement_id, data, user_id):
@@ -1,8 +1,20 @@
 from app.models.club import Club
-from app.models.club_request import ClubRequest
+from app.models.club_request import ClubRequest, REQUEST_STATUSES
+from app.models.club_membership import ClubMembership
 from app.models.user import User
+from app.models.event import Event
 from app.extensions import db
+from app.serializers import ClubSerializer, EventSerializer, ClubRequestSerializer
+from app.services.event_service import EventService
+from app.services.suggest_service import SuggestService
+from app.utils.pagination import encode_cursor, DEFAULT_PAGE_SIZE
+from app.utils.search import ranked_search
+from sqlalchemy import case, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.attributes import flag_modified
+from datetime import datetime
 import requests
 
 class ClubService:
@@ -26,13 +38,14 @@ class ClubService:
             owner_id=owner_id,
             category=data.get('category'),
             logo_url=data.get('logo_url'),
-            roles=data.get('roles', []),
-            members=[{'user_id': owner_id, 'role': 'owner'}]
+            roles=data.get('roles', [])
         )
+        club.memberships.append(ClubMembership(user_id=owner_id, role='owner'))
         
         try:
             db.session.add(club)
             db.session.commit()
+            SuggestService.index_club(club)
             return club, None
         except Exception as e:
             db.session.rollback()
@@ -40,71 +53,123 @@ class ClubService:
 
     @staticmethod
     def get_all_clubs():
-        return Club.query.all()
+        return Club.query.options(*ClubSerializer.load_options()).all()
 
     @staticmethod
     def get_clubs_by_owner(owner_id):
-        return Club.query.filter_by(owner_id=int(owner_id)).all()
+        return Club.query.options(*ClubSerializer.load_options()).filter_by(owner_id=int(owner_id)).all()
 
     @staticmethod
     def get_club_by_id(club_id):
         return Club.query.get(club_id)
 
     @staticmethod
-    def get_club_with_details(club_id):
+    def get_club_with_details(club_id, viewer_id=None, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Club details with member/event counts, the first page of members and the first page
+        of upcoming events, soonest first. Further pages come from /api/clubs/<id>/members and
+        /api/events?club_id=<id>.
+        """
         club = Club.query.get(club_id)
         if not club:
             return None
-        
-        # Enrich members
-        members_details = []
-        if club.members:
-            # club.members is a list of dicts: [{'user_id': 1, 'role': 'owner'}, ...]
-            user_ids = [int(m['user_id']) for m in club.members]
-            users = User.query.filter(User.id.in_(user_ids)).all()
-            user_map = {u.id: u for u in users}
-            
-            for m in club.members:
-                user = user_map.get(int(m['user_id']))
-                if user:
-                    profile_picture = None
-                    # Try to find avatar from oauth accounts
-                    if user.oauth_accounts:
-                        for acc in user.oauth_accounts:
-                            if acc.meta_data and 'avatar_url' in acc.meta_data:
-                                profile_picture = acc.meta_data['avatar_url']
-                                break
-                                
-                    members_details.append({
-                        'user_id': user.id,
-                        'name': user.name,
-                        'email': user.email,
-                        'role': m['role'],
-                        'profile_picture': profile_picture
-                    })
-        
-        # Events (using relationship)
-        events = [e.to_dict() for e in club.events]
-        
-        result = club.to_dict()
+
+        members_details, members_next = ClubService.get_member_roster(club.id, limit=page_size)
+        events, events_next = EventService.get_events_page(
+            {'club_id': club.id, 'date_from': datetime.utcnow()}, limit=page_size
+        )
+
+        result = club.to_dict(include_members=False)
+        result['member_count'] = ClubService.count_members(club.id)
+        result['event_count'] = db.session.query(func.count(Event.id)).filter(Event.club_id == club.id).scalar()
         result['members_details'] = members_details
-        result['events'] = events
-        
+        result['members_next_cursor'] = encode_cursor(members_next) if members_next else None
+        result['events'] = EventSerializer.dump_many(events)
+        result['events_next_cursor'] = encode_cursor(*events_next) if events_next else None
+        result['is_member'] = viewer_id is not None and ClubService.is_member(club.id, viewer_id)
+
         return result
 
     @staticmethod
-    def search_clubs(query):
+    def get_member_roster(club_id, after_id=None, limit=DEFAULT_PAGE_SIZE, role=None):
+        """
+        One page of a club's members in join order, with avatars from the users table.
+        :param after_id: Membership id of the last member on the previous page
+        :return: List of member dicts, membership id cursor for the next page or None
+        """
+        query = db.session.query(
+            ClubMembership.id, ClubMembership.role,
+            User.id, User.name, User.email, User.avatar_url
+        ).join(User, User.id == ClubMembership.user_id).filter(ClubMembership.club_id == club_id)
+
+        if role:
+            query = query.filter(ClubMembership.role == role)
+        if after_id:
+            query = query.filter(ClubMembership.id > after_id)
+
+        rows = query.order_by(ClubMembership.id).limit(limit + 1).all()
+        next_id = rows[limit - 1][0] if len(rows) > limit else None
+
+        members = [{
+            'user_id': user_id,
+            'name': name,
+            'email': email,
+            'role': member_role,
+            'profile_picture': avatar_url
+        } for _, member_role, user_id, name, email, avatar_url in rows[:limit]]
+        return members, next_id
+
+    @staticmethod
+    def count_members(club_id):
+        return db.session.query(func.count(ClubMembership.id)).filter(ClubMembership.club_id == club_id).scalar()
+
+    @staticmethod
+    def _filtered_query(category=None, options=None):
+        query = Club.query.options(*(ClubSerializer.load_options() if options is None else options))
+        if category:
+            query = query.filter(func.lower(Club.category) == category.lower())
+        return query
+
+    @staticmethod
+    def get_clubs_page(category=None, after=None, limit=None, options=None):
+        """
+        Retrieve clubs ordered by id using keyset pagination.
+        :param category: Optional category (case-insensitive exact match)
+        :param after: id of the last club on the previous page
+        :param limit: Maximum number of clubs to return, or None for all remaining
+        :param options: Loader options, defaults to ClubSerializer.load_options()
+        :return: List of Club objects, id cursor for the next page or None
+        """
+        query = ClubService._filtered_query(category, options)
+        if after:
+            query = query.filter(Club.id > after)
+
+        query = query.order_by(Club.id)
+        if limit is None:
+            return query.all(), None
+
+        clubs = query.limit(limit + 1).all()
+        if len(clubs) <= limit:
+            return clubs, None
+
+        clubs = clubs[:limit]
+        return clubs, clubs[-1].id
+
+    @staticmethod
+    def search_clubs(query, after=None, limit=None, category=None, options=None):
         """
-        Search clubs by name, description, or category.
+        Search clubs by name, category or description, best match first.
         :param query: Search query string
-        :return: List of Club objects
+        :param after: (rank, id) of the last club on the previous page
+        :param limit: Maximum number of clubs to return, or None for all remaining
+        :param category: Optional category (case-insensitive exact match)
+        :param options: Loader options, defaults to ClubSerializer.load_options()
+        :return: List of Club objects, (rank, id) cursor for the next page or None
         """
-        search = f"%{query}%"
-        return Club.query.filter(
-            (Club.name.ilike(search)) |
-            (Club.description.ilike(search)) |
-            (Club.category.ilike(search))
-        ).all()
+        return ranked_search(
+            ClubService._filtered_query(category, options), Club, query,
+            (Club.name, Club.description, Club.category), after=after, limit=limit
+        )
 
     @staticmethod
     def update_club(club_id, data, user_id):
@@ -139,6 +204,7 @@ class ClubService:
 
         try:
             db.session.commit()
+            SuggestService.index_club(club)
             return club, None
         except Exception as e:
             db.session.rollback()
@@ -162,6 +228,7 @@ class ClubService:
             # For now, let's assume standard deletion.
             db.session.delete(club)
             db.session.commit()
+            SuggestService.remove_club(club_id)
             return True, None
         except Exception as e:
             db.session.rollback()
@@ -175,15 +242,9 @@ class ClubService:
             return None, "Club not found"
 
         # Check if already a member
-        members = club.members or []
-        if any(int(m['user_id']) == user_id for m in members):
+        if ClubService.is_member(club_id, user_id):
             return None, "User is already a member"
 
-        # Check if request already exists and is pending
-        existing_req = ClubRequest.query.filter_by(club_id=club_id, user_id=user_id, status='pending').first()
-        if existing_req:
-            return None, "Pending request already exists"
-        
         # Check if role is valid
         if role not in (club.roles or []):
              return None, f"Invalid role: {role}"
@@ -196,16 +257,29 @@ class ClubService:
             status='pending'
         )
 
+        # The partial unique index uq_club_requests_pending allows one pending request per user per club
         try:
             db.session.add(req)
             db.session.commit()
             return req, None
+        except IntegrityError as e:
+            db.session.rollback()
+            if ClubRequest.query.filter_by(club_id=club_id, user_id=user_id, status='pending').first():
+                return None, "Pending request already exists"
+            return None, str(e)
         except Exception as e:
             db.session.rollback()
             return None, str(e)
 
     @staticmethod
-    def get_club_requests(club_id, user_id):
+    def get_club_requests(club_id, user_id, filters=None, after=None, limit=None):
+        """
+        Join requests for a club, oldest first, ordered by (created_at, id).
+        :param filters: Dictionary with optional status, date_from and date_to (on created_at)
+        :param after: (created_at, id) of the last request on the previous page
+        :param limit: Maximum number of requests to return, or None for all remaining
+        :return: (List of ClubRequest objects, (created_at, id) cursor for the next page or None), Error message
+        """
         user_id = int(user_id)
         # user_id must be owner of the club
         club = Club.query.get(club_id)
@@ -217,12 +291,55 @@ class ClubService:
             # For now, strictly owner or admin logic
             return None, "Unauthorized"
 
-        return ClubRequest.query.filter_by(club_id=club_id).all(), None
+        filters = filters or {}
+        query = ClubRequest.query.options(*ClubRequestSerializer.load_options()).filter(ClubRequest.club_id == club_id)
+
+        if filters.get('status'):
+            query = query.filter(ClubRequest.status == filters['status'])
+        if filters.get('date_from'):
+            query = query.filter(ClubRequest.created_at >= filters['date_from'])
+        if filters.get('date_to'):
+            query = query.filter(ClubRequest.created_at <= filters['date_to'])
+        if after:
+            query = query.filter(tuple_(ClubRequest.created_at, ClubRequest.id) > tuple_(after[0], after[1]))
+
+        query = query.order_by(ClubRequest.created_at, ClubRequest.id)
+        if limit is None:
+            return (query.all(), None), None
+
+        # Fetch one extra row to know whether another page exists
+        requests = query.limit(limit + 1).all()
+        if len(requests) <= limit:
+            return (requests, None), None
+
+        requests = requests[:limit]
+        last = requests[-1]
+        return (requests, (last.created_at, last.id)), None
+
+    @staticmethod
+    def get_request_status_counts(club_id, user_id):
+        """Number of join requests per status for a club, from one GROUP BY query."""
+        user_id = int(user_id)
+        club = Club.query.get(club_id)
+        if not club:
+            return None, "Club not found"
+
+        if club.owner_id != user_id:
+            return None, "Unauthorized"
+
+        rows = db.session.query(ClubRequest.status, func.count(ClubRequest.id)).filter(
+            ClubRequest.club_id == club_id
+        ).group_by(ClubRequest.status).all()
+
+        counts = {status: 0 for status in REQUEST_STATUSES}
+        counts.update({status: count for status, count in rows})
+        counts['total'] = sum(count for _, count in rows)
+        return counts, None
 
     @staticmethod
     def get_request_details(request_id, user_id):
         user_id = int(user_id)
-        req = ClubRequest.query.get(request_id)
+        req = ClubRequest.query.options(*ClubRequestSerializer.detail_load_options()).get(request_id)
         if not req:
             return None, "Request not found"
         
@@ -246,27 +363,171 @@ class ClubService:
         if status not in ['accepted', 'rejected']:
              return None, "Invalid status"
 
-        req.status = status
-        req.admin_response = admin_response
-
-        if status == 'accepted':
-            # Add to members
-            members = list(club.members) if club.members else []
-            if not any(int(m['user_id']) == req.user_id for m in members):
-                members.append({'user_id': int(req.user_id), 'role': req.role})
-                club.members = members
-                flag_modified(club, "members")
+        if req.status != 'pending':
+            return None, f"Request already {req.status}"
 
         try:
+            # The status guard lets only one of several simultaneous decisions through: on
+            # PostgreSQL the others wait on the row lock, then find the request no longer pending
+            updated = db.session.query(ClubRequest).filter(
+                ClubRequest.id == req.id,
+                ClubRequest.status == 'pending'
+            ).update({
+                ClubRequest.status: status,
+                ClubRequest.admin_response: admin_response,
+                ClubRequest.updated_at: datetime.utcnow()
+            }, synchronize_session=False)
+            if not updated:
+                db.session.rollback()
+                current = db.session.query(ClubRequest.status).filter(ClubRequest.id == req.id).scalar()
+                return None, f"Request already {current}"
+
+            if status == 'accepted':
+                ClubService.add_member(club.id, req.user_id, req.role)
+
             db.session.commit()
             return req, None
         except Exception as e:
             db.session.rollback()
             return None, str(e)
 
+    @staticmethod
+    def bulk_handle_requests(club_id, decisions, admin_id):
+        """
+        Accept or reject many pending join requests of one club in a single transaction.
+        :param decisions: List of dicts with id, status ('accepted' or 'rejected') and optional admin_response
+        :return: List of per-item results, Error message
+        """
+        admin_id = int(admin_id)
+        club = Club.query.get(club_id)
+        if not club:
+            return None, "Club not found"
+
+        if club.owner_id != admin_id:
+            return None, "Unauthorized"
+
+        ids = [d['id'] for d in decisions if isinstance(d.get('id'), int)]
+        # Lock the affected request rows until commit so a concurrent decision can't slip in between
+        pending = {
+            req_id: (user_id, role, status)
+            for req_id, user_id, role, status in db.session.query(
+                ClubRequest.id, ClubRequest.user_id, ClubRequest.role, ClubRequest.status
+            ).filter(ClubRequest.club_id == club_id, ClubRequest.id.in_(ids)).with_for_update().all()
+        }
+
+        results = []
+        statuses = {}
+        responses = {}
+        accepted = {}
+        for d in decisions:
+            req_id = d.get('id')
+            status = d.get('status')
+            if not isinstance(req_id, int) or req_id not in pending:
+                results.append({'id': req_id, 'success': False, 'error': "Request not found"})
+                continue
+            if status not in ['accepted', 'rejected']:
+                results.append({'id': req_id, 'success': False, 'error': "Invalid status"})
+                continue
+            if req_id in statuses:
+                results.append({'id': req_id, 'success': False, 'error': "Duplicate decision"})
+                continue
+            user_id, role, current_status = pending[req_id]
+            if current_status != 'pending':
+                results.append({'id': req_id, 'success': False, 'error': f"Request already {current_status}"})
+                continue
+
+            statuses[req_id] = status
+            responses[req_id] = d.get('admin_response')
+            if status == 'accepted':
+                accepted.setdefault(user_id, role)
+            results.append({'id': req_id, 'success': True, 'status': status})
+
+        if not statuses:
+            return results, None
+
+        try:
+            # One UPDATE for every decision; the status guard keeps a concurrent decision from being overwritten
+            db.session.query(ClubRequest).filter(
+                ClubRequest.id.in_(list(statuses)),
+                ClubRequest.status == 'pending'
+            ).update({
+                ClubRequest.status: case(statuses, value=ClubRequest.id),
+                ClubRequest.admin_response: case(responses, value=ClubRequest.id),
+                ClubRequest.updated_at: datetime.utcnow()
+            }, synchronize_session=False)
+
+            ClubService.add_members(club_id, accepted)
+
+            db.session.commit()
+            return results, None
+        except Exception as e:
+            db.session.rollback()
+            return None, str(e)
+
+    @staticmethod
+    def is_member(club_id, user_id):
+        """Checks membership with a single lookup on the (club_id, user_id) unique index."""
+        return db.session.query(ClubMembership.id).filter_by(
+            club_id=club_id, user_id=int(user_id)
+        ).first() is not None
+
+    @staticmethod
+    def add_member(club_id, user_id, role):
+        """
+        Adds a membership unless the user is already a member.
+        The caller is responsible for committing.
+        :return: True if a membership was inserted
+        """
+        return ClubService.add_members(club_id, {int(user_id): role}) == 1
+
+    @staticmethod
+    def add_members(club_id, members):
+        """
+        Inserts memberships for a {user_id: role} dict in one statement, skipping existing members.
+        INSERT ... ON CONFLICT DO NOTHING on the (club_id, user_id) unique constraint makes this
+        atomic, so concurrent accepts can neither lose nor duplicate a member.
+        The caller is responsible for committing.
+        :return: Number of memberships inserted
+        """
+        if not members:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [
+            {'club_id': club_id, 'user_id': int(user_id), 'role': role, 'created_at': now}
+            for user_id, role in members.items()
+        ]
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            stmt = postgresql_insert(ClubMembership.__table__)
+        elif dialect == 'sqlite':
+            stmt = sqlite_insert(ClubMembership.__table__)
+        else:
+            # No ON CONFLICT support: insert row by row, each in its own savepoint
+            inserted = 0
+            for row in rows:
+                try:
+                    with db.session.begin_nested():
+                        db.session.execute(ClubMembership.__table__.insert(), row)
+                    inserted += 1
+                except IntegrityError:
+                    pass
+            return inserted
+
+        stmt = stmt.values(rows).on_conflict_do_nothing(index_elements=['club_id', 'user_id'])
+        return db.session.execute(stmt).rowcount
+
+    @staticmethod
+    def get_member_clubs(user_id):
+        """Returns the clubs a user belongs to via the user_id index on club_memberships."""
+        return Club.query.options(*ClubSerializer.load_options()).join(
+            ClubMembership, ClubMembership.club_id == Club.id
+        ).filter(ClubMembership.user_id == int(user_id)).order_by(Club.name).all()
+
     @staticmethod
     def get_user_requests(user_id):
-        return ClubRequest.query.filter_by(user_id=int(user_id)).all()
+        return ClubRequest.query.options(*ClubRequestSerializer.load_options()).filter_by(user_id=int(user_id)).all()
 
     @staticmethod
     def get_user_github_repos(request_id, admin_id):
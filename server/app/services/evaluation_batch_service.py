@@ -0,0 +1,251 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import and_, func, insert, or_
+from sqlalchemy.orm import joinedload
+from app.extensions import db
+from app.models.club import Club
+from app.models.club_request import ClubRequest
+from app.models.evaluation_batch import EvaluationBatch, EvaluationBatchItem
+from app.services.evaluation_service import EvaluationService
+from app.services.job_service import JobService, job_handler
+from app.utils.llm_admission import llm_admission
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+def _score(result):
+    try:
+        return float(result.get('score'))
+    except (TypeError, ValueError):
+        return None
+
+class EvaluationBatchService:
+    """
+    Evaluates all pending applicants of a club in the background. Each batch runs as an
+    'evaluation_batch' job with at most EVALUATION_BATCH_CONCURRENCY evaluations in flight;
+    applicants with a stored evaluation for the same criteria are filled in without calling
+    the model. Progress and results live in the database, so any worker can answer polls,
+    and a batch whose worker died resumes from its pending items when the job is retried.
+    """
+
+    @staticmethod
+    def create_batch(club_id, criteria, user_id, force_refresh=False):
+        """
+        Queue an evaluation of every pending request of a club and start it.
+        :return: EvaluationBatch or None, Error message
+        """
+        user_id = int(user_id)
+        criteria = (criteria or '').strip()
+        if not criteria:
+            return None, "Criteria is required"
+
+        club = Club.query.get(club_id)
+        if not club:
+            return None, "Club not found"
+        if club.owner_id != user_id:
+            return None, "Unauthorized"
+
+        active = EvaluationBatch.query.filter(
+            EvaluationBatch.club_id == club_id, EvaluationBatch.status.in_(ACTIVE_STATUSES)
+        ).first()
+        if active:
+            return None, f"Evaluation batch {active.id} is already running for this club"
+
+        pending = db.session.query(ClubRequest.id, ClubRequest.user_id).filter_by(
+            club_id=club_id, status='pending'
+        ).order_by(ClubRequest.created_at, ClubRequest.id).all()
+
+        batch = EvaluationBatch(
+            club_id=club_id,
+            created_by=user_id,
+            criteria=criteria,
+            force_refresh=bool(force_refresh),
+            total=len(pending)
+        )
+        try:
+            db.session.add(batch)
+            db.session.flush()
+            if pending:
+                # One multi-row insert rather than a flush per item
+                db.session.execute(insert(EvaluationBatchItem), [
+                    {'batch_id': batch.id, 'request_id': r.id, 'user_id': r.user_id, 'status': 'pending'}
+                    for r in pending
+                ])
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return None, str(e)
+
+        JobService.enqueue('evaluation_batch', {'batch_id': batch.id}, user_id=user_id)
+        return batch, None
+
+    @staticmethod
+    def run_batch(app, batch_id):
+        """Runs a queued (or interrupted) batch to completion or cancellation. Blocks until done."""
+        with app.app_context():
+            claimed = EvaluationBatch.query.filter(
+                EvaluationBatch.id == batch_id, EvaluationBatch.status.in_(ACTIVE_STATUSES)
+            ).update({
+                'status': 'running',
+                'started_at': func.coalesce(EvaluationBatch.started_at, datetime.utcnow())
+            }, synchronize_session=False)
+            db.session.commit()
+            if not claimed:
+                # Cancelled before it started
+                if EvaluationBatchService._is_cancelled(batch_id):
+                    EvaluationBatchService._finish(batch_id)
+                return
+
+            batch = EvaluationBatch.query.get(batch_id)
+            criteria, force_refresh, owner_id = batch.criteria, batch.force_refresh, batch.created_by
+            items = db.session.query(EvaluationBatchItem.id, EvaluationBatchItem.user_id).filter_by(
+                batch_id=batch_id, status='pending'
+            ).order_by(EvaluationBatchItem.id).all()
+            concurrency = max(1, app.config.get('EVALUATION_BATCH_CONCURRENCY', 4))
+
+            pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f'evaluation-{batch_id}')
+            in_flight = set()
+            error = None
+            try:
+                for item_id, user_id in items:
+                    if EvaluationBatchService._is_cancelled(batch_id):
+                        break
+                    if not force_refresh:
+                        cached = EvaluationService.get_cached(user_id, criteria)
+                        if cached:
+                            EvaluationBatchService._record(batch_id, item_id, 'cached', result=cached.to_dict())
+                            continue
+                    if len(in_flight) >= concurrency:
+                        _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    in_flight.add(pool.submit(
+                        EvaluationBatchService._evaluate_item, app, batch_id, item_id, user_id, criteria, force_refresh, owner_id
+                    ))
+                wait(in_flight)
+            except Exception as e:
+                logger.error(f"Evaluation batch {batch_id} failed: {e}")
+                db.session.rollback()
+                error = str(e)
+            finally:
+                pool.shutdown(wait=True)
+
+            EvaluationBatchService._finish(batch_id, error)
+
+    @staticmethod
+    def _finish(batch_id, error=None):
+        # Items that were never started (cancelled or failed batch) are marked so
+        EvaluationBatchItem.query.filter_by(batch_id=batch_id, status='pending').update(
+            {'status': 'cancelled'}, synchronize_session=False
+        )
+        # A cancel that arrived meanwhile wins over 'completed'
+        EvaluationBatch.query.filter_by(id=batch_id, status='running').update({
+            'status': 'failed' if error else 'completed',
+            'error': error
+        }, synchronize_session=False)
+        EvaluationBatch.query.filter_by(id=batch_id).update({'finished_at': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+
+    @staticmethod
+    def _evaluate_item(app, batch_id, item_id, user_id, criteria, force_refresh, owner_id):
+        with app.app_context():
+            try:
+                # Batch threads take model slots as the owner's background work, so a batch
+                # stays within the owner's per-user cap and leaves room for everyone else
+                with llm_admission.acquire(owner_id, background=True):
+                    result, error = EvaluationService.evaluate(user_id, criteria, force_refresh=force_refresh)
+            except Exception as e:
+                db.session.rollback()
+                result, error = None, str(e)
+            if error:
+                EvaluationBatchService._record(batch_id, item_id, 'failed', error=error)
+            else:
+                EvaluationBatchService._record(batch_id, item_id, 'evaluated', result=result)
+
+    @staticmethod
+    def _record(batch_id, item_id, status, result=None, error=None):
+        """Stores an item's outcome and bumps the batch counter in one transaction."""
+        EvaluationBatchItem.query.filter_by(id=item_id).update({
+            'status': status,
+            'result': result,
+            'score': _score(result) if result else None,
+            'error': error,
+            'updated_at': datetime.utcnow()
+        }, synchronize_session=False)
+        counter = {
+            'evaluated': EvaluationBatch.evaluated,
+            'cached': EvaluationBatch.cached,
+            'failed': EvaluationBatch.failed
+        }[status]
+        EvaluationBatch.query.filter_by(id=batch_id).update({counter: counter + 1}, synchronize_session=False)
+        db.session.commit()
+
+    @staticmethod
+    def _is_cancelled(batch_id):
+        return db.session.query(EvaluationBatch.status).filter_by(id=batch_id).scalar() == 'cancelled'
+
+    @staticmethod
+    def get_batch(batch_id, user_id):
+        """
+        :return: EvaluationBatch or None, Error message
+        """
+        batch = EvaluationBatch.query.get(batch_id)
+        if not batch:
+            return None, "Batch not found"
+        club = Club.query.get(batch.club_id)
+        if not club or club.owner_id != int(user_id):
+            return None, "Unauthorized"
+        return batch, None
+
+    @staticmethod
+    def get_results(batch_id, after=None, limit=None):
+        """
+        Scored items of a batch, best score first, using keyset pagination.
+        :param after: (score, id) of the last item on the previous page
+        :return: List of EvaluationBatchItem objects, (score, id) cursor for the next page or None
+        """
+        query = EvaluationBatchItem.query.options(joinedload(EvaluationBatchItem.user)).filter(
+            EvaluationBatchItem.batch_id == batch_id, EvaluationBatchItem.score.isnot(None)
+        )
+        if after:
+            query = query.filter(or_(
+                EvaluationBatchItem.score < after[0],
+                and_(EvaluationBatchItem.score == after[0], EvaluationBatchItem.id > after[1])
+            ))
+
+        query = query.order_by(EvaluationBatchItem.score.desc(), EvaluationBatchItem.id)
+        if limit is None:
+            return query.all(), None
+
+        items = query.limit(limit + 1).all()
+        if len(items) <= limit:
+            return items, None
+
+        items = items[:limit]
+        return items, (items[-1].score, items[-1].id)
+
+    @staticmethod
+    def cancel_batch(batch_id, user_id):
+        """
+        Stop a batch. Evaluations already in flight finish; the rest are marked cancelled.
+        :return: EvaluationBatch or None, Error message
+        """
+        batch, error = EvaluationBatchService.get_batch(batch_id, user_id)
+        if error:
+            return None, error
+        if batch.status not in ACTIVE_STATUSES:
+            return None, f"Batch is already {batch.status}"
+
+        EvaluationBatch.query.filter(
+            EvaluationBatch.id == batch_id, EvaluationBatch.status.in_(ACTIVE_STATUSES)
+        ).update({'status': 'cancelled'}, synchronize_session=False)
+        db.session.commit()
+        db.session.refresh(batch)
+        return batch, None
+
+@job_handler('evaluation_batch')
+def run_batch_job(payload):
+    EvaluationBatchService.run_batch(current_app._get_current_object(), payload['batch_id'])
+    batch = EvaluationBatch.query.get(payload['batch_id'])
+    return {'batch_id': payload['batch_id'], 'status': batch.status if batch else None}
@@ -0,0 +1,118 @@
+import hashlib
+import json
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models.candidate_evaluation import CandidateEvaluation
+from app.models.oauth import OAuth
+from app.models.user import User
+from app.services.ai_service import AIService
+from app.services.job_service import JobError, job_handler
+from app.utils.llm_admission import llm_admission
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class EvaluationService:
+    """
+    Memoizes AIService.evaluate_profile. Results are stored per (user, profile fingerprint,
+    normalized criteria) and served until the user's profile or OAuth data changes.
+    """
+
+    @staticmethod
+    def normalize_criteria(criteria):
+        """Case and whitespace do not change what is being asked for."""
+        return ' '.join(criteria.lower().split())
+
+    @staticmethod
+    def profile_fingerprint(user_id):
+        """
+        Hash of the profile data an evaluation is built from.
+        :return: Hex digest or None if the user does not exist
+        """
+        user = User.query.get(user_id)
+        if not user:
+            return None
+        oauths = OAuth.query.filter_by(user_id=user_id).order_by(OAuth.provider).all()
+        payload = {
+            'name': user.name,
+            'email': user.email,
+            'accounts': [{'provider': o.provider, 'meta_data': o.meta_data} for o in oauths]
+        }
+        return _sha256(json.dumps(payload, sort_keys=True, default=str))
+
+    @staticmethod
+    def get_cached(user_id, criteria, fingerprint=None):
+        """
+        Stored evaluation of the user's current profile against `criteria`.
+        :return: CandidateEvaluation or None
+        """
+        fingerprint = fingerprint or EvaluationService.profile_fingerprint(user_id)
+        if not fingerprint:
+            return None
+        return CandidateEvaluation.query.filter_by(
+            user_id=user_id,
+            profile_hash=fingerprint,
+            criteria_hash=_sha256(EvaluationService.normalize_criteria(criteria))
+        ).first()
+
+    @staticmethod
+    def evaluate(user_id, criteria, force_refresh=False):
+        """
+        Evaluate a user against `criteria`, reusing the stored result unless `force_refresh`.
+        :return: Result dictionary (with 'cached' and 'evaluated_at'), Error message
+        """
+        fingerprint = EvaluationService.profile_fingerprint(user_id)
+        if not fingerprint:
+            return None, "User not found"
+
+        if not force_refresh:
+            cached = EvaluationService.get_cached(user_id, criteria, fingerprint)
+            if cached:
+                return cached.to_dict(), None
+
+        result, error = AIService.evaluate_profile(user_id, criteria)
+        if error:
+            return None, error
+
+        normalized = EvaluationService.normalize_criteria(criteria)
+        criteria_hash = _sha256(normalized)
+        # One stored result per user and criteria: older fingerprints and a forced refresh replace it
+        CandidateEvaluation.query.filter_by(user_id=user_id, criteria_hash=criteria_hash).delete(synchronize_session=False)
+        evaluation = CandidateEvaluation(
+            user_id=user_id,
+            profile_hash=fingerprint,
+            criteria_hash=criteria_hash,
+            criteria=normalized,
+            result=result,
+            created_at=datetime.utcnow()
+        )
+        db.session.add(evaluation)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent evaluation of the same candidate stored its result first
+            db.session.rollback()
+
+        return {**result, 'cached': False, 'evaluated_at': evaluation.created_at.isoformat()}, None
+
+    @staticmethod
+    def invalidate_user(user_id):
+        """Drops the user's stored evaluations. Runs in the caller's transaction; the caller commits."""
+        CandidateEvaluation.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+
+@job_handler('evaluate_candidate')
+def run_evaluation_job(payload):
+    user_id, criteria = payload['user_id'], payload['criteria']
+    force_refresh = payload.get('force_refresh', False)
+    cached = None if force_refresh else EvaluationService.get_cached(user_id, criteria)
+    if cached:
+        return cached.to_dict()
+
+    # Counted against the model budget and the requesting owner's per-user cap, like a sync evaluation
+    with llm_admission.acquire(payload.get('requested_by') or 'jobs', background=True):
+        result, error = EvaluationService.evaluate(user_id, criteria, force_refresh=force_refresh)
+    if error:
+        # A missing user will not appear on retry; model and network errors may clear up
+        raise JobError(error, retry=error != "User not found")
+    return result
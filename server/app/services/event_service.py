@@ -1,8 +1,13 @@
 from app.models.event import Event
 from app.models.club import Club
 from app.models.user import User
+from app.models.club_membership import ClubMembership
 from app.extensions import db
+from app.serializers import EventSerializer
+from app.utils.search import ranked_search
+from app.services.suggest_service import SuggestService
 from datetime import datetime, timezone
+from sqlalchemy import or_, tuple_
 
 class EventService:
     @staticmethod
@@ -75,6 +80,7 @@ class EventService:
 
             db.session.add(new_event)
             db.session.commit()
+            SuggestService.index_event(new_event)
             return new_event, None
         except Exception as e:
             db.session.rollback()
@@ -86,7 +92,64 @@ class EventService:
         Retrieve all events.
         :return: List of Event objects
         """
-        return Event.query.all()
+        return Event.query.options(*EventSerializer.load_options()).all()
+
+    @staticmethod
+    def _filtered_query(filters, options=None):
+        """
+        Event query with the listing filters applied.
+        :param filters: Dictionary with optional status, club_id, member_id, date_from, date_to and fee ('free' or 'paid')
+        :param options: Loader options, defaults to EventSerializer.load_options()
+        """
+        filters = filters or {}
+        query = Event.query.options(*(EventSerializer.load_options() if options is None else options))
+
+        if filters.get('status'):
+            query = query.filter(Event.status == filters['status'])
+        if filters.get('club_id') is not None:
+            query = query.filter(Event.club_id == filters['club_id'])
+        if filters.get('member_id') is not None:
+            # Events of clubs the user belongs to, via the user_id index on club_memberships
+            query = query.join(ClubMembership, ClubMembership.club_id == Event.club_id).filter(
+                ClubMembership.user_id == int(filters['member_id'])
+            )
+        if filters.get('date_from'):
+            query = query.filter(Event.start_date >= filters['date_from'])
+        if filters.get('date_to'):
+            query = query.filter(Event.start_date <= filters['date_to'])
+        if filters.get('fee') == 'free':
+            query = query.filter(or_(Event.fee == 0, Event.fee.is_(None)))
+        elif filters.get('fee') == 'paid':
+            query = query.filter(Event.fee > 0)
+        return query
+
+    @staticmethod
+    def get_events_page(filters=None, after=None, limit=None, options=None):
+        """
+        Retrieve events ordered by (start_date, id) using keyset pagination.
+        :param filters: Dictionary with optional status, club_id, member_id, date_from, date_to and fee ('free' or 'paid')
+        :param after: (start_date, id) of the last event on the previous page
+        :param limit: Maximum number of events to return, or None for all remaining
+        :param options: Loader options, defaults to EventSerializer.load_options()
+        :return: List of Event objects, (start_date, id) cursor for the next page or None
+        """
+        query = EventService._filtered_query(filters, options)
+
+        if after:
+            query = query.filter(tuple_(Event.start_date, Event.id) > tuple_(after[0], after[1]))
+
+        query = query.order_by(Event.start_date, Event.id)
+        if limit is None:
+            return query.all(), None
+
+        # Fetch one extra row to know whether another page exists
+        events = query.limit(limit + 1).all()
+        if len(events) <= limit:
+            return events, None
+
+        events = events[:limit]
+        last = events[-1]
+        return events, (last.start_date, last.id)
 
     @staticmethod
     def get_event_by_id(event_id):
@@ -95,21 +158,23 @@ class EventService:
         :param event_id: ID of the event
         :return: Event object or None
         """
-        return Event.query.get(event_id)
+        return Event.query.options(*EventSerializer.load_options()).get(event_id)
 
     @staticmethod
-    def search_events(query):
+    def search_events(query, after=None, limit=None, filters=None, options=None):
         """
-        Search events by title, description, or location.
+        Search events by title, location or description, best match first.
         :param query: Search query string
-        :return: List of Event objects
+        :param after: (rank, id) of the last event on the previous page
+        :param limit: Maximum number of events to return, or None for all remaining
+        :param filters: Same filters as get_events_page
+        :param options: Loader options, defaults to EventSerializer.load_options()
+        :return: List of Event objects, (rank, id) cursor for the next page or None
         """
-        search = f"%{query}%"
-        return Event.query.filter(
-            (Event.title.ilike(search)) |
-            (Event.description.ilike(search)) |
-            (Event.location.ilike(search))
-        ).all()
+        return ranked_search(
+            EventService._filtered_query(filters, options), Event, query,
+            (Event.title, Event.description, Event.location), after=after, limit=limit
+        )
 
     @staticmethod
     def update_event(event_id, data, user_id):
@@ -172,6 +237,7 @@ class EventService:
                     event.status = 'completed'
 
             db.session.commit()
+            SuggestService.index_event(event)
             return event, None
         except Exception as e:
             db.session.rollback()
@@ -201,6 +267,7 @@ class EventService:
         try:
             db.session.delete(event)
             db.session.commit()
+            SuggestService.remove_event(event_id)
             return True, None
         except Exception as e:
             db.session.rollback()
@@ -0,0 +1,200 @@
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+from app.services.club_service import ClubService
+from app.services.event_service import EventService
+from app.services.announcement_service import AnnouncementService
+from app.serializers import ClubSerializer, EventSerializer, AnnouncementSerializer
+
+logger = logging.getLogger(__name__)
+
+# Items listed in a templated reply; longer lists point the user at the assistant
+FAST_PATH_PAGE_SIZE = 10
+
+# Courtesy words around a request do not change it. Anything else left over after
+# stripping them must match an intent pattern exactly, so "clubs about robotics" or
+# "events I can join" still go to the model.
+_POLITE_PREFIX = re.compile(
+    r'^(?:(?:hi|hey|hello|please|pls|ok|okay|so)\s+)*'
+    r'(?:(?:can|could|would|will) you\s+|i want to\s+|i(?:\'d| would) like to\s+)?'
+    r'(?:please\s+)?'
+)
+_POLITE_SUFFIX = re.compile(r'(?:\s+(?:please|pls|thanks|thank you))+$')
+_PUNCTUATION = re.compile(r'[^\w\s\']')
+
+_LIST = r'(?:list|show|show me|see|view|get|give me|tell me|display)'
+_ALL = r'(?:(?:all|all of)\s+)?(?:the\s+)?'
+
+INTENT_PATTERNS = {
+    'list_clubs': [
+        rf'(?:{_LIST}\s+)?{_ALL}(?:available\s+)?clubs',
+        r'(?:what|which) clubs (?:are there|are available|exist|do you have|can i join)',
+        r'what clubs',
+    ],
+    'upcoming_events': [
+        rf'(?:{_LIST}\s+)?{_ALL}(?:upcoming|next|future)?\s*events',
+        r'(?:what|which|any) events (?:are )?(?:coming up|upcoming|are there|are on|soon)',
+        r'what(?:\'s| is) (?:coming up|happening|on)',
+        r'what events',
+    ],
+    'announcements': [
+        rf'(?:{_LIST}\s+)?{_ALL}(?:latest|recent|new)?\s*announcements',
+        r'(?:are there )?any (?:new )?announcements',
+        r'what(?:\'s| is) new',
+    ],
+}
+_COMPILED = {
+    intent: [re.compile(pattern) for pattern in patterns]
+    for intent, patterns in INTENT_PATTERNS.items()
+}
+
+_stats_lock = threading.Lock()
+_stats = Counter()
+
+def normalize_message(text):
+    """Lowercases, drops punctuation and courtesy words: "Could you list clubs, please?" -> "list clubs"."""
+    text = _PUNCTUATION.sub(' ', (text or '').lower().replace('\u2019', "'"))
+    text = ' '.join(text.split())
+    text = _POLITE_PREFIX.sub('', text)
+    return _POLITE_SUFFIX.sub('', text).strip()
+
+class IntentService:
+    """
+    Answers chat messages that are plain lookups (list clubs, upcoming events, latest
+    announcements) from the database with a templated reply, saving the model round
+    trips. Messages that do not match an intent exactly return None and go to the model.
+    """
+
+    @staticmethod
+    def match(text):
+        """
+        :return: Intent name or None
+        """
+        normalized = normalize_message(text)
+        if not normalized:
+            return None
+        for intent, patterns in _COMPILED.items():
+            if any(p.fullmatch(normalized) for p in patterns):
+                return intent
+        return None
+
+    @staticmethod
+    def answer(text):
+        """
+        Templated reply to a simple lookup, recording whether the fast path was taken.
+        :return: (intent, reply) or None if the message needs the model
+        """
+        intent = IntentService.match(text)
+        reply = None
+        if intent:
+            try:
+                reply = _ANSWERS[intent]()
+            except Exception as e:
+                logger.error(f"Fast path for intent '{intent}' failed, using the model: {e}")
+                intent = None
+
+        IntentService._record(intent)
+        return (intent, reply) if intent else None
+
+    @staticmethod
+    def _record(intent):
+        with _stats_lock:
+            _stats['messages'] += 1
+            if intent:
+                _stats['fast_path'] += 1
+                _stats[f'intent:{intent}'] += 1
+            messages, hits = _stats['messages'], _stats['fast_path']
+        logger.info(json.dumps({
+            'event': 'chat_intent',
+            'intent': intent,
+            'fast_path': bool(intent),
+            'hit_rate': round(hits / messages, 4)
+        }))
+
+    @staticmethod
+    def stats():
+        """Fast path hits in this process: {messages, fast_path, hit_rate, intents}."""
+        with _stats_lock:
+            messages, hits = _stats['messages'], _stats['fast_path']
+            intents = {
+                key.split(':', 1)[1]: n for key, n in _stats.items() if key.startswith('intent:')
+            }
+        return {
+            'messages': messages,
+            'fast_path': hits,
+            'hit_rate': round(hits / messages, 4) if messages else 0.0,
+            'intents': intents
+        }
+
+    @staticmethod
+    def reset_stats():
+        with _stats_lock:
+            _stats.clear()
+
+def _more(next_key, hint):
+    return f"\n\nThere are more. {hint}" if next_key else ""
+
+def _list_clubs():
+    clubs, next_key = ClubService.get_clubs_page(
+        limit=FAST_PATH_PAGE_SIZE, options=ClubSerializer.compact_load_options()
+    )
+    if not clubs:
+        return "There are no clubs yet. Would you like to create one?"
+
+    lines = []
+    for club in map(ClubSerializer.dump_compact, clubs):
+        line = f"- {club['name']} ({club['category']})"
+        if club['roles']:
+            line += f", roles: {', '.join(club['roles'])}"
+        lines.append(line)
+    return (
+        "Here are the clubs:\n" + "\n".join(lines)
+        + _more(next_key, "Tell me a name or category to narrow it down.")
+        + "\n\nWant to join one? Tell me the club and the role."
+    )
+
+def _upcoming_events():
+    events, next_key = EventService.get_events_page(
+        {'date_from': datetime.utcnow()}, limit=FAST_PATH_PAGE_SIZE, options=EventSerializer.compact_load_options()
+    )
+    if not events:
+        return "There are no upcoming events right now."
+
+    lines = []
+    for event in map(EventSerializer.dump_compact, events):
+        start = datetime.fromisoformat(event['start_date']).strftime('%b %d, %Y %H:%M')
+        line = f"- {event['title']}"
+        if event['club_name']:
+            line += f" by {event['club_name']}"
+        line += f", {start}"
+        if event['location']:
+            line += f" at {event['location']}"
+        line += ", free" if not event['fee'] else f", fee {event['fee']:g}"
+        lines.append(line)
+    return "Upcoming events:\n" + "\n".join(lines) + _more(
+        next_key, "Ask about a club or topic to narrow it down."
+    )
+
+def _announcements():
+    announcements, next_key = AnnouncementService.get_announcements_page(limit=FAST_PATH_PAGE_SIZE)
+    if not announcements:
+        return "There are no announcements yet."
+
+    lines = []
+    for announcement in map(AnnouncementSerializer.dump_compact, announcements):
+        line = f"- {announcement['title']}"
+        if announcement['event_title']:
+            line += f" ({announcement['event_title']})"
+        lines.append(f"{line}: {announcement['content']}")
+    return "Latest announcements:\n" + "\n".join(lines) + _more(
+        next_key, "Ask about an event to see its announcements."
+    )
+
+_ANSWERS = {
+    'list_clubs': _list_clubs,
+    'upcoming_events': _upcoming_events,
+    'announcements': _announcements,
+}
@@ -0,0 +1,169 @@
+import logging
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import select
+from app.extensions import db
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Job type -> handler(payload) returning a JSON-serializable result. Services register
+# their handlers with @job_handler where the work is defined.
+_handlers = {}
+
+def job_handler(name):
+    def register(func):
+        _handlers[name] = func
+        return func
+    return register
+
+class JobError(Exception):
+    """Raised by a handler to fail the current attempt; retry=False fails the job outright."""
+
+    def __init__(self, message, retry=True):
+        super().__init__(message)
+        self.retry = retry
+
+class JobService:
+    @staticmethod
+    def enqueue(job_type, payload=None, user_id=None, max_attempts=None, delay=0):
+        """
+        Queue a job for the worker pool.
+        :param job_type: Name a handler was registered under
+        :param payload: JSON-serializable handler argument
+        :param user_id: User allowed to read the job's status and result
+        :param delay: Seconds before the job may run
+        :return: Job
+        """
+        if job_type not in _handlers:
+            raise ValueError(f"No handler registered for job type '{job_type}'")
+        job = Job(
+            type=job_type,
+            payload=payload or {},
+            max_attempts=max_attempts or current_app.config.get('JOB_MAX_ATTEMPTS', 3),
+            run_at=datetime.utcnow() + timedelta(seconds=delay),
+            created_by=int(user_id) if user_id is not None else None
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    @staticmethod
+    def get_job(job_id, user_id):
+        """
+        Only the user who queued a job can read it: results hold other users' evaluations and
+        account data, and is_admin is set for every club leader.
+        :return: Job or None, Error message
+        """
+        job = Job.query.get(job_id)
+        if not job:
+            return None, "Job not found"
+        if job.created_by != int(user_id):
+            return None, "Unauthorized"
+        return job, None
+
+    @staticmethod
+    def claim(worker_id):
+        """
+        Takes the next due job, marking it running. Safe to call from many workers at once.
+        :return: Job or None if nothing is due
+        """
+        now = datetime.utcnow()
+        candidates = (
+            select(Job.id)
+            .where(Job.status == 'queued', Job.run_at <= now)
+            .order_by(Job.run_at, Job.id)
+            .limit(5)
+        )
+        if db.engine.dialect.name == 'postgresql':
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        for job_id in db.session.execute(candidates).scalars().all():
+            # The status check makes the claim atomic where SKIP LOCKED is unavailable
+            claimed = Job.query.filter_by(id=job_id, status='queued').update({
+                'status': 'running',
+                'locked_by': worker_id,
+                'locked_at': now,
+                'attempts': Job.attempts + 1,
+                'updated_at': now
+            }, synchronize_session=False)
+            if claimed:
+                db.session.commit()
+                return Job.query.get(job_id)
+        db.session.commit()
+        return None
+
+    @staticmethod
+    def run(job):
+        """Runs a claimed job's handler and records the outcome."""
+        handler = _handlers.get(job.type)
+        job_id, attempts, max_attempts = job.id, job.attempts, job.max_attempts
+        try:
+            if not handler:
+                raise JobError(f"No handler registered for job type '{job.type}'", retry=False)
+            result = handler(job.payload or {})
+        except Exception as e:
+            db.session.rollback()
+            retry = getattr(e, 'retry', True) and attempts < max_attempts
+            JobService._record_failure(job_id, str(e) or e.__class__.__name__, attempts, retry)
+            return False
+
+        now = datetime.utcnow()
+        Job.query.filter_by(id=job_id).update({
+            'status': 'succeeded',
+            'result': result,
+            'error': None,
+            'locked_by': None,
+            'locked_at': None,
+            'updated_at': now,
+            'finished_at': now
+        }, synchronize_session=False)
+        db.session.commit()
+        return True
+
+    @staticmethod
+    def _record_failure(job_id, error, attempts, retry):
+        now = datetime.utcnow()
+        values = {'error': error, 'locked_by': None, 'locked_at': None, 'updated_at': now}
+        if retry:
+            # Exponential backoff: base, 2 x base, 4 x base, ...
+            backoff = current_app.config.get('JOB_RETRY_BACKOFF', 5) * 2 ** (attempts - 1)
+            values.update(status='queued', run_at=now + timedelta(seconds=backoff))
+            logger.warning(f"Job {job_id} attempt {attempts} failed, retrying in {backoff}s: {error}")
+        else:
+            values.update(status='failed', finished_at=now)
+            logger.error(f"Job {job_id} failed after {attempts} attempt(s): {error}")
+        Job.query.filter_by(id=job_id).update(values, synchronize_session=False)
+        db.session.commit()
+
+    @staticmethod
+    def heartbeat(job_ids, worker_id):
+        """Refreshes the lock of jobs this worker is still running so they are not seen as stale."""
+        if not job_ids:
+            return
+        Job.query.filter(Job.id.in_(job_ids), Job.status == 'running', Job.locked_by == worker_id).update(
+            {'locked_at': datetime.utcnow()}, synchronize_session=False
+        )
+        db.session.commit()
+
+    @staticmethod
+    def requeue_stale():
+        """
+        Re-queues jobs whose worker stopped without finishing them (no heartbeat for
+        JOB_LOCK_TIMEOUT seconds). The lost attempt counts towards max_attempts.
+        :return: Number of jobs re-queued or failed
+        """
+        timeout = current_app.config.get('JOB_LOCK_TIMEOUT', 300)
+        now = datetime.utcnow()
+        error = 'Worker stopped before the job finished'
+        stale = (Job.status == 'running', Job.locked_at < now - timedelta(seconds=timeout))
+        released = {'locked_by': None, 'locked_at': None, 'error': error, 'updated_at': now}
+
+        count = Job.query.filter(*stale, Job.attempts >= Job.max_attempts).update(
+            {**released, 'status': 'failed', 'finished_at': now}, synchronize_session=False
+        )
+        count += Job.query.filter(*stale).update(
+            {**released, 'status': 'queued', 'run_at': now}, synchronize_session=False
+        )
+        db.session.commit()
+        return count
@@ -1,6 +1,11 @@
+import os
+import tempfile
+import uuid
 import cloudinary
 import cloudinary.uploader
 from flask import current_app
+from werkzeug.utils import secure_filename
+from app.services.job_service import JobError, JobService, job_handler
 
 class MediaService:
     @staticmethod
@@ -39,3 +44,48 @@ class MediaService:
             return upload_result, None
         except Exception as e:
             return None, str(e)
+
+    @staticmethod
+    def enqueue_upload(file, user_id, folder="hackathon_uploads"):
+        """
+        Saves the file to UPLOAD_TMP_DIR and queues a 'media_upload' job for it, so the
+        request does not wait on Cloudinary. Workers must share that directory.
+
+        Returns:
+            Job: The queued job; its result has the same fields as a direct upload
+            str: Error message if any
+        """
+        if not current_app.config.get('CLOUDINARY_CLOUD_NAME'):
+            return None, "Cloudinary not configured"
+
+        upload_dir = current_app.config.get('UPLOAD_TMP_DIR') or os.path.join(tempfile.gettempdir(), 'hackathon_uploads')
+        try:
+            os.makedirs(upload_dir, exist_ok=True)
+            path = os.path.join(upload_dir, f"{uuid.uuid4().hex}_{secure_filename(file.filename) or 'upload'}")
+            file.save(path)
+        except OSError as e:
+            return None, str(e)
+
+        job = JobService.enqueue('media_upload', {'path': path, 'folder': folder}, user_id=user_id)
+        return job, None
+
+    @staticmethod
+    def upload_summary(result):
+        return {
+            'url': result.get('secure_url'),
+            'public_id': result.get('public_id'),
+            'format': result.get('format'),
+            'resource_type': result.get('resource_type')
+        }
+
+@job_handler('media_upload')
+def run_upload_job(payload):
+    path = payload['path']
+    if not os.path.exists(path):
+        raise JobError("Upload file is missing", retry=False)
+
+    result, error = MediaService.upload_file(path, folder=payload.get('folder', 'hackathon_uploads'))
+    if error:
+        raise JobError(error, retry=error != "Cloudinary not configured")
+    os.remove(path)
+    return MediaService.upload_summary(result)
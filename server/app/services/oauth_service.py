@@ -5,6 +5,11 @@ from flask import current_app, jsonify
 from app.extensions import db
 from app.models.oauth import OAuth
 from app.models.user import User
+from app.services.evaluation_service import EvaluationService
+from app.services.job_service import JobError, JobService, job_handler
+
+# Keys fetch_linkedin_additional_data adds to the LinkedIn profile
+LINKEDIN_ADDITIONAL_KEYS = ('network_size', 'orgs', 'events')
 
 class OAuthService:
     @staticmethod
@@ -99,23 +104,6 @@ class OAuthService:
         github_user = user_response.json()
         provider_user_id = str(github_user.get('id'))
         
-        # Fetch repositories for analysis
-        repos_url = "https://api.github.com/user/repos?sort=updated&per_page=10&type=owner"
-        repos_resp = requests.get(repos_url, headers=user_headers)
-        if repos_resp.status_code == 200:
-            repos = repos_resp.json()
-            repo_data = []
-            for repo in repos:
-                repo_data.append({
-                    'name': repo.get('name'),
-                    'description': repo.get('description'),
-                    'language': repo.get('language'),
-                    'stargazers_count': repo.get('stargazers_count'),
-                    'forks_count': repo.get('forks_count'),
-                    'html_url': repo.get('html_url')
-                })
-            github_user['repositories'] = repo_data
-        
         # Check if this GitHub account is already linked to another user
         existing_oauth = OAuth.query.filter_by(provider='github', provider_user_id=provider_user_id).first()
         if existing_oauth and existing_oauth.user_id != user_id:
@@ -125,7 +113,8 @@ class OAuthService:
         user_oauth = OAuth.query.filter_by(user_id=user_id, provider='github').first()
         
         if user_oauth:
-            # Update existing connection
+            # Update existing connection, keeping the repositories until the enrichment job refreshes them
+            github_user['repositories'] = (user_oauth.meta_data or {}).get('repositories', [])
             user_oauth.provider_user_id = provider_user_id
             user_oauth.access_token = access_token
             user_oauth.meta_data = github_user
@@ -140,14 +129,71 @@ class OAuthService:
                 meta_data=github_user
             )
             db.session.add(user_oauth)
+
+        # Store the avatar on the user so member rosters don't need the OAuth blob
+        user = User.query.get(user_id)
+        if user and github_user.get('avatar_url'):
+            user.avatar_url = github_user['avatar_url']
+
+        # Stored candidate evaluations were based on the old profile data
+        EvaluationService.invalidate_user(user_id)
         
         try:
             db.session.commit()
+            # Repositories are fetched by a background job rather than in the callback request
+            JobService.enqueue('oauth_enrich', {'oauth_id': user_oauth.id}, user_id=user_id)
             return user_oauth, None
         except Exception as e:
             db.session.rollback()
             return None, str(e)
 
+    @staticmethod
+    def fetch_github_repositories(access_token):
+        """
+        Fetch the user's most recently updated repositories for analysis.
+        :return: List of repository dictionaries or None if GitHub did not answer
+        """
+        repos_url = "https://api.github.com/user/repos?sort=updated&per_page=10&type=owner"
+        repos_resp = requests.get(repos_url, headers={'Authorization': f'token {access_token}'}, timeout=15)
+        if repos_resp.status_code != 200:
+            return None
+        return [{
+            'name': repo.get('name'),
+            'description': repo.get('description'),
+            'language': repo.get('language'),
+            'stargazers_count': repo.get('stargazers_count'),
+            'forks_count': repo.get('forks_count'),
+            'html_url': repo.get('html_url')
+        } for repo in repos_resp.json()]
+
+    @staticmethod
+    def enrich_account(oauth_id):
+        """
+        Add the slow-to-fetch data to a connected account: GitHub repositories, or LinkedIn
+        network size, organizations and events. Runs as the 'oauth_enrich' job.
+        :return: Dictionary describing what was stored
+        """
+        oauth = OAuth.query.get(oauth_id)
+        if not oauth:
+            raise JobError("OAuth account not found", retry=False)
+
+        meta = dict(oauth.meta_data or {})
+        if oauth.provider == 'github':
+            repositories = OAuthService.fetch_github_repositories(oauth.access_token)
+            if repositories is None:
+                raise JobError("Failed to fetch GitHub repositories")
+            meta['repositories'] = repositories
+        elif oauth.provider == 'linkedin':
+            meta.update(OAuthService.fetch_linkedin_additional_data(oauth.access_token, meta))
+        else:
+            raise JobError(f"Unsupported provider: {oauth.provider}", retry=False)
+
+        oauth.meta_data = meta
+        oauth.updated_at = datetime.utcnow()
+        EvaluationService.invalidate_user(oauth.user_id)
+        db.session.commit()
+        return {'oauth_id': oauth.id, 'provider': oauth.provider, 'keys': sorted(meta.keys())}
+
     @staticmethod
     def fetch_linkedin_additional_data(access_token, linkedin_user):
         """
@@ -345,12 +391,8 @@ class OAuthService:
         linkedin_user = user_response.json()
         provider_user_id = str(linkedin_user.get('sub'))  # 'sub' is the unique ID in OIDC
         
-        # Try to fetch additional info if possible, but basic profile is in linkedin_user
-        # linkedin_user keys: sub, name, given_name, family_name, picture, email, email_verified
-        
-        # Fetch additional data (network size, orgs, events)
-        additional_data = OAuthService.fetch_linkedin_additional_data(access_token, linkedin_user)
-        linkedin_user.update(additional_data)
+        # Basic profile is in linkedin_user (sub, name, given_name, family_name, picture, email, email_verified).
+        # Network size, organizations and events are fetched by the 'oauth_enrich' job.
 
         # Check existing connection
         existing_oauth = OAuth.query.filter_by(provider='linkedin', provider_user_id=provider_user_id).first()
@@ -366,6 +408,11 @@ class OAuthService:
                 user_oauth.refresh_token = refresh_token
             if token_expiry:
                 user_oauth.token_expiry = token_expiry
+            # Keep the previous additional data until the enrichment job refreshes it
+            previous = user_oauth.meta_data or {}
+            for key in LINKEDIN_ADDITIONAL_KEYS:
+                if key in previous:
+                    linkedin_user[key] = previous[key]
             user_oauth.meta_data = linkedin_user
             user_oauth.updated_at = datetime.utcnow()
         else:
@@ -379,9 +426,12 @@ class OAuthService:
                 meta_data=linkedin_user
             )
             db.session.add(user_oauth)
+
+        EvaluationService.invalidate_user(user_id)
         
         try:
             db.session.commit()
+            JobService.enqueue('oauth_enrich', {'oauth_id': user_oauth.id}, user_id=user_id)
             return user_oauth, None
         except Exception as e:
             db.session.rollback()
@@ -395,9 +445,14 @@ class OAuthService:
         oauth = OAuth.query.filter_by(user_id=user_id, provider='github').first()
         if not oauth:
             return False, "GitHub account not connected"
+
+        user = User.query.get(user_id)
+        if user and user.avatar_url and user.avatar_url == (oauth.meta_data or {}).get('avatar_url'):
+            user.avatar_url = None
         
         try:
             db.session.delete(oauth)
+            EvaluationService.invalidate_user(user_id)
             db.session.commit()
             return True, None
         except Exception as e:
@@ -415,8 +470,13 @@ class OAuthService:
         
         try:
             db.session.delete(oauth)
+            EvaluationService.invalidate_user(user_id)
             db.session.commit()
             return True, None
         except Exception as e:
             db.session.rollback()
             return False, str(e)
+
+@job_handler('oauth_enrich')
+def run_enrichment_job(payload):
+    return OAuthService.enrich_account(payload['oauth_id'])
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models.readme_cache import ReadmeCache
+
+class ReadmeCacheService:
+    """
+    Database cache of repository READMEs and their summaries, shared by every worker.
+    Bounded by README_CACHE_MAX_SIZE characters; least recently used entries go first.
+    """
+
+    @staticmethod
+    def get_latest(owner, repo):
+        """
+        The most recently fetched README of a repository.
+        :return: ReadmeCache or None
+        """
+        return ReadmeCache.query.filter_by(owner=owner, repo=repo).order_by(ReadmeCache.fetched_at.desc()).first()
+
+    @staticmethod
+    def is_fresh(entry):
+        """True if `entry` was fetched or revalidated recently enough to use without asking GitHub."""
+        max_age = current_app.config.get('README_CACHE_FRESH_SECONDS', 600)
+        return bool(max_age) and entry.fetched_at >= datetime.utcnow() - timedelta(seconds=max_age)
+
+    @staticmethod
+    def touch(entry, revalidated=False):
+        now = datetime.utcnow()
+        entry.last_used_at = now
+        if revalidated:
+            entry.fetched_at = now
+        db.session.commit()
+        return entry
+
+    @staticmethod
+    def store(owner, repo, sha, etag, content):
+        """
+        Records a freshly downloaded README. An entry with the same blob sha keeps its
+        summary; entries for older versions of the README are dropped.
+        :return: ReadmeCache entry
+        """
+        now = datetime.utcnow()
+        entry = ReadmeCache.query.filter_by(owner=owner, repo=repo, sha=sha).first()
+        if entry:
+            entry.etag = etag
+        else:
+            entry = ReadmeCache(owner=owner, repo=repo, sha=sha, etag=etag, content=content, size=len(content))
+            db.session.add(entry)
+        entry.fetched_at = now
+        entry.last_used_at = now
+        ReadmeCache.query.filter(
+            ReadmeCache.owner == owner, ReadmeCache.repo == repo, ReadmeCache.sha != sha
+        ).delete(synchronize_session=False)
+
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another worker stored the same README at the same time
+            db.session.rollback()
+            entry = ReadmeCache.query.filter_by(owner=owner, repo=repo, sha=sha).first()
+        ReadmeCacheService.evict()
+        return entry
+
+    @staticmethod
+    def save_summary(entry, summary):
+        entry.summary = summary
+        entry.size = len(entry.content) + len(summary)
+        db.session.commit()
+        ReadmeCacheService.evict()
+        return entry
+
+    @staticmethod
+    def evict(max_size=None):
+        """Deletes least recently used entries until the cache holds at most `max_size` characters."""
+        if max_size is None:
+            max_size = current_app.config.get('README_CACHE_MAX_SIZE', 20_000_000)
+        total = db.session.query(func.coalesce(func.sum(ReadmeCache.size), 0)).scalar()
+        if not max_size or total <= max_size:
+            return 0
+
+        stale = []
+        rows = db.session.query(ReadmeCache.id, ReadmeCache.size).order_by(ReadmeCache.last_used_at).all()
+        for entry_id, size in rows:
+            if total <= max_size:
+                break
+            stale.append(entry_id)
+            total -= size
+        ReadmeCache.query.filter(ReadmeCache.id.in_(stale)).delete(synchronize_session=False)
+        db.session.commit()
+        return len(stale)
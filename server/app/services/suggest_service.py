@@ -0,0 +1,74 @@
+import threading
+import time
+from flask import current_app
+from app.extensions import db
+from app.models.club import Club
+from app.models.event import Event
+from app.utils.prefix_index import PrefixIndex
+
+# Per-process indexes. ClubService and EventService keep them current for writes made
+# by this process; a periodic rebuild picks up writes made by other workers.
+_clubs = PrefixIndex()
+_events = PrefixIndex()
+_rebuild_lock = threading.Lock()
+_state = {'built_at': None}
+
+class SuggestService:
+    @staticmethod
+    def rebuild():
+        """Reloads both indexes from the database (two id/name queries)."""
+        with _rebuild_lock:
+            SuggestService._load()
+
+    @staticmethod
+    def _load():
+        _clubs.replace(db.session.query(Club.id, Club.name).all())
+        _events.replace(db.session.query(Event.id, Event.title).all())
+        _state['built_at'] = time.monotonic()
+
+    @staticmethod
+    def _is_stale(ttl):
+        built_at = _state['built_at']
+        return built_at is None or bool(ttl and time.monotonic() - built_at > ttl)
+
+    @staticmethod
+    def _ensure_fresh():
+        ttl = current_app.config.get('SUGGEST_INDEX_TTL', 300)
+        if not SuggestService._is_stale(ttl):
+            return
+        # Requests that saw the same expiry queue on the lock; the first one rebuilds and
+        # the re-check lets the rest use its index instead of rebuilding in turn
+        with _rebuild_lock:
+            if SuggestService._is_stale(ttl):
+                SuggestService._load()
+
+    @staticmethod
+    def suggest(prefix, limit):
+        """
+        Returns the top `limit` clubs and events whose name starts with `prefix`,
+        or has a word that does, from the in-memory index.
+        :param prefix: Text typed so far
+        :param limit: Maximum suggestions per type
+        :return: Dictionary with 'clubs' [{id, name}] and 'events' [{id, title}]
+        """
+        SuggestService._ensure_fresh()
+        return {
+            'clubs': [{'id': i, 'name': name} for i, name in _clubs.search(prefix, limit)],
+            'events': [{'id': i, 'title': title} for i, title in _events.search(prefix, limit)]
+        }
+
+    @staticmethod
+    def index_club(club):
+        _clubs.add(club.id, club.name)
+
+    @staticmethod
+    def remove_club(club_id):
+        _clubs.remove(club_id)
+
+    @staticmethod
+    def index_event(event):
+        _events.add(event.id, event.title)
+
+    @staticmethod
+    def remove_event(event_id):
+        _events.remove(event_id)
@@ -1,14 +1,15 @@
 from app.models.user import User
 from app.extensions import db
+from app.serializers import UserSerializer
 
 class UserService:
     @staticmethod
     def get_user_by_id(user_id):
-        return User.query.get(user_id)
+        return User.query.options(*UserSerializer.load_options()).get(user_id)
 
     @staticmethod
     def get_all_users():
-        return User.query.all()
+        return User.query.options(*UserSerializer.load_options()).all()
 
     @staticmethod
     def update_user(user_id, data):
@@ -1,5 +1,7 @@
 from werkzeug.security import generate_password_hash, check_password_hash
-from flask_jwt_extended import create_access_token
+from flask_jwt_extended import create_access_token, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 from datetime import timedelta
 
 def hash_password(password):
@@ -15,3 +17,15 @@ def create_token(identity):
     expires = timedelta(days=30)
     # Ensure identity is a string as required by flask-jwt-extended
     return create_access_token(identity=str(identity), expires_delta=expires)
+
+def optional_identity():
+    """
+    Identity of the request's token, for public endpoints that show more to signed-in users.
+    A missing, expired or malformed token counts as anonymous instead of failing the request.
+    :return: User id string or None
+    """
+    try:
+        verify_jwt_in_request(optional=True)
+    except (JWTExtendedException, PyJWTError):
+        return None
+    return get_jwt_identity()
@@ -0,0 +1,137 @@
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, ToolMessage
+
+# Rough token estimate (about 4 characters per token for English text); close enough to
+# keep prompts under a budget without calling the model's tokenizer on every turn.
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+
+def message_text(message):
+    """Returns the plain text of a message whose content may be a string or a list of blocks."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    if isinstance(content, dict):
+        return content.get('text', '')
+    parts = []
+    for block in content or []:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and 'text' in block:
+            parts.append(block['text'])
+    return ' '.join(parts)
+
+def estimate_tokens(messages, extra_text=''):
+    chars = len(extra_text)
+    tokens = 0
+    for message in messages:
+        chars += len(message_text(message))
+        for call in getattr(message, 'tool_calls', None) or []:
+            chars += len(call['name']) + len(str(call.get('args', '')))
+        tokens += MESSAGE_OVERHEAD_TOKENS
+    return tokens + chars // CHARS_PER_TOKEN
+
+def split_turns(messages):
+    """Groups messages into turns, each starting at a HumanMessage."""
+    turns = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+def compact_turn(turn):
+    """
+    Keeps what the user said and what the assistant answered. Tool calls and tool
+    results of finished turns are dropped; they were only needed to produce the answer.
+    """
+    compacted = []
+    for message in turn:
+        if isinstance(message, ToolMessage):
+            continue
+        if isinstance(message, AIMessage):
+            text = message_text(message)
+            if text:
+                compacted.append(AIMessage(content=text))
+            continue
+        compacted.append(message)
+    return compacted
+
+def truncate_tool_results(turn, max_tokens):
+    """
+    Shortens the largest tool results of a turn until it fits in `max_tokens`. The
+    messages keep their tool_call_id so the call/result pairing stays valid.
+    """
+    overflow = estimate_tokens(turn) - max_tokens
+    if overflow <= 0:
+        return turn
+
+    turn = list(turn)
+    tool_indexes = sorted(
+        (i for i, m in enumerate(turn) if isinstance(m, ToolMessage)),
+        key=lambda i: len(message_text(turn[i])), reverse=True
+    )
+    for i in tool_indexes:
+        if overflow <= 0:
+            break
+        text = message_text(turn[i])
+        keep = max(len(text) - overflow * CHARS_PER_TOKEN, 200)
+        if keep >= len(text):
+            continue
+        turn[i] = turn[i].model_copy(update={
+            'content': text[:keep] + f'... [truncated {len(text) - keep} characters]'
+        })
+        overflow -= (len(text) - keep) // CHARS_PER_TOKEN
+    return turn
+
+class HistoryWindow:
+    """
+    Token-bounded view of a conversation with a rolling summary.
+
+    The current turn is always sent (its tool calls are still in flight), with oversized
+    tool results truncated to half of the budget. The previous `keep_turns` turns are sent compacted.
+    Older turns are folded into the running summary in batches of `summary_batch_turns`,
+    or immediately when the prompt would exceed `token_budget`, and removed from the
+    stored state.
+    """
+
+    def __init__(self, token_budget=6000, keep_turns=6, summary_batch_turns=4):
+        self.token_budget = token_budget
+        self.keep_turns = keep_turns
+        self.summary_batch_turns = summary_batch_turns
+
+    def prepare(self, messages, summary, summarize):
+        """
+        :param messages: Unsummarized conversation messages from the graph state
+        :param summary: Current running summary ('' if none)
+        :param summarize: Callable (summary, messages) -> new summary
+        :return: (prompt messages, new summary, RemoveMessage list for folded messages)
+        """
+        turns = split_turns(messages)
+        current, previous = turns[-1:], turns[:-1]
+        if current:
+            # Leave half of the budget for earlier turns
+            current = [truncate_tool_results(current[0], (self.token_budget - estimate_tokens([], summary)) // 2)]
+
+        split = max(len(previous) - self.keep_turns, 0)
+        if split < self.summary_batch_turns:
+            split = 0
+        fold, window = previous[:split], previous[split:]
+        compacted = [compact_turn(t) for t in window]
+
+        def prompt_tokens():
+            flat = [m for t in compacted for m in t] + [m for t in current for m in t]
+            return estimate_tokens(flat, summary)
+
+        # Over budget: fold the oldest kept turns now rather than waiting for a full batch
+        while window and prompt_tokens() > self.token_budget:
+            fold.append(window.pop(0))
+            compacted.pop(0)
+
+        removals = []
+        if fold:
+            folded = [m for t in fold for m in t]
+            summary = summarize(summary, [m for t in fold for m in compact_turn(t)])
+            removals = [RemoveMessage(id=m.id) for m in folded if m.id]
+
+        prompt = [m for t in compacted for m in t] + [m for t in current for m in t]
+        return prompt, summary, removals
@@ -0,0 +1,287 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.extensions import db
+from app.models.chat_checkpoint import ChatThread, ChatCheckpoint, ChatCheckpointWrite
+
+threads_table = ChatThread.__table__
+checkpoints_table = ChatCheckpoint.__table__
+writes_table = ChatCheckpointWrite.__table__
+
+# How often (seconds) a process looks for expired or least recently used threads
+SWEEP_INTERVAL = 60
+
+class DatabaseCheckpointSaver(BaseCheckpointSaver):
+    """
+    LangGraph checkpointer stored in the app database, so chat history survives
+    restarts and is shared by every worker.
+
+    Storage is bounded three ways, all read from the app config:
+    - CHAT_MAX_CHECKPOINTS_PER_THREAD: older checkpoints of a thread are dropped on write
+    - CHAT_THREAD_TTL: threads idle for longer are treated as empty and swept
+    - CHAT_MAX_THREADS: beyond this, the least recently used threads are swept
+
+    Statements run on their own connection so checkpoint commits never commit (or
+    roll back) the request's db.session. Nothing is cached in process memory.
+    LangGraph saves checkpoints from background threads that have no app context, so
+    the saver is bound to the app with init_app().
+    """
+
+    def __init__(self, *, serde=None):
+        super().__init__(serde=serde)
+        self.app = None
+        self._sweep_lock = threading.Lock()
+        self._last_sweep = 0.0
+
+    def init_app(self, app):
+        self.app = app
+
+    def _get_app(self):
+        return self.app or current_app._get_current_object()
+
+    @property
+    def engine(self):
+        with self._get_app().app_context():
+            return db.engine
+
+    def _settings(self):
+        config = self._get_app().config
+        return (
+            config.get('CHAT_MAX_CHECKPOINTS_PER_THREAD', 10),
+            config.get('CHAT_THREAD_TTL', 7 * 24 * 3600),
+            config.get('CHAT_MAX_THREADS', 10000),
+        )
+
+    @staticmethod
+    def _thread_config(thread_id, checkpoint_ns, checkpoint_id):
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    def _to_tuple(self, conn, row):
+        writes = conn.execute(
+            select(writes_table.c.task_id, writes_table.c.channel, writes_table.c.value_type,
+                   writes_table.c.value, writes_table.c.task_path, writes_table.c.idx)
+            .where(
+                writes_table.c.thread_id == row.thread_id,
+                writes_table.c.checkpoint_ns == row.checkpoint_ns,
+                writes_table.c.checkpoint_id == row.checkpoint_id,
+            )
+        ).fetchall()
+        writes = sorted(writes, key=lambda w: writes_sort_key(w.task_path, w.task_id, w.idx))
+
+        return CheckpointTuple(
+            config=self._thread_config(row.thread_id, row.checkpoint_ns, row.checkpoint_id),
+            checkpoint=self.serde.loads_typed((row.checkpoint_type, row.checkpoint)),
+            metadata=self.serde.loads_typed((row.metadata_type, row.meta_data)),
+            parent_config=(
+                self._thread_config(row.thread_id, row.checkpoint_ns, row.parent_checkpoint_id)
+                if row.parent_checkpoint_id else None
+            ),
+            pending_writes=[
+                (w.task_id, w.channel, self.serde.loads_typed((w.value_type, w.value))) for w in writes
+            ],
+        )
+
+    def _live_threads(self, ttl):
+        query = select(threads_table.c.thread_id)
+        if ttl:
+            query = query.where(threads_table.c.updated_at >= datetime.utcnow() - timedelta(seconds=ttl))
+        return query
+
+    def get_tuple(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        _, ttl, _ = self._settings()
+
+        query = select(checkpoints_table).where(
+            checkpoints_table.c.thread_id == thread_id,
+            checkpoints_table.c.checkpoint_ns == checkpoint_ns,
+            checkpoints_table.c.thread_id.in_(self._live_threads(ttl)),
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            query = query.where(checkpoints_table.c.checkpoint_id == checkpoint_id)
+        else:
+            query = query.order_by(checkpoints_table.c.id.desc()).limit(1)
+
+        with self.engine.connect() as conn:
+            row = conn.execute(query).first()
+            return self._to_tuple(conn, row) if row else None
+
+    def list(self, config, *, filter=None, before=None, limit=None):
+        _, ttl, _ = self._settings()
+        query = select(checkpoints_table).where(checkpoints_table.c.thread_id.in_(self._live_threads(ttl)))
+        if config:
+            query = query.where(checkpoints_table.c.thread_id == config["configurable"]["thread_id"])
+            if config["configurable"].get("checkpoint_ns") is not None:
+                query = query.where(checkpoints_table.c.checkpoint_ns == config["configurable"]["checkpoint_ns"])
+            if checkpoint_id := get_checkpoint_id(config):
+                query = query.where(checkpoints_table.c.checkpoint_id == checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            query = query.where(checkpoints_table.c.checkpoint_id < before_id)
+        query = query.order_by(checkpoints_table.c.checkpoint_id.desc())
+
+        with self.engine.connect() as conn:
+            for row in conn.execute(query).fetchall():
+                if limit is not None and limit <= 0:
+                    break
+                checkpoint_tuple = self._to_tuple(conn, row)
+                if filter and not all(checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                if limit is not None:
+                    limit -= 1
+                yield checkpoint_tuple
+
+    def _touch_thread(self, conn, thread_id, now):
+        dialect = conn.dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            dialect_insert = postgresql_insert if dialect == 'postgresql' else sqlite_insert
+            stmt = dialect_insert(threads_table).values(thread_id=thread_id, created_at=now, updated_at=now)
+            conn.execute(stmt.on_conflict_do_update(index_elements=['thread_id'], set_={'updated_at': now}))
+            return
+
+        result = conn.execute(update(threads_table).where(threads_table.c.thread_id == thread_id).values(updated_at=now))
+        if result.rowcount == 0:
+            conn.execute(insert(threads_table).values(thread_id=thread_id, created_at=now, updated_at=now))
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        max_checkpoints, _, _ = self._settings()
+        checkpoint_type, checkpoint_data = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_data = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        now = datetime.utcnow()
+
+        with self.engine.begin() as conn:
+            self._touch_thread(conn, thread_id, now)
+            conn.execute(insert(checkpoints_table).values(
+                thread_id=thread_id,
+                checkpoint_ns=checkpoint_ns,
+                checkpoint_id=checkpoint["id"],
+                parent_checkpoint_id=config["configurable"].get("checkpoint_id"),
+                checkpoint_type=checkpoint_type,
+                checkpoint=checkpoint_data,
+                metadata_type=metadata_type,
+                meta_data=metadata_data,
+                created_at=now,
+            ))
+            self._trim_thread(conn, thread_id, checkpoint_ns, max_checkpoints)
+
+        self._maybe_sweep()
+        return self._thread_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        key = (
+            writes_table.c.thread_id == thread_id,
+            writes_table.c.checkpoint_ns == checkpoint_ns,
+            writes_table.c.checkpoint_id == checkpoint_id,
+            writes_table.c.task_id == task_id,
+        )
+
+        with self.engine.begin() as conn:
+            existing = set(conn.execute(select(writes_table.c.idx).where(*key)).scalars())
+            rows = []
+            for i, (channel, value) in enumerate(writes):
+                idx = WRITES_IDX_MAP.get(channel, i)
+                if idx in existing:
+                    # Regular writes are idempotent; special writes (errors, interrupts) are replaced
+                    if idx >= 0:
+                        continue
+                    conn.execute(delete(writes_table).where(*key, writes_table.c.idx == idx))
+                value_type, value_data = self.serde.dumps_typed(value)
+                rows.append({
+                    'thread_id': thread_id,
+                    'checkpoint_ns': checkpoint_ns,
+                    'checkpoint_id': checkpoint_id,
+                    'task_id': task_id,
+                    'task_path': task_path,
+                    'idx': idx,
+                    'channel': channel,
+                    'value_type': value_type,
+                    'value': value_data,
+                })
+            if rows:
+                conn.execute(insert(writes_table), rows)
+
+    def _trim_thread(self, conn, thread_id, checkpoint_ns, max_checkpoints):
+        """Drops all but the newest `max_checkpoints` checkpoints (and their writes) of a thread."""
+        stale = conn.execute(
+            select(checkpoints_table.c.checkpoint_id)
+            .where(checkpoints_table.c.thread_id == thread_id, checkpoints_table.c.checkpoint_ns == checkpoint_ns)
+            .order_by(checkpoints_table.c.id.desc())
+            .offset(max_checkpoints)
+        ).scalars().all()
+        if not stale:
+            return
+        conn.execute(delete(writes_table).where(
+            writes_table.c.thread_id == thread_id,
+            writes_table.c.checkpoint_ns == checkpoint_ns,
+            writes_table.c.checkpoint_id.in_(stale),
+        ))
+        conn.execute(delete(checkpoints_table).where(
+            checkpoints_table.c.thread_id == thread_id,
+            checkpoints_table.c.checkpoint_ns == checkpoint_ns,
+            checkpoints_table.c.checkpoint_id.in_(stale),
+        ))
+
+    @staticmethod
+    def _delete_threads(conn, thread_ids):
+        if not thread_ids:
+            return
+        conn.execute(delete(writes_table).where(writes_table.c.thread_id.in_(thread_ids)))
+        conn.execute(delete(checkpoints_table).where(checkpoints_table.c.thread_id.in_(thread_ids)))
+        conn.execute(delete(threads_table).where(threads_table.c.thread_id.in_(thread_ids)))
+
+    def delete_thread(self, thread_id):
+        with self.engine.begin() as conn:
+            self._delete_threads(conn, [thread_id])
+
+    def sweep(self, batch_size=500):
+        """Deletes threads past their TTL, then the least recently used ones over CHAT_MAX_THREADS."""
+        _, ttl, max_threads = self._settings()
+        with self.engine.begin() as conn:
+            if ttl:
+                cutoff = datetime.utcnow() - timedelta(seconds=ttl)
+                expired = conn.execute(
+                    select(threads_table.c.thread_id).where(threads_table.c.updated_at < cutoff).limit(batch_size)
+                ).scalars().all()
+                self._delete_threads(conn, expired)
+
+            if max_threads:
+                excess = conn.execute(select(func.count()).select_from(threads_table)).scalar() - max_threads
+                if excess > 0:
+                    oldest = conn.execute(
+                        select(threads_table.c.thread_id)
+                        .order_by(threads_table.c.updated_at)
+                        .limit(min(excess, batch_size))
+                    ).scalars().all()
+                    self._delete_threads(conn, oldest)
+
+    def _maybe_sweep(self):
+        now = time.monotonic()
+        if now - self._last_sweep < SWEEP_INTERVAL or not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = now
+            self.sweep()
+        finally:
+            self._sweep_lock.release()
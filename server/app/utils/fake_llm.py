@@ -0,0 +1,199 @@
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from typing import List
+from langchain_core.exceptions import ModelRateLimitError
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from app.utils.chat_history import estimate_tokens, message_text
+
+# Latency profiles: seconds to the first token and output tokens per second (0 = no delay).
+# 'gemini-flash' is roughly what gemini-2.5-flash shows for short chat turns.
+FAKE_LLM_PROFILES = {
+    'instant': {'ttft': 0.0, 'tokens_per_second': 0},
+    'fast': {'ttft': 0.2, 'tokens_per_second': 250},
+    'gemini-flash': {'ttft': 0.6, 'tokens_per_second': 120},
+    'slow': {'ttft': 2.0, 'tokens_per_second': 30},
+}
+
+# Without a script the fake calls the read tool named after what the user asks about
+_TOOL_KEYWORDS = (
+    ('announcement', 'get_announcements'),
+    ('event', 'get_events'),
+    ('club', 'get_clubs'),
+)
+
+_WORDS = (
+    "the club runs weekly sessions on practical projects and members share what they "
+    "built with the rest of the group before planning the next event together"
+).split()
+
+class FakeChatModel(BaseChatModel):
+    """
+    Offline stand-in for the Gemini chat model, for load tests without network or quota.
+
+    Replies come from `rules` when one matches, otherwise from built-in defaults: a call
+    to the read tool matching the user's words (when tools are bound), a short answer
+    after a tool result, a JSON score for evaluation prompts, and filler text otherwise.
+    Each reply waits `ttft` seconds, then streams at `tokens_per_second`, both varied by
+    +/- `jitter`. `error_rate` of calls fail with ModelRateLimitError after the first-token
+    wait, like a 429 would. Usage metadata is filled in, so token metrics work as usual.
+
+    A rule is a dict with:
+        match: regex searched (case-insensitive) in the last user message
+        after_tool: only applies right after a result of this tool ('*' for any)
+        content: reply text
+        tool_calls: [{"name": ..., "args": {...}}] to call tools instead of replying
+    Rules without after_tool only apply to user messages; the first match wins.
+    """
+
+    ttft: float = 0.0
+    tokens_per_second: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    reply_tokens: int = 60
+    rules: List[dict] = []
+
+    @property
+    def _llm_type(self):
+        return 'fake'
+
+    def bind_tools(self, tools, **kwargs):
+        names = [convert_to_openai_tool(t)['function']['name'] for t in tools]
+        return self.bind(tool_names=names, **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, tool_names=None, **kwargs):
+        content, tool_calls = self._reply(messages, tool_names or [])
+        pieces = self._pieces(content, tool_calls)
+        self._wait_first_token()
+        time.sleep(self._delay(len(pieces)))
+        message = AIMessage(
+            content=content,
+            tool_calls=tool_calls,
+            usage_metadata=self._usage(messages, len(pieces))
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, tool_names=None, **kwargs):
+        content, tool_calls = self._reply(messages, tool_names or [])
+        pieces = self._pieces(content, tool_calls)
+        self._wait_first_token()
+        per_piece = self._delay(1)
+        input_tokens = estimate_tokens(messages)
+
+        for i, piece in enumerate(pieces):
+            if i:
+                time.sleep(per_piece)
+            usage = {'input_tokens': input_tokens if i == 0 else 0, 'output_tokens': 1}
+            usage['total_tokens'] = usage['input_tokens'] + 1
+            if isinstance(piece, dict):
+                chunk = AIMessageChunk(content='', tool_call_chunks=[piece], usage_metadata=usage)
+            else:
+                chunk = AIMessageChunk(content=piece, usage_metadata=usage)
+            generation = ChatGenerationChunk(message=chunk)
+            if run_manager:
+                run_manager.on_llm_new_token(piece if isinstance(piece, str) else '', chunk=generation)
+            yield generation
+
+    def _reply(self, messages, tool_names):
+        """Returns (content, tool_calls) for the conversation so far."""
+        last = messages[-1] if messages else None
+        after_tool = last.name if isinstance(last, ToolMessage) else None
+        user_text = next(
+            (message_text(m) for m in reversed(messages) if isinstance(m, HumanMessage)), ''
+        )
+
+        for rule in self.rules:
+            if rule.get('after_tool'):
+                if not after_tool or rule['after_tool'] not in ('*', after_tool):
+                    continue
+            elif after_tool:
+                continue
+            if rule.get('match') and not re.search(rule['match'], user_text, re.IGNORECASE):
+                continue
+            tool_calls = [
+                {'name': c['name'], 'args': c.get('args', {}), 'id': f'call_{uuid.uuid4().hex[:12]}', 'type': 'tool_call'}
+                for c in rule.get('tool_calls', [])
+            ]
+            return rule.get('content', ''), tool_calls
+
+        if after_tool:
+            return f"Here is what I found: {message_text(last)[:300]}", []
+
+        lowered = user_text.lower()
+        for keyword, tool in _TOOL_KEYWORDS:
+            if keyword in lowered and tool in tool_names:
+                return '', [{'name': tool, 'args': {}, 'id': f'call_{uuid.uuid4().hex[:12]}', 'type': 'tool_call'}]
+
+        digest = int(hashlib.sha256(user_text.encode('utf-8')).hexdigest(), 16)
+        if '"score"' in user_text:
+            return json.dumps({
+                'score': 40 + digest % 61,
+                'summary': ' '.join(self._filler(digest, 30)),
+                'strengths': [' '.join(self._filler(digest + i, 6)) for i in range(3)],
+                'weakness': ' '.join(self._filler(digest + 3, 8))
+            }), []
+        return ' '.join(self._filler(digest, self.reply_tokens)), []
+
+    @staticmethod
+    def _filler(seed, count):
+        return [_WORDS[(seed + i) % len(_WORDS)] for i in range(count)]
+
+    @staticmethod
+    def _pieces(content, tool_calls):
+        """What is streamed: words of the content (one token each), then one chunk per tool call."""
+        pieces = [w + ' ' for w in content.split(' ')] if content else []
+        if pieces:
+            pieces[-1] = pieces[-1][:-1]
+        pieces += [
+            {'name': c['name'], 'args': json.dumps(c['args']), 'id': c['id'], 'index': i}
+            for i, c in enumerate(tool_calls)
+        ]
+        return pieces
+
+    def _usage(self, messages, output_tokens):
+        input_tokens = estimate_tokens(messages)
+        return {
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens
+        }
+
+    def _jittered(self, seconds):
+        if seconds <= 0 or not self.jitter:
+            return max(0.0, seconds)
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _delay(self, tokens):
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return self._jittered(tokens / self.tokens_per_second)
+
+    def _wait_first_token(self):
+        time.sleep(self._jittered(self.ttft))
+        if self.error_rate and random.random() < self.error_rate:
+            raise ModelRateLimitError("Fake rate limit (FAKE_LLM_ERROR_RATE)")
+
+def create_fake_model(profile='fast', script=None, ttft=None, tokens_per_second=None, jitter=0.2, error_rate=0.0):
+    """
+    Builds a FakeChatModel from a named profile, with optional overrides.
+    :param script: Path of a JSON file holding a list of rules (see FakeChatModel)
+    """
+    if profile not in FAKE_LLM_PROFILES:
+        raise ValueError(f"Unknown fake LLM profile '{profile}', expected one of {', '.join(FAKE_LLM_PROFILES)}")
+    settings = dict(FAKE_LLM_PROFILES[profile])
+    if ttft is not None:
+        settings['ttft'] = ttft
+    if tokens_per_second is not None:
+        settings['tokens_per_second'] = tokens_per_second
+
+    rules = []
+    if script:
+        with open(script) as f:
+            rules = json.load(f)
+    return FakeChatModel(jitter=jitter, error_rate=error_rate, rules=rules, **settings)
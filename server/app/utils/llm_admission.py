@@ -0,0 +1,199 @@
+import json
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from flask import jsonify
+
+logger = logging.getLogger(__name__)
+
+class AdmissionRejected(Exception):
+    """The request was not admitted; the client should retry after `retry_after` seconds."""
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+class _Waiter:
+    def __init__(self, user_id, background=False):
+        self.user_id = user_id
+        self.background = background
+        self.event = threading.Event()
+        self.granted = False
+
+class AdmissionSlot:
+    """Held while a request does model work. Release is idempotent."""
+
+    def __init__(self, controller, user_id):
+        self._controller = controller
+        self._user_id = user_id
+        self._started = time.monotonic()
+        self._released = False
+
+    def release(self):
+        if not self._released:
+            self._released = True
+            self._controller._release(self._user_id, time.monotonic() - self._started)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+class AdmissionController:
+    """
+    Caps the requests of this process that wait on the model, so they cannot take every
+    worker thread and starve cheap endpoints.
+
+    At most `max_active` requests run at once. Up to `max_queue` more wait, each for at
+    most `queue_timeout` seconds. A user may hold at most `per_user` running or waiting
+    requests. When a slot frees up, the waiting user with the fewest running requests
+    gets it, and among those the one admitted longest ago. This way one user's burst
+    does not lock out everyone else.
+    Requests that would wait past these limits are rejected at once with a Retry-After
+    estimate.
+
+    Background work (queued and batch evaluations) takes slots from the same budget and
+    the same per-user cap, so "async" is not a way around either. It never gets a 429:
+    it waits as long as it takes, does not count against `max_queue`, and is only
+    admitted while its user holds fewer than `per_user` slots. Among waiters of users
+    with equally many running requests, interactive ones go first.
+    """
+
+    def __init__(self, max_active=8, max_queue=16, queue_timeout=5.0, per_user=2):
+        self._lock = threading.Lock()
+        self._active = Counter()
+        self._active_total = 0
+        self._waiters = []
+        # When each user with running or waiting requests was last admitted
+        self._last_admitted = {}
+        self._stats = Counter()
+        # Moving average of how long a slot is held, for Retry-After
+        self._hold_seconds = 5.0
+        self.configure(max_active, max_queue, queue_timeout, per_user)
+
+    def configure(self, max_active, max_queue, queue_timeout, per_user):
+        with self._lock:
+            self.max_active = max(1, max_active)
+            self.max_queue = max(0, max_queue)
+            self.queue_timeout = queue_timeout
+            self.per_user = max(1, per_user)
+            self._grant_waiters()
+
+    def acquire(self, user_id, background=False):
+        """
+        Waits for a slot.
+        :param background: Work no client is waiting on; blocks until admitted instead of being rejected
+        :return: AdmissionSlot, to release when the model work is done
+        :raises AdmissionRejected: if the user or the queue is at its limit, or the wait timed out
+        """
+        user_id = str(user_id)
+        with self._lock:
+            if not background:
+                queued_for_user = sum(1 for w in self._waiters if w.user_id == user_id and not w.background)
+                if self._active[user_id] + queued_for_user >= self.per_user:
+                    raise self._reject('user_limit')
+            # Waiters still queued while a slot is free are all held back by their user's cap
+            if self._active_total < self.max_active and self._active[user_id] < self.per_user:
+                self._admit(user_id)
+                return AdmissionSlot(self, user_id)
+            if not background and sum(1 for w in self._waiters if not w.background) >= self.max_queue:
+                raise self._reject('queue_full')
+            waiter = _Waiter(user_id, background)
+            self._waiters.append(waiter)
+            self._stats['waited_background' if background else 'waited'] += 1
+
+        if background:
+            waiter.event.wait()
+            return AdmissionSlot(self, user_id)
+
+        waiter.event.wait(self.queue_timeout)
+        with self._lock:
+            # A slot granted just as the wait timed out is still taken
+            if not waiter.granted:
+                self._waiters.remove(waiter)
+                self._forget_if_idle(user_id)
+                raise self._reject('timeout')
+        return AdmissionSlot(self, user_id)
+
+    def _admit(self, user_id):
+        self._active[user_id] += 1
+        self._active_total += 1
+        self._last_admitted[user_id] = time.monotonic()
+        self._stats['admitted'] += 1
+
+    def _release(self, user_id, held):
+        with self._lock:
+            self._active[user_id] -= 1
+            if self._active[user_id] <= 0:
+                del self._active[user_id]
+            self._active_total -= 1
+            self._forget_if_idle(user_id)
+            self._hold_seconds = 0.8 * self._hold_seconds + 0.2 * held
+            self._grant_waiters()
+
+    def _forget_if_idle(self, user_id):
+        if user_id not in self._active and not any(w.user_id == user_id for w in self._waiters):
+            self._last_admitted.pop(user_id, None)
+
+    def _grant_waiters(self):
+        while self._active_total < self.max_active:
+            eligible = [w for w in self._waiters if self._active[w.user_id] < self.per_user]
+            if not eligible:
+                break
+            # Fewest running requests, interactive before background, then least recently
+            # admitted; min() keeps arrival order among equals
+            waiter = min(
+                eligible,
+                key=lambda w: (self._active[w.user_id], w.background, self._last_admitted.get(w.user_id, 0.0))
+            )
+            self._waiters.remove(waiter)
+            self._admit(waiter.user_id)
+            waiter.granted = True
+            waiter.event.set()
+
+    def _reject(self, reason):
+        self._stats[f'rejected_{reason}'] += 1
+        # Time for the requests ahead to drain through the slots
+        ahead = self._active_total + sum(1 for w in self._waiters if not w.background)
+        retry_after = max(1, min(60, math.ceil(self._hold_seconds * ahead / self.max_active)))
+        logger.warning(json.dumps({'event': 'llm_admission_rejected', 'reason': reason, 'retry_after': retry_after}))
+        return AdmissionRejected(reason, retry_after)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'active': self._active_total,
+                'queued': sum(1 for w in self._waiters if not w.background),
+                'queued_background': sum(1 for w in self._waiters if w.background),
+                'max_active': self.max_active,
+                'max_queue': self.max_queue,
+                'avg_hold_seconds': round(self._hold_seconds, 2),
+                **dict(self._stats)
+            }
+
+llm_admission = AdmissionController()
+
+REJECTION_MESSAGES = {
+    'user_limit': "You already have AI requests in progress. Please wait for them to finish.",
+    'queue_full': "The AI assistant is busy. Please try again shortly.",
+    'timeout': "The AI assistant is busy. Please try again shortly.",
+}
+
+def rejected_response(error):
+    """429 response for an AdmissionRejected, with Retry-After."""
+    response = jsonify({'error': REJECTION_MESSAGES.get(error.reason, str(error)), 'retry_after': error.retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def init_llm_admission(app):
+    llm_admission.configure(
+        app.config.get('LLM_MAX_CONCURRENT_REQUESTS', 8),
+        app.config.get('LLM_ADMISSION_QUEUE_SIZE', 16),
+        app.config.get('LLM_ADMISSION_QUEUE_TIMEOUT', 5.0),
+        app.config.get('LLM_MAX_REQUESTS_PER_USER', 2)
+    )
@@ -0,0 +1,262 @@
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from flask import current_app, g, request
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.exceptions import ModelAPIError, ModelConnectionError, ModelRateLimitError, ModelTimeoutError
+from langchain_core.runnables.config import ensure_config, merge_configs
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000, 30000, 60000)
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+# Errors another attempt may not hit. Anything else (bad request, auth, context overflow)
+# fails the call straight away.
+TRANSIENT_ERRORS = (
+    ModelRateLimitError, ModelAPIError, ModelConnectionError, ModelTimeoutError, TimeoutError, ConnectionError
+)
+
+class Histogram:
+    """Fixed-bucket histogram; bucket i counts values <= bounds[i], the last one the rest."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th value (None past the last bound)."""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else None
+        return None
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.total, 2),
+            'mean': round(self.total / self.count, 2) if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': [{'le': b, 'count': n} for b, n in zip(self.bounds + ('+Inf',), self.counts)]
+        }
+
+class CallSiteMetrics:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cost = 0.0
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.ttft_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.input_tokens_hist = Histogram(TOKEN_BUCKETS)
+        self.output_tokens_hist = Histogram(TOKEN_BUCKETS)
+
+    def record(self, call):
+        self.calls += 1
+        self.retries += call['retries']
+        if call['error']:
+            self.errors += 1
+        self.latency_ms.observe(call['latency_ms'])
+        if call['ttft_ms'] is not None:
+            self.ttft_ms.observe(call['ttft_ms'])
+        if call['input_tokens'] is not None:
+            self.input_tokens += call['input_tokens']
+            self.input_tokens_hist.observe(call['input_tokens'])
+        if call['output_tokens'] is not None:
+            self.output_tokens += call['output_tokens']
+            self.output_tokens_hist.observe(call['output_tokens'])
+        self.cost += call['cost_usd']
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'cost_usd': round(self.cost, 6),
+            'latency_ms': self.latency_ms.to_dict(),
+            'ttft_ms': self.ttft_ms.to_dict(),
+            'input_tokens_per_call': self.input_tokens_hist.to_dict(),
+            'output_tokens_per_call': self.output_tokens_hist.to_dict()
+        }
+
+class LLMMetrics:
+    """Process-wide LLM call metrics, keyed by call site."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites = {}
+
+    def record(self, call):
+        with self._lock:
+            self._sites.setdefault(call['call_site'], CallSiteMetrics()).record(call)
+
+    def snapshot(self):
+        with self._lock:
+            sites = {name: site.to_dict() for name, site in sorted(self._sites.items())}
+        return {
+            'calls': sum(s['calls'] for s in sites.values()),
+            'errors': sum(s['errors'] for s in sites.values()),
+            'cost_usd': round(sum(s['cost_usd'] for s in sites.values()), 6),
+            'call_sites': sites
+        }
+
+    def reset(self):
+        with self._lock:
+            self._sites.clear()
+
+llm_metrics = LLMMetrics()
+
+class RequestLLMStats:
+    """The LLM calls made while serving one request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = []
+
+    def record(self, call):
+        with self._lock:
+            self.calls.append(call)
+
+    def to_dict(self):
+        with self._lock:
+            calls = list(self.calls)
+        return {
+            'llm_calls': len(calls),
+            'llm_time_ms': round(sum(c['latency_ms'] for c in calls), 2),
+            'input_tokens': sum(c['input_tokens'] or 0 for c in calls),
+            'output_tokens': sum(c['output_tokens'] or 0 for c in calls),
+            'cost_usd': round(sum(c['cost_usd'] for c in calls), 6),
+            'calls': calls
+        }
+
+# Context variables, unlike thread locals, follow the call into LangGraph nodes and into
+# worker threads started with contextvars.copy_context().run.
+_request_stats = ContextVar('llm_request_stats', default=None)
+
+class _FirstTokenTimer(BaseCallbackHandler):
+    """Notes when a streamed model call produces its first token."""
+
+    def __init__(self):
+        self.first_token_at = None
+
+    def on_llm_new_token(self, token, **kwargs):
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+
+def _usage(message):
+    usage = getattr(message, 'usage_metadata', None) or {}
+    return usage.get('input_tokens'), usage.get('output_tokens')
+
+def invoke_llm(runnable, input, call_site, config=None):
+    """
+    Invokes a chat model (or a model with bound tools) and records the call: wall time,
+    time to first token, token usage, estimated cost, retries and the final error.
+    Transient errors (rate limits, server errors, timeouts) are retried up to
+    LLM_MAX_RETRIES times with exponential backoff from LLM_RETRY_BACKOFF seconds, unless
+    the failed attempt already streamed tokens: the client has shown them, and a retry
+    would send the reply a second time.
+    Inside a LangGraph node the node's callbacks are kept, so token streaming still works.
+    """
+    app_config = current_app.config
+    max_retries = app_config.get('LLM_MAX_RETRIES', 3)
+    backoff = app_config.get('LLM_RETRY_BACKOFF', 1.0)
+
+    timer = _FirstTokenTimer()
+    run_config = merge_configs(ensure_config(config), {
+        'callbacks': [timer],
+        'metadata': {'llm_call_site': call_site}
+    })
+
+    start = time.perf_counter()
+    retries, response, error = 0, None, None
+    try:
+        while True:
+            try:
+                response = runnable.invoke(input, config=run_config)
+                return response
+            except TRANSIENT_ERRORS as e:
+                # first_token_at is only set by streamed tokens
+                if retries >= max_retries or timer.first_token_at is not None:
+                    raise
+                delay = backoff * 2 ** retries
+                retries += 1
+                logger.warning(f"LLM call '{call_site}' failed ({e.__class__.__name__}), retry {retries} in {delay}s")
+                time.sleep(delay)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        end = time.perf_counter()
+        # Unstreamed calls deliver their first token with the whole response
+        first_token = timer.first_token_at if timer.first_token_at is not None else (None if error else end)
+        input_tokens, output_tokens = _usage(response)
+        cost = (
+            (input_tokens or 0) * app_config.get('LLM_INPUT_PRICE_PER_MTOK', 0.0)
+            + (output_tokens or 0) * app_config.get('LLM_OUTPUT_PRICE_PER_MTOK', 0.0)
+        ) / 1_000_000
+        call = {
+            'call_site': call_site,
+            'latency_ms': round((end - start) * 1000, 2),
+            'ttft_ms': round((first_token - start) * 1000, 2) if first_token is not None else None,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'cost_usd': round(cost, 8),
+            'retries': retries,
+            'error': f"{error.__class__.__name__}: {error}" if error else None
+        }
+        llm_metrics.record(call)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.record(call)
+
+def init_llm_metrics(app):
+    """Logs the LLM calls of each request that made any, after the response (streams included) ends."""
+
+    @app.before_request
+    def start_llm_stats():
+        stats = RequestLLMStats()
+        g.llm_stats = stats
+        _request_stats.set(stats)
+
+    @app.after_request
+    def note_llm_status(response):
+        g.llm_response_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def report_llm_stats(exc):
+        stats = g.get('llm_stats')
+        if stats is None or not stats.calls:
+            # A streamed response makes its calls after the first teardown; the teardown
+            # that runs when the stream closes reports them
+            return
+        g.pop('llm_stats')
+        _request_stats.set(None)
+        report = stats.to_dict()
+        logger.info(json.dumps({
+            'event': 'request_llm_calls',
+            'method': request.method,
+            'path': request.path,
+            'status': g.get('llm_response_status'),
+            **report
+        }))
@@ -0,0 +1,69 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def encode_cursor(*values):
+    """Encodes the sort key of the last row of a page into an opaque cursor string."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """Decodes a cursor produced by encode_cursor. Returns the list of values or None if invalid."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list):
+        return None
+    return values
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Parses a page size query argument. Returns the clamped int or None if invalid."""
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return None
+    if limit < 1:
+        return None
+    return min(limit, maximum)
+
+def parse_datetime(value):
+    """Parses an ISO 8601 string into a naive UTC datetime. Returns None if invalid."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+def decode_date_cursor(cursor):
+    """Decodes a (start_date, id) keyset cursor. Returns the tuple or None if invalid."""
+    values = decode_cursor(cursor)
+    if not values or len(values) != 2:
+        return None
+    start_date = parse_datetime(values[0])
+    if not start_date or not isinstance(values[1], int):
+        return None
+    return start_date, values[1]
+
+def decode_rank_cursor(cursor):
+    """Decodes a (rank, id) search cursor. Returns the tuple or None if invalid."""
+    values = decode_cursor(cursor)
+    if not values or len(values) != 2:
+        return None
+    rank, last_id = values
+    if isinstance(rank, bool) or not isinstance(rank, (int, float)) or not isinstance(last_id, int):
+        return None
+    return float(rank), last_id
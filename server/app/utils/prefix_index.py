@@ -0,0 +1,94 @@
+import re
+import threading
+from bisect import bisect_left, insort
+
+_WORD = re.compile(r'\w+')
+
+def normalize(text):
+    """Lowercases text and collapses whitespace so lookups are case and spacing insensitive."""
+    return ' '.join((text or '').casefold().split())
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index over (id, label) pairs.
+
+    Every label is stored once under its full text and once per later word, so
+    'data' finds both 'Data Science Club' and 'Big Data Meetup'. Lookups are a
+    bisect plus a short scan; writes are a bisect insert into the sorted list.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._labels = {}
+        self._names = []   # (normalized label, id)
+        self._words = []   # (normalized label from a later word onwards, id)
+
+    @staticmethod
+    def _keys(label):
+        name = normalize(label)
+        words = [name[m.start():] for m in _WORD.finditer(name) if m.start() > 0]
+        return name, words
+
+    def _remove_locked(self, item_id):
+        label = self._labels.pop(item_id, None)
+        if label is None:
+            return
+        name, words = self._keys(label)
+        for entries, keys in ((self._names, [name]), (self._words, words)):
+            for key in keys:
+                i = bisect_left(entries, (key, item_id))
+                if i < len(entries) and entries[i] == (key, item_id):
+                    del entries[i]
+
+    def add(self, item_id, label):
+        """Adds or replaces the label of `item_id`."""
+        name, words = self._keys(label)
+        with self._lock:
+            self._remove_locked(item_id)
+            self._labels[item_id] = label
+            insort(self._names, (name, item_id))
+            for key in words:
+                insort(self._words, (key, item_id))
+
+    def remove(self, item_id):
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def replace(self, items):
+        """Rebuilds the index from an iterable of (id, label) pairs."""
+        labels, names, words = {}, [], []
+        for item_id, label in items:
+            labels[item_id] = label
+            name, later = self._keys(label)
+            names.append((name, item_id))
+            words.extend((key, item_id) for key in later)
+        names.sort()
+        words.sort()
+        with self._lock:
+            self._labels, self._names, self._words = labels, names, words
+
+    def search(self, prefix, limit):
+        """
+        Returns up to `limit` (id, label) pairs whose label or one of its words starts
+        with `prefix`. Labels that start with the prefix come first, then alphabetical.
+        """
+        prefix = normalize(prefix)
+        if not prefix or limit < 1:
+            return []
+
+        results, seen = [], set()
+        with self._lock:
+            for entries in (self._names, self._words):
+                i = bisect_left(entries, (prefix,))
+                while i < len(entries) and len(results) < limit:
+                    key, item_id = entries[i]
+                    if not key.startswith(prefix):
+                        break
+                    if item_id not in seen:
+                        seen.add(item_id)
+                        results.append((item_id, self._labels[item_id]))
+                    i += 1
+        return results
+
+    def __len__(self):
+        return len(self._labels)
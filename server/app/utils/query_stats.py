@@ -0,0 +1,153 @@
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+# Collapse literals and placeholder lists so "WHERE id IN (?, ?, ?)" and
+# "WHERE id IN (?)" count as the same statement shape.
+_WHITESPACE = re.compile(r'\s+')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*(?:\?|%\([^)]*\)s|%s)(?:\s*,\s*(?:\?|%\([^)]*\)s|%s))*\s*\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+def statement_shape(statement):
+    """Normalizes a SQL statement so repeated executions with different parameters compare equal."""
+    shape = _STRING.sub('?', statement)
+    shape = _NUMBER.sub('?', shape)
+    shape = _PLACEHOLDER_LIST.sub('(?)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+class QueryStats:
+    """Counts queries, total DB time and repeated statement shapes."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement, duration):
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold):
+        """Returns [(shape, count)] for shapes executed at least `threshold` times."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def to_dict(self, threshold):
+        return {
+            'queries': self.count,
+            'db_time_ms': round(self.duration * 1000, 2),
+            'repeated': [{'statement': shape, 'count': n} for shape, n in self.repeated(threshold)]
+        }
+
+def _collectors():
+    if not hasattr(_local, 'collectors'):
+        _local.collectors = []
+    return _local.collectors
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _collectors():
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collectors = _collectors()
+    if not collectors:
+        return
+    starts = conn.info.get('query_start_time')
+    duration = time.perf_counter() - starts.pop() if starts else 0.0
+    for stats in collectors:
+        stats.record(statement, duration)
+
+@contextmanager
+def collect_queries():
+    """Collects QueryStats for every statement executed on this thread inside the block."""
+    stats = QueryStats()
+    collectors = _collectors()
+    collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        collectors.remove(stats)
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+@contextmanager
+def assert_query_budget(max_queries, max_repeats=None):
+    """
+    Fails when the block runs more than `max_queries` statements, or when any single
+    statement shape runs more than `max_repeats` times (the N+1 signature).
+
+        with assert_query_budget(3):
+            client.get('/api/events')
+    """
+    with collect_queries() as stats:
+        yield stats
+
+    problems = []
+    if stats.count > max_queries:
+        problems.append(f"{stats.count} queries executed, budget is {max_queries}")
+    if max_repeats is not None:
+        for shape, n in stats.repeated(max_repeats + 1):
+            problems.append(f"statement ran {n} times (max {max_repeats}): {shape}")
+    if problems:
+        statements = '\n'.join(f"  {n}x {shape}" for shape, n in stats.shapes.most_common())
+        raise QueryBudgetExceeded('; '.join(problems) + '\nStatements:\n' + statements)
+
+def init_query_stats(app):
+    """Records per-request query stats, logs them and adds X-DB-* headers in debug mode."""
+    if not app.config.get('QUERY_STATS_ENABLED', True):
+        return
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+    threshold = app.config.get('QUERY_REPEAT_THRESHOLD', 5)
+
+    @app.before_request
+    def start_query_stats():
+        stats = QueryStats()
+        _collectors().append(stats)
+        g.query_stats = stats
+
+    @app.after_request
+    def report_query_stats(response):
+        stats = g.get('query_stats')
+        if stats is None:
+            return response
+
+        report = stats.to_dict(threshold)
+        report.update({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code
+        })
+        if report['repeated']:
+            logger.warning(json.dumps({'event': 'possible_n_plus_one', **report}))
+        else:
+            logger.info(json.dumps({'event': 'request_queries', **report}))
+
+        if app.debug:
+            response.headers['X-DB-Query-Count'] = str(stats.count)
+            response.headers['X-DB-Query-Time-Ms'] = str(report['db_time_ms'])
+            response.headers['X-DB-Repeated-Queries'] = str(len(report['repeated']))
+        return response
+
+    @app.teardown_request
+    def stop_query_stats(exc):
+        stats = g.pop('query_stats', None)
+        collectors = _collectors()
+        if stats is not None and stats in collectors:
+            collectors.remove(stats)
@@ -0,0 +1,80 @@
+import logging
+import re
+import threading
+from sqlalchemy import REAL, and_, cast, func, inspect, literal_column, or_
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+_TERM = re.compile(r'\w+')
+
+# (database url, table) -> whether the table has its search_vector column, checked once per process
+_search_vector_tables = {}
+_search_vector_lock = threading.Lock()
+
+def prefix_tsquery(text):
+    """Turns free text into a to_tsquery string that matches every term as a prefix ('robo club' -> 'robo:* & club:*')."""
+    return ' & '.join(f'{term}:*' for term in _TERM.findall(text))
+
+def full_text_enabled(model):
+    """
+    Whether `model`'s table has the search_vector column. Only the Alembic migration adds it,
+    and only on PostgreSQL; a database built with db.create_all() has none and uses ILIKE.
+    """
+    engine = db.engine
+    if engine.dialect.name != 'postgresql':
+        return False
+
+    key = (str(engine.url), model.__tablename__)
+    with _search_vector_lock:
+        if key not in _search_vector_tables:
+            columns = inspect(engine).get_columns(model.__tablename__)
+            found = any(c['name'] == 'search_vector' for c in columns)
+            if not found:
+                logger.warning(
+                    f"{model.__tablename__}.search_vector is missing (run the migrations); searching with ILIKE"
+                )
+            _search_vector_tables[key] = found
+        return _search_vector_tables[key]
+
+def ranked_search(query, model, text, columns, after=None, limit=None):
+    """
+    Filters `query` to rows of `model` matching `text`, best match first.
+    On PostgreSQL this matches the table's generated search_vector column and orders by
+    ts_rank; other databases, and tables without the column, fall back to ILIKE across
+    `columns` and order by id.
+    :param after: (rank, id) of the last row on the previous page
+    :param limit: Maximum number of rows to return, or None for all remaining
+    :return: List of rows, (rank, id) cursor for the next page or None
+    """
+    use_full_text = full_text_enabled(model)
+    if use_full_text:
+        tsquery_text = prefix_tsquery(text)
+        if not tsquery_text:
+            return [], None
+        vector = literal_column(f'{model.__tablename__}.search_vector')
+        tsquery = func.to_tsquery('english', tsquery_text)
+        rank = func.ts_rank(vector, tsquery)
+        query = query.filter(vector.op('@@')(tsquery))
+        if after:
+            # ts_rank is a real; compare as real so the cursor value round-trips exactly
+            last_rank = cast(after[0], REAL)
+            query = query.filter(or_(rank < last_rank, and_(rank == last_rank, model.id > after[1])))
+        query = query.add_columns(rank).order_by(rank.desc(), model.id)
+    else:
+        search = f"%{text}%"
+        query = query.filter(or_(*(column.ilike(search) for column in columns)))
+        if after:
+            query = query.filter(model.id > after[1])
+        query = query.order_by(model.id)
+
+    rows = query.all() if limit is None else query.limit(limit + 1).all()
+    if use_full_text:
+        ranks = [r for _, r in rows]
+        rows = [obj for obj, _ in rows]
+    else:
+        ranks = [0.0] * len(rows)
+
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    return rows[:limit], (ranks[limit - 1], rows[limit - 1].id)
@@ -0,0 +1,123 @@
+import logging
+import os
+import signal
+import socket
+import threading
+import click
+from flask import request
+from app.services.job_service import JobService
+
+logger = logging.getLogger(__name__)
+
+class JobWorker:
+    """
+    Pool of threads that claim and run jobs from the jobs table. Several pools (web
+    processes and `flask worker` processes) can share one database.
+    """
+
+    def __init__(self, app, concurrency=2, poll_interval=1.0, heartbeat_interval=30):
+        self.app = app
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.name = f'{socket.gethostname()}:{os.getpid()}:{id(self):x}'
+        self._stop = threading.Event()
+        self._threads = []
+        self._running = set()
+        self._running_lock = threading.Lock()
+
+    def start(self):
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._work, name=f'job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        thread = threading.Thread(target=self._maintain, name='job-worker-heartbeat', daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        logger.info(f"Job worker {self.name} started with {self.concurrency} thread(s)")
+
+    def stop(self, timeout=None):
+        """Stops claiming new jobs and waits for the running ones to finish."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def run_once(self):
+        """Claims and runs a single job. Returns False if none was due."""
+        worker_id = f'{self.name}:{threading.current_thread().name}'
+        with self.app.app_context():
+            job = JobService.claim(worker_id)
+            if not job:
+                return False
+            with self._running_lock:
+                self._running.add((job.id, worker_id))
+            try:
+                JobService.run(job)
+            finally:
+                with self._running_lock:
+                    self._running.discard((job.id, worker_id))
+        return True
+
+    def _work(self):
+        while not self._stop.is_set():
+            try:
+                if not self.run_once():
+                    self._stop.wait(self.poll_interval)
+            except Exception as e:
+                logger.error(f"Job worker error: {e}")
+                self._stop.wait(self.poll_interval)
+
+    def _maintain(self):
+        # Keeps the locks of long jobs fresh and recovers jobs of workers that died
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                with self.app.app_context():
+                    with self._running_lock:
+                        running = list(self._running)
+                    for job_id, worker_id in running:
+                        JobService.heartbeat([job_id], worker_id)
+                    JobService.requeue_stale()
+            except Exception as e:
+                logger.error(f"Job worker maintenance error: {e}")
+
+def init_worker(app):
+    """
+    Registers the `flask worker` command and, unless JOB_WORKERS_IN_PROCESS is 0, an
+    in-process pool that starts with the first request (so CLI commands such as
+    `flask db upgrade` do not start one).
+    """
+    state = {'worker': None}
+    lock = threading.Lock()
+
+    @app.before_request
+    def start_in_process_worker():
+        if state['worker'] is not None or request.endpoint is None:
+            return
+        concurrency = app.config.get('JOB_WORKERS_IN_PROCESS', 2)
+        with lock:
+            if state['worker'] is None:
+                state['worker'] = False
+                if concurrency:
+                    state['worker'] = JobWorker(app, concurrency, app.config.get('JOB_POLL_INTERVAL', 1.0))
+                    state['worker'].start()
+
+    @app.cli.command('worker')
+    @click.option('--concurrency', '-c', type=int, default=None, help='Jobs run at once (default JOB_WORKER_CONCURRENCY).')
+    def worker_command(concurrency):
+        """Run background jobs until interrupted."""
+        worker = JobWorker(
+            app,
+            concurrency or app.config.get('JOB_WORKER_CONCURRENCY', 4),
+            app.config.get('JOB_POLL_INTERVAL', 1.0)
+        )
+        stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+        worker.start()
+        click.echo(f"Worker {worker.name} running {worker.concurrency} job(s) at a time. Press Ctrl+C to stop.")
+        try:
+            while not stopped.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        click.echo("Stopping, waiting for running jobs to finish...")
+        worker.stop()
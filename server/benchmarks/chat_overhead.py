@@ -0,0 +1,50 @@
+"""
+Per-message setup overhead of /api/chat, before and after compiling the graph once.
+
+    cd server && python -m benchmarks.chat_overhead [iterations]
+
+"before" rebuilds the model client, binds the tools and compiles the graph on every
+message, as process_chat used to; "after" is the cached AIService.get_graph().
+No request is sent to Gemini, so a dummy GEMINI_API_KEY is used when none is set.
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark-dummy-key")
+
+from langgraph.checkpoint.memory import MemorySaver
+from app.services.ai_service import AIService
+
+def measure(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def per_message_rebuild():
+    model = AIService.create_model(os.environ["GEMINI_API_KEY"])
+    AIService.build_graph(model, MemorySaver())
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{label:<8} mean {statistics.mean(samples):9.3f} ms   p50 {statistics.median(samples):9.3f} ms   p95 {p95:9.3f} ms")
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    AIService.get_graph()  # warm the cache so "after" measures steady state
+    before = measure(per_message_rebuild, iterations)
+    after = measure(AIService.get_graph, iterations)
+
+    print(f"Per-message graph setup over {iterations} iterations (excludes the model call itself)")
+    report("before", before)
+    report("after", after)
+    print(f"speedup  {statistics.mean(before) / max(statistics.mean(after), 1e-9):,.0f}x")
+
+if __name__ == "__main__":
+    main()
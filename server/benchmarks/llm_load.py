@@ -0,0 +1,209 @@
+"""
+Load test of /api/chat and candidate evaluation against the offline fake model.
+
+    cd server && python -m benchmarks.llm_load [--target chat|evaluate] [--concurrency 1,4,16]
+                                               [--requests 200] [--profile fast]
+
+LLM_PROVIDER is forced to 'fake' (see app/utils/fake_llm.py), so no network or quota is
+needed; FAKE_LLM_* variables still apply. Each concurrency level sends --requests requests
+through the Flask test client from that many threads, standing in for sync workers. The
+mean request time is split into model time, time in the chat checkpointer, other database
+time and the rest: graph, tools, serialization and lock waits. Database time is counted on
+every thread, since LangGraph runs checkpointer and tool calls on its own executor; its
+checkpoint writes can overlap the model call, so the parts may add up to more than the
+request time.
+
+Needs a migrated database (DATABASE_URL). Benchmark users, a club and join requests are
+created on the first run and reused after that.
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+from sqlalchemy import event
+
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ.setdefault("JOB_WORKERS_IN_PROCESS", "0")
+
+from app import create_app
+from app.extensions import db
+from app.models.club import Club
+from app.models.club_request import ClubRequest
+from app.models.user import User
+from app.services.ai_service import checkpointer
+from app.utils.auth_utils import create_token, hash_password
+from app.utils.llm_metrics import llm_metrics
+
+BENCH_CLUB = "Benchmark Club"
+
+# None of these are simple lookups, so the chat fast path does not answer them
+CHAT_MESSAGES = [
+    "Which clubs would suit someone into design?",
+    "Are there events I could go to with friends?",
+    "Summarize the latest announcements for me",
+    "What can you help me with?",
+]
+
+def setup(app, users):
+    """Returns (tokens of `users` benchmark users, their pending request ids in the benchmark club)."""
+    with app.app_context():
+        accounts = []
+        for i in range(users):
+            email = f"bench-{i}@benchmark.local"
+            user = User.query.filter_by(email=email).first()
+            if not user:
+                user = User(name=f"Bench User {i}", email=email, password_hash=hash_password("benchmark"), is_admin=i == 0)
+                db.session.add(user)
+            accounts.append(user)
+        db.session.commit()
+
+        owner = accounts[0]
+        club = Club.query.filter_by(name=BENCH_CLUB).first()
+        if not club:
+            club = Club(name=BENCH_CLUB, description="Load test club", owner_id=owner.id, roles=["member"], category="Benchmark")
+            db.session.add(club)
+            db.session.commit()
+
+        request_ids = []
+        for user in accounts:
+            req = ClubRequest.query.filter_by(club_id=club.id, user_id=user.id, status="pending").first()
+            if not req:
+                req = ClubRequest(club_id=club.id, user_id=user.id, role="member", message="benchmark")
+                db.session.add(req)
+                db.session.commit()
+            request_ids.append(req.id)
+
+        return [create_token(u.id) for u in accounts], request_ids
+
+class Totals:
+    """Database and checkpointer time summed over all threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queries = 0
+        self.db_ms = 0.0
+        self.checkpointer_ms = 0.0
+        self.local = threading.local()
+
+    def snapshot(self):
+        with self.lock:
+            return self.queries, self.db_ms, self.checkpointer_ms
+
+    def watch(self, engine):
+        def before(conn, cursor, statement, parameters, context, executemany):
+            self.local.start = time.perf_counter()
+
+        def after(conn, cursor, statement, parameters, context, executemany):
+            elapsed = (time.perf_counter() - self.local.start) * 1000
+            with self.lock:
+                self.queries += 1
+                self.db_ms += elapsed
+
+        event.listen(engine, "before_cursor_execute", before)
+        event.listen(engine, "after_cursor_execute", after)
+
+        for name in ("get_tuple", "put", "put_writes"):
+            method = getattr(checkpointer, name)
+
+            def timed(*args, _method=method, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return _method(*args, **kwargs)
+                finally:
+                    with self.lock:
+                        self.checkpointer_ms += (time.perf_counter() - start) * 1000
+
+            setattr(checkpointer, name, timed)
+
+def model_time_ms():
+    return sum(site["latency_ms"]["sum"] for site in llm_metrics.snapshot()["call_sites"].values())
+
+def run(app, target, concurrency, requests, tokens, request_ids):
+    """Sends `requests` requests from `concurrency` threads; returns per-request samples."""
+    client = app.test_client()
+    owner_headers = {"Authorization": f"Bearer {tokens[0]}"}
+    counter = iter(range(requests))
+    lock = threading.Lock()
+    samples = []
+
+    def send(worker):
+        if target == "chat":
+            headers = {"Authorization": f"Bearer {tokens[worker]}"}
+            body = {"message": CHAT_MESSAGES[worker % len(CHAT_MESSAGES)]}
+            return client.post("/api/chat/", json=body, headers=headers)
+        body = {"criteria": "Complete Tech Guy", "force_refresh": True}
+        return client.post(f"/api/clubs/requests/{request_ids[worker]}/evaluate", json=body, headers=owner_headers)
+
+    def loop(worker):
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    return
+            start = time.perf_counter()
+            response = send(worker)
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                samples.append((elapsed, response.status_code))
+
+    threads = [threading.Thread(target=loop, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+def report(concurrency, samples, wall, model_ms, queries, db_ms, checkpointer_ms, retries):
+    """One line per concurrency level; the time split is the mean per request."""
+    latencies = sorted(s[0] for s in samples)
+    n = len(latencies)
+    model, checkpoint = model_ms / n, checkpointer_ms / n
+    # Checkpointer time includes its own queries
+    other_db = max(0.0, db_ms / n - checkpoint)
+    rest = max(0.0, statistics.mean(latencies) - model - checkpoint - other_db)
+    failed = sum(1 for s in samples if s[1] >= 400)
+    p95 = latencies[min(n - 1, int(n * 0.95))]
+    print(
+        f"{concurrency:>4} threads  {n / wall:7.1f} req/s   p50 {statistics.median(latencies):8.1f} ms"
+        f"   p95 {p95:8.1f} ms   model {model:8.1f} ms   checkpointer {checkpoint:6.1f} ms"
+        f"   other db {other_db:6.1f} ms ({queries / n:.0f} q)   rest {rest:6.1f} ms"
+        f"   retries {retries}   failed {failed}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", choices=("chat", "evaluate"), default="chat")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated thread counts to sweep")
+    parser.add_argument("--requests", type=int, default=200, help="requests per concurrency level")
+    parser.add_argument("--profile", default=os.environ.get("FAKE_LLM_PROFILE", "fast"),
+                        help="fake model latency profile: instant, fast, gemini-flash or slow")
+    args = parser.parse_args()
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    app = create_app(os.environ.get("FLASK_CONFIG", "development"))
+    app.config["FAKE_LLM_PROFILE"] = args.profile
+    tokens, request_ids = setup(app, max(levels))
+    totals = Totals()
+    with app.app_context():
+        totals.watch(db.engine)
+
+    print(f"{args.target}: {args.requests} requests per level, fake model profile '{args.profile}'")
+    for concurrency in levels:
+        before = llm_metrics.snapshot()["call_sites"]
+        model_before = model_time_ms()
+        queries_before, db_before, checkpointer_before = totals.snapshot()
+        start = time.perf_counter()
+        samples = run(app, args.target, concurrency, args.requests, tokens, request_ids)
+        wall = time.perf_counter() - start
+        after = llm_metrics.snapshot()["call_sites"]
+        retries = sum(site["retries"] for site in after.values()) - sum(site["retries"] for site in before.values())
+        queries, db_ms, checkpointer_ms = totals.snapshot()
+        report(
+            concurrency, samples, wall, model_time_ms() - model_before,
+            queries - queries_before, db_ms - db_before, checkpointer_ms - checkpointer_before, retries
+        )
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Stress check that concurrent accepts of club join requests never lose or duplicate a member.
+
+    cd server && python -m benchmarks.membership_concurrency [--threads 16] [--repeat 2] [--rounds 3]
+
+Each round creates a fresh club with --threads pending join requests from different users.
+Then --threads threads, released together, each call ClubService.handle_request to accept
+one request. With --repeat > 1 every request is also accepted that many times at once by
+further threads, so duplicate decisions race as well. After the round:
+
+- every applicant has exactly one ClubMembership row in the club,
+- each membership has the role the applicant asked for,
+- the club has one membership per request and every request is accepted,
+- exactly one accept per request succeeded; the others got "Request already accepted".
+
+tests/test_membership_concurrency.py runs the same rounds under pytest.
+
+The exit status is 1 if any check fails. Run it against a shared PostgreSQL database
+(DATABASE_URL, migrated): only there do row locks and ON CONFLICT inserts contend. SQLite
+lets one writer in at a time, so it only checks the pending-status guard. Benchmark users
+are created on the first run and reused; each round's club is left in place for inspection.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import uuid
+
+os.environ.setdefault("JOB_WORKERS_IN_PROCESS", "0")
+
+from sqlalchemy import func
+
+from app import create_app
+from app.extensions import db
+from app.models.club import Club
+from app.models.club_membership import ClubMembership
+from app.models.club_request import ClubRequest
+from app.models.user import User
+from app.services.club_service import ClubService
+from app.utils.auth_utils import hash_password
+
+ROLES = ["member", "designer", "developer", "organizer"]
+
+def setup(app, applicants):
+    """Creates a club with one pending request per applicant; returns (club id, owner id, {request id: (user id, role)})."""
+    with app.app_context():
+        users = []
+        for i in range(applicants + 1):
+            email = f"stress-{i}@benchmark.local"
+            user = User.query.filter_by(email=email).first()
+            if not user:
+                user = User(name=f"Stress User {i}", email=email, password_hash=hash_password("benchmark"))
+                db.session.add(user)
+            users.append(user)
+        db.session.commit()
+
+        owner = users[0]
+        club = Club(
+            name=f"Stress Club {uuid.uuid4().hex[:8]}", description="Membership concurrency check",
+            owner_id=owner.id, roles=list(ROLES), category="Benchmark"
+        )
+        db.session.add(club)
+        db.session.commit()
+
+        requests = {}
+        for i, user in enumerate(users[1:]):
+            req = ClubRequest(club_id=club.id, user_id=user.id, role=ROLES[i % len(ROLES)], message="stress")
+            db.session.add(req)
+            db.session.flush()
+            requests[req.id] = (user.id, req.role)
+        db.session.commit()
+        return club.id, owner.id, requests
+
+def decide_all(app, owner_id, decisions):
+    """
+    Applies [(request id, status)] decisions, each from its own thread, all started together.
+    :return: List of (request id, status, error or None)
+    """
+    barrier = threading.Barrier(len(decisions))
+    outcomes = []
+    lock = threading.Lock()
+
+    def decide(request_id, status):
+        with app.app_context():
+            barrier.wait()
+            try:
+                _, error = ClubService.handle_request(request_id, status, "decided", owner_id)
+            except Exception as e:
+                error = f"{e.__class__.__name__}: {e}"
+            finally:
+                db.session.remove()
+            with lock:
+                outcomes.append((request_id, status, error))
+
+    threads = [threading.Thread(target=decide, args=decision) for decision in decisions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+def accept_all(app, owner_id, request_ids, repeat):
+    """Accepts every request `repeat` times at once; returns the errors other than the expected conflicts."""
+    outcomes = decide_all(app, owner_id, [(rid, "accepted") for rid in request_ids for _ in range(repeat)])
+    errors = []
+    for request_id in request_ids:
+        results = [error for rid, _, error in outcomes if rid == request_id]
+        successes = results.count(None)
+        if successes != 1:
+            errors.append((request_id, f"{successes} accepts succeeded, expected 1"))
+        errors += [
+            (request_id, error) for error in results
+            if error is not None and error != "Request already accepted"
+        ]
+    return errors
+
+def check(app, club_id, requests, errors):
+    """Returns the failed checks of a round."""
+    failures = [f"request {rid}: {error}" for rid, error in errors]
+    with app.app_context():
+        rows = db.session.query(
+            ClubMembership.user_id, func.count(ClubMembership.id), func.min(ClubMembership.role), func.max(ClubMembership.role)
+        ).filter(ClubMembership.club_id == club_id).group_by(ClubMembership.user_id).all()
+        memberships = {user_id: (count, min_role, max_role) for user_id, count, min_role, max_role in rows}
+
+        for user_id, role in requests.values():
+            count, min_role, max_role = memberships.get(user_id, (0, None, None))
+            if count != 1:
+                failures.append(f"user {user_id}: {count} memberships, expected 1")
+            elif min_role != role or max_role != role:
+                failures.append(f"user {user_id}: role {min_role!r}, expected {role!r}")
+
+        expected_users = {user_id for user_id, _ in requests.values()}
+        extra = set(memberships) - expected_users
+        if extra:
+            failures.append(f"unexpected members: {sorted(extra)}")
+
+        total = sum(count for count, _, _ in memberships.values())
+        if total != len(requests):
+            failures.append(f"{total} memberships, expected {len(requests)}")
+
+        accepted = ClubRequest.query.filter(
+            ClubRequest.id.in_(list(requests)), ClubRequest.status == "accepted"
+        ).count()
+        if accepted != len(requests):
+            failures.append(f"{accepted} accepted requests, expected {len(requests)}")
+
+        roles = db.session.query(Club.roles).filter(Club.id == club_id).scalar()
+        if list(roles or []) != ROLES:
+            failures.append(f"club roles changed to {roles!r}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16, help="pending requests, each accepted from its own thread")
+    parser.add_argument("--repeat", type=int, default=2, help="concurrent accepts of each request")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    app = create_app(os.environ.get("FLASK_CONFIG", "development"))
+    with app.app_context():
+        dialect = db.engine.dialect.name
+    if dialect != "postgresql":
+        print(f"warning: running on {dialect}; only PostgreSQL exercises the row locks and ON CONFLICT under contention")
+
+    failed = 0
+    for round_number in range(1, args.rounds + 1):
+        club_id, owner_id, requests = setup(app, args.threads)
+        start = time.perf_counter()
+        errors = accept_all(app, owner_id, list(requests), args.repeat)
+        elapsed = (time.perf_counter() - start) * 1000
+        failures = check(app, club_id, requests, errors)
+        status = "ok" if not failures else f"FAILED ({len(failures)})"
+        print(f"round {round_number}: {len(requests)} requests x {args.repeat} accepts in {elapsed:7.1f} ms   club {club_id}   {status}")
+        for failure in failures:
+            print(f"    {failure}")
+        failed += bool(failures)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
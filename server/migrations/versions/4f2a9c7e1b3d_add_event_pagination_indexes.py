@@ -0,0 +1,29 @@
+"""add event pagination indexes
+
+Revision ID: 4f2a9c7e1b3d
+Revises: 3233793f3fc5
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2a9c7e1b3d'
+down_revision = '3233793f3fc5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_start_date_id', ['start_date', 'id'], unique=False)
+        batch_op.create_index('ix_events_status_start_date_id', ['status', 'start_date', 'id'], unique=False)
+        batch_op.create_index('ix_events_club_id_start_date_id', ['club_id', 'start_date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_club_id_start_date_id')
+        batch_op.drop_index('ix_events_status_start_date_id')
+        batch_op.drop_index('ix_events_start_date_id')
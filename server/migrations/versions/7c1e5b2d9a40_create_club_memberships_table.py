@@ -0,0 +1,125 @@
+"""create club_memberships table
+
+Revision ID: 7c1e5b2d9a40
+Revises: 4f2a9c7e1b3d
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+import json
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1e5b2d9a40'
+down_revision = '4f2a9c7e1b3d'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+memberships_table = sa.table(
+    'club_memberships',
+    sa.column('club_id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('role', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def _load_json(value):
+    if isinstance(value, str):
+        return json.loads(value)
+    return value or []
+
+
+def upgrade():
+    op.create_table('club_memberships',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('club_id', 'user_id', name='uq_club_membership')
+    )
+    with op.batch_alter_table('club_memberships', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_club_memberships_club_id'), ['club_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_club_memberships_user_id'), ['user_id'], unique=False)
+
+    # Backfill from clubs.members in batches of clubs, skipping duplicates and deleted users
+    conn = op.get_bind()
+    now = datetime.utcnow()
+    last_id = 0
+    while True:
+        clubs = conn.execute(
+            sa.text("SELECT id, members FROM clubs WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {'last_id': last_id, 'limit': BATCH_SIZE}
+        ).fetchall()
+        if not clubs:
+            break
+        last_id = clubs[-1][0]
+
+        rows = []
+        for club_id, members in clubs:
+            seen = set()
+            for m in _load_json(members):
+                user_id = int(m['user_id'])
+                if user_id in seen:
+                    continue
+                seen.add(user_id)
+                rows.append({'club_id': club_id, 'user_id': user_id, 'role': m.get('role') or 'member', 'created_at': now})
+
+        if rows:
+            user_ids = list({r['user_id'] for r in rows})
+            existing = {
+                row[0] for row in conn.execute(
+                    sa.select(sa.column('id')).select_from(sa.table('users')).where(sa.column('id').in_(user_ids))
+                )
+            }
+            rows = [r for r in rows if r['user_id'] in existing]
+            if rows:
+                op.bulk_insert(memberships_table, rows)
+
+    with op.batch_alter_table('clubs', schema=None) as batch_op:
+        batch_op.drop_column('members')
+
+
+def downgrade():
+    with op.batch_alter_table('clubs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('members', sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        club_ids = [row[0] for row in conn.execute(
+            sa.text("SELECT id FROM clubs WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {'last_id': last_id, 'limit': BATCH_SIZE}
+        )]
+        if not club_ids:
+            break
+        last_id = club_ids[-1]
+
+        members = {club_id: [] for club_id in club_ids}
+        for club_id, user_id, role in conn.execute(
+            sa.select(memberships_table.c.club_id, memberships_table.c.user_id, memberships_table.c.role)
+            .where(memberships_table.c.club_id.in_(club_ids))
+            .order_by(memberships_table.c.club_id)
+        ):
+            members[club_id].append({'user_id': user_id, 'role': role})
+
+        for club_id, club_members in members.items():
+            conn.execute(
+                sa.text("UPDATE clubs SET members = :members WHERE id = :id"),
+                {'members': json.dumps(club_members), 'id': club_id}
+            )
+
+    with op.batch_alter_table('club_memberships', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_club_memberships_user_id'))
+        batch_op.drop_index(batch_op.f('ix_club_memberships_club_id'))
+
+    op.drop_table('club_memberships')
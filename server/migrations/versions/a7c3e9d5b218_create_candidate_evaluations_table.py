@@ -0,0 +1,36 @@
+"""create candidate evaluations table
+
+Revision ID: a7c3e9d5b218
+Revises: f3b7d2e9a145
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e9d5b218'
+down_revision = 'f3b7d2e9a145'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('candidate_evaluations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('profile_hash', sa.String(length=64), nullable=False),
+    sa.Column('criteria_hash', sa.String(length=64), nullable=False),
+    sa.Column('criteria', sa.Text(), nullable=False),
+    sa.Column('result', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'profile_hash', 'criteria_hash', name='uq_candidate_evaluation')
+    )
+
+
+def downgrade():
+    op.drop_table('candidate_evaluations')
@@ -0,0 +1,52 @@
+"""add avatar_url to users
+
+Revision ID: b8d3f61a2c57
+Revises: 7c1e5b2d9a40
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d3f61a2c57'
+down_revision = '7c1e5b2d9a40'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('avatar_url', sa.String(length=255), nullable=True))
+
+    # Backfill from the first OAuth account that has an avatar_url, in batches
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text("SELECT id, user_id, meta_data FROM oauth WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {'last_id': last_id, 'limit': BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        for _, user_id, meta_data in rows:
+            if isinstance(meta_data, str):
+                meta_data = json.loads(meta_data)
+            avatar_url = (meta_data or {}).get('avatar_url')
+            if avatar_url:
+                conn.execute(
+                    sa.text("UPDATE users SET avatar_url = :avatar_url WHERE id = :id AND avatar_url IS NULL"),
+                    {'avatar_url': avatar_url[:255], 'id': user_id}
+                )
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('avatar_url')
@@ -0,0 +1,70 @@
+"""create evaluation batch tables
+
+Revision ID: b9e4f1a6c327
+Revises: a7c3e9d5b218
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e4f1a6c327'
+down_revision = 'a7c3e9d5b218'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('evaluation_batches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('criteria', sa.Text(), nullable=False),
+    sa.Column('force_refresh', sa.Boolean(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('total', sa.Integer(), nullable=True),
+    sa.Column('evaluated', sa.Integer(), nullable=True),
+    sa.Column('cached', sa.Integer(), nullable=True),
+    sa.Column('failed', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('evaluation_batches', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_evaluation_batches_club_id'), ['club_id'], unique=False)
+
+    op.create_table('evaluation_batch_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('batch_id', sa.Integer(), nullable=False),
+    sa.Column('request_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('score', sa.Float(), nullable=True),
+    sa.Column('result', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['batch_id'], ['evaluation_batches.id'], ),
+    sa.ForeignKeyConstraint(['request_id'], ['club_requests.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('evaluation_batch_items', schema=None) as batch_op:
+        batch_op.create_index('ix_evaluation_batch_items_batch_id_score', ['batch_id', 'score'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('evaluation_batch_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_evaluation_batch_items_batch_id_score')
+
+    op.drop_table('evaluation_batch_items')
+    with op.batch_alter_table('evaluation_batches', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_evaluation_batches_club_id'))
+
+    op.drop_table('evaluation_batches')
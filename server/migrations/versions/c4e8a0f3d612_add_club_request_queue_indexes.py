@@ -0,0 +1,43 @@
+"""add club request queue indexes
+
+Revision ID: c4e8a0f3d612
+Revises: b8d3f61a2c57
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a0f3d612'
+down_revision = 'b8d3f61a2c57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Older duplicates of a pending request would violate the new unique index;
+    # keep the earliest one pending and reject the rest.
+    op.execute(sa.text("""
+        UPDATE club_requests
+        SET status = 'rejected', admin_response = 'Duplicate pending request'
+        WHERE status = 'pending'
+          AND id NOT IN (
+              SELECT MIN(id) FROM club_requests WHERE status = 'pending' GROUP BY club_id, user_id
+          )
+    """))
+
+    with op.batch_alter_table('club_requests', schema=None) as batch_op:
+        batch_op.create_index('ix_club_requests_club_id_status_created_at', ['club_id', 'status', 'created_at'], unique=False)
+        batch_op.create_index(
+            'uq_club_requests_pending', ['club_id', 'user_id'], unique=True,
+            postgresql_where=sa.text("status = 'pending'"),
+            sqlite_where=sa.text("status = 'pending'")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('club_requests', schema=None) as batch_op:
+        batch_op.drop_index('uq_club_requests_pending')
+        batch_op.drop_index('ix_club_requests_club_id_status_created_at')
@@ -0,0 +1,53 @@
+"""add full-text search vectors to clubs and events
+
+Revision ID: d5a9e3c1b7f4
+Revises: c4e8a0f3d612
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a9e3c1b7f4'
+down_revision = 'c4e8a0f3d612'
+branch_labels = None
+depends_on = None
+
+# Weighted documents: name/title rank above category/location, which rank above description.
+# The column is read through app.utils.search, which falls back to ILIKE when it is missing,
+# and is not mapped on the models so db.create_all() keeps working on SQLite.
+CLUB_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(category, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+EVENT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade():
+    # tsvector and GIN are PostgreSQL only; other databases keep using the ILIKE search
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, expression in (('clubs', CLUB_SEARCH_VECTOR), ('events', EVENT_SEARCH_VECTOR)):
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(expression, persisted=True), nullable=True
+        ))
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in ('events', 'clubs'):
+        op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_using='gin')
+        op.drop_column(table, 'search_vector')
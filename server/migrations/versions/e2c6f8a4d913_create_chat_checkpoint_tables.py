@@ -0,0 +1,71 @@
+"""create chat checkpoint tables
+
+Revision ID: e2c6f8a4d913
+Revises: d5a9e3c1b7f4
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c6f8a4d913'
+down_revision = 'd5a9e3c1b7f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('chat_threads',
+    sa.Column('thread_id', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('thread_id')
+    )
+    with op.batch_alter_table('chat_threads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_chat_threads_updated_at'), ['updated_at'], unique=False)
+
+    op.create_table('chat_checkpoints',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('thread_id', sa.String(length=255), nullable=False),
+    sa.Column('checkpoint_ns', sa.String(length=255), nullable=False),
+    sa.Column('checkpoint_id', sa.String(length=64), nullable=False),
+    sa.Column('parent_checkpoint_id', sa.String(length=64), nullable=True),
+    sa.Column('checkpoint_type', sa.String(length=32), nullable=False),
+    sa.Column('checkpoint', sa.LargeBinary(), nullable=False),
+    sa.Column('metadata_type', sa.String(length=32), nullable=False),
+    sa.Column('meta_data', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', name='uq_chat_checkpoint')
+    )
+    with op.batch_alter_table('chat_checkpoints', schema=None) as batch_op:
+        batch_op.create_index('ix_chat_checkpoints_thread_id_ns_id', ['thread_id', 'checkpoint_ns', 'id'], unique=False)
+
+    op.create_table('chat_checkpoint_writes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('thread_id', sa.String(length=255), nullable=False),
+    sa.Column('checkpoint_ns', sa.String(length=255), nullable=False),
+    sa.Column('checkpoint_id', sa.String(length=64), nullable=False),
+    sa.Column('task_id', sa.String(length=64), nullable=False),
+    sa.Column('task_path', sa.String(length=255), nullable=False),
+    sa.Column('idx', sa.Integer(), nullable=False),
+    sa.Column('channel', sa.String(length=255), nullable=False),
+    sa.Column('value_type', sa.String(length=32), nullable=False),
+    sa.Column('value', sa.LargeBinary(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', 'task_id', 'idx', name='uq_chat_checkpoint_write')
+    )
+
+
+def downgrade():
+    op.drop_table('chat_checkpoint_writes')
+    with op.batch_alter_table('chat_checkpoints', schema=None) as batch_op:
+        batch_op.drop_index('ix_chat_checkpoints_thread_id_ns_id')
+
+    op.drop_table('chat_checkpoints')
+    with op.batch_alter_table('chat_threads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_chat_threads_updated_at'))
+
+    op.drop_table('chat_threads')
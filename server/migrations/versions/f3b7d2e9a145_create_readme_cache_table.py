@@ -0,0 +1,42 @@
+"""create readme cache table
+
+Revision ID: f3b7d2e9a145
+Revises: e2c6f8a4d913
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b7d2e9a145'
+down_revision = 'e2c6f8a4d913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('readme_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('owner', sa.String(length=255), nullable=False),
+    sa.Column('repo', sa.String(length=255), nullable=False),
+    sa.Column('sha', sa.String(length=64), nullable=False),
+    sa.Column('etag', sa.String(length=255), nullable=True),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=True),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('owner', 'repo', 'sha', name='uq_readme_cache')
+    )
+    with op.batch_alter_table('readme_cache', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_readme_cache_last_used_at'), ['last_used_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('readme_cache', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_readme_cache_last_used_at'))
+
+    op.drop_table('readme_cache')
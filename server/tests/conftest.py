@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the app the way `cd server && python -m ...` scripts do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("JOB_WORKERS_IN_PROCESS", "0")
+
+def _postgres_url():
+    url = os.environ.get("TEST_DATABASE_URL", "")
+    return url if url.startswith("postgresql") else None
+
+@pytest.fixture(scope="session")
+def postgres_app():
+    """App on the TEST_DATABASE_URL PostgreSQL database; skips when none is configured."""
+    if not _postgres_url():
+        pytest.skip("TEST_DATABASE_URL does not point at PostgreSQL")
+    from app import create_app
+    return create_app("testing")
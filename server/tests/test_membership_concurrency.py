@@ -0,0 +1,42 @@
+"""
+Concurrent join-request decisions against a shared PostgreSQL database.
+
+    cd server && TEST_DATABASE_URL=postgresql://... python -m pytest tests
+
+Skipped unless TEST_DATABASE_URL points at PostgreSQL: SQLite lets one writer in at a
+time, so its row locks and ON CONFLICT inserts never contend. Run the migrations on that
+database first; users and clubs made by the tests are left in place.
+"""
+from app.extensions import db
+from app.models.club_membership import ClubMembership
+from app.models.club_request import ClubRequest
+from benchmarks.membership_concurrency import accept_all, check, decide_all, setup
+
+APPLICANTS = 16
+
+def test_concurrent_accepts_keep_every_member(postgres_app):
+    club_id, owner_id, requests = setup(postgres_app, APPLICANTS)
+
+    errors = accept_all(postgres_app, owner_id, list(requests), repeat=3)
+
+    assert check(postgres_app, club_id, requests, errors) == []
+
+def test_conflicting_decisions_apply_only_the_first(postgres_app):
+    club_id, owner_id, requests = setup(postgres_app, APPLICANTS)
+
+    outcomes = decide_all(postgres_app, owner_id, [
+        (request_id, status) for request_id in requests for status in ("accepted", "rejected")
+    ])
+
+    with postgres_app.app_context():
+        for request_id, (user_id, _) in requests.items():
+            results = {status: error for rid, status, error in outcomes if rid == request_id}
+            winners = [status for status, error in results.items() if error is None]
+            assert len(winners) == 1, results
+
+            loser = "rejected" if winners[0] == "accepted" else "accepted"
+            assert results[loser] == f"Request already {winners[0]}"
+            assert db.session.get(ClubRequest, request_id).status == winners[0]
+
+            memberships = ClubMembership.query.filter_by(club_id=club_id, user_id=user_id).count()
+            assert memberships == (1 if winners[0] == "accepted" else 0)